@@ -81,6 +81,7 @@ async def list_alerts(
     source_filter: Optional[str] = Query(None, description="Filter by source system"),
     search: Optional[str] = Query(None, description="Search in title, description, or source"),
     include_imported: bool = Query(True, description="Include imported alerts"),
+    tag: Optional[str] = Query(None, description="Filter by tag"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     organization: Organization = Depends(get_user_organization)
@@ -96,7 +97,8 @@ async def list_alerts(
             severity_filter=severity_filter,
             source_filter=source_filter,
             search_term=search,
-            include_imported=include_imported
+            include_imported=include_imported,
+            tag_filter=tag
         )
 
         # Convert to summary format
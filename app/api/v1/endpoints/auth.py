@@ -9,7 +9,7 @@ from jose import JWTError
 
 from app.db.database import get_db
 from app.auth.security import Hasher, create_access_token, create_refresh_token, decode_token
-from app.db.crud.user import get_user_by_email, create_user_db
+from app.db.crud.user import get_user_by_email, get_user_credentials_by_email, create_user_db
 from app.db.crud.token import create_refresh_token_db, get_refresh_token_by_hash, revoke_refresh_token_db, add_to_blacklist
 from app.api.v1.schemas.auth import Token, UserCreate, UserLogin
 from app.db.models import User
@@ -69,7 +69,7 @@ async def login_for_access_token(request: Request, form_data: OAuth2PasswordRequ
     ip = get_remote_address(request)
     tracing.info("Login attempt", username=form_data.username, ip=ip)
 
-    user = await get_user_by_email(db, form_data.username)
+    user = await get_user_credentials_by_email(db, form_data.username)
     if not user or not Hasher.verify_password(form_data.password, user.hashed_password):
         tracing.warning("Login failed - invalid credentials", username=form_data.username, ip=ip)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect username or password")
@@ -88,7 +88,7 @@ async def login_via_json(request: Request, user_login: UserLogin, db: AsyncSessi
     ip = get_remote_address(request)
     tracing.info("JSON login attempt", username=user_login.username, ip=ip)
 
-    user = await get_user_by_email(db, user_login.username)
+    user = await get_user_credentials_by_email(db, user_login.username)
     if not user or not Hasher.verify_password(user_login.password, user.hashed_password):
         tracing.warning("JSON login failed - invalid credentials", username=user_login.username, ip=ip)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect username or password")
@@ -128,8 +128,9 @@ async def refresh_access_token(request: Request, refresh_token: str = Form(...),
         tracing.warning("Refresh token not found", user_id=user_id, ip=ip)
         raise credentials_exception
 
-    user = await get_user_by_email(db, payload.get("sub"))
-    if not user or not user.is_active:
+    # The token's owner is joined into the lookup; it must still match the JWT subject
+    user = token_record.user
+    if not user or user.email != payload.get("sub") or not user.is_active:
         tracing.warning("Refresh token - inactive user", username=payload.get("sub"), ip=ip)
         raise credentials_exception
 
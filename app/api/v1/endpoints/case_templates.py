@@ -23,7 +23,8 @@ from app.db.crud.case_template import (
     update_task_template,
     delete_task_template
 )
-from app.db.crud.organization import verify_organization_access, get_organization_by_uuid
+from app.db.crud.organization import verify_organization_access
+from app.db.loaders import OrganizationLoader, get_organization_loader
 from app.db.crud.user import get_user_by_email
 from app.api.v1.schemas.case_templates import (
     CaseTemplateResponse,
@@ -61,12 +62,13 @@ async def list_case_templates(
     search: Optional[str] = Query(None, description="Search templates by name or description"),
     pagination: PaginationParams = Depends(get_pagination),
     db: AsyncSession = Depends(get_db),
+    org_loader: OrganizationLoader = Depends(get_organization_loader),
     current_user: User = Depends(get_current_user)
 ):
     """List case templates for an organization"""
     
     # Verify organization access
-    org = await get_organization_by_uuid(db, organization_id)
+    org = await org_loader.load(organization_id)
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
     
@@ -109,12 +111,13 @@ async def create_new_case_template(
     organization_id: UUID,
     template_data: CaseTemplateCreate,
     db: AsyncSession = Depends(get_db),
+    org_loader: OrganizationLoader = Depends(get_organization_loader),
     current_user: User = Depends(get_current_user)
 ):
     """Create a new case template"""
     
     # Verify organization access and permissions
-    org = await get_organization_by_uuid(db, organization_id)
+    org = await org_loader.load(organization_id)
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
     
@@ -306,12 +309,13 @@ async def get_template_usage_statistics(
     organization_id: UUID,
     days_back: int = Query(30, ge=1, le=365, description="Days to look back for statistics"),
     db: AsyncSession = Depends(get_db),
+    org_loader: OrganizationLoader = Depends(get_organization_loader),
     current_user: User = Depends(get_current_user)
 ):
     """Get template usage statistics"""
     
     # Verify organization access
-    org = await get_organization_by_uuid(db, organization_id)
+    org = await org_loader.load(organization_id)
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
     
@@ -344,12 +348,13 @@ async def bulk_template_operations(
     organization_id: UUID,
     operation: BulkTemplateOperation,
     db: AsyncSession = Depends(get_db),
+    org_loader: OrganizationLoader = Depends(get_organization_loader),
     current_user: User = Depends(get_current_user)
 ):
     """Perform bulk operations on templates"""
     
     # Verify organization access and permissions
-    org = await get_organization_by_uuid(db, organization_id)
+    org = await org_loader.load(organization_id)
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
     
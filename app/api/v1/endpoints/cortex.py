@@ -8,17 +8,19 @@ import time
 from datetime import datetime
 
 from app.db.database import get_db
+from app.db.loaders import JobLoader, get_job_loader
 from app.db.crud.cortex import (
     get_cortex_instance_by_uuid,
-    get_cortex_instances,
+    get_cortex_instance_id,
+    get_cortex_instance_row,
+    get_cortex_instances_rows,
     create_cortex_instance,
     update_cortex_instance,
     delete_cortex_instance,
     get_analyzer_by_uuid,
-    get_analyzers_by_instance,
+    get_analyzers_by_instance_rows,
     get_responder_by_uuid,
-    get_responders_by_instance,
-    get_job_by_uuid,
+    get_responders_by_instance_rows,
     get_jobs,
     create_cortex_job,
     update_cortex_job,
@@ -52,7 +54,9 @@ from app.core.pagination import (
     PaginatedResponse,
     PaginationParams,
     get_pagination,
-    AutoPaginator
+    AutoPaginator,
+    encode_cursor,
+    decode_cursor
 )
 from app.integrations.cortex_client import cortex_manager, CortexError
 
@@ -76,28 +80,15 @@ async def list_cortex_instances(
     if current_user.role not in [UserRole.ADMIN]:
         raise HTTPException(status_code=403, detail="Insufficient permissions")
 
-    instances = await get_cortex_instances(
+    # Statistics are counted in SQL alongside the columns the response needs
+    instances = await get_cortex_instances_rows(
         db=db,
         skip=pagination.skip,
         limit=pagination.limit,
         enabled_only=enabled_only
     )
 
-    # Convert to response format with statistics
-    instance_responses = []
-    for instance in instances:
-        analyzer_count = len([a for a in instance.analyzers if a.enabled])
-        responder_count = len([r for r in instance.responders if r.enabled])
-        active_jobs = len([j for j in instance.jobs if j.status in [JobStatus.WAITING, JobStatus.IN_PROGRESS]])
-        
-        instance_responses.append(
-            CortexInstanceResponse.from_model(
-                instance, 
-                analyzer_count=analyzer_count,
-                responder_count=responder_count,
-                active_jobs=active_jobs
-            )
-        )
+    instance_responses = [CortexInstanceResponse.from_row(instance) for instance in instances]
 
     paginator = AutoPaginator(
         data=instance_responses,
@@ -130,6 +121,7 @@ async def create_cortex_instance_endpoint(
     try:
         # Encrypt API key before storing (simplified - should use proper encryption)
         instance = await create_cortex_instance(db, instance_data)
+        await db.commit()
         
         # Add to cortex manager
         cortex_manager.add_instance(instance)
@@ -162,25 +154,16 @@ async def get_cortex_instance(
     if current_user.role not in [UserRole.ADMIN]:
         raise HTTPException(status_code=403, detail="Insufficient permissions")
 
-    instance = await get_cortex_instance_by_uuid(db, instance_id)
+    # Statistics are aggregated by the database in the same query
+    instance = await get_cortex_instance_row(db, instance_id)
     if not instance:
         raise HTTPException(status_code=404, detail="Cortex instance not found")
 
-    # Calculate statistics
-    analyzer_count = len([a for a in instance.analyzers if a.enabled])
-    responder_count = len([r for r in instance.responders if r.enabled])
-    active_jobs = len([j for j in instance.jobs if j.status in [JobStatus.WAITING, JobStatus.IN_PROGRESS]])
-
     tracing.info("Cortex instance retrieved",
                  instance_id=str(instance_id),
                  user_id=current_user.id)
 
-    return CortexInstanceResponse.from_model(
-        instance,
-        analyzer_count=analyzer_count,
-        responder_count=responder_count,
-        active_jobs=active_jobs
-    )
+    return CortexInstanceResponse.from_row(instance)
 
 
 @router.put("/instances/{instance_id}", response_model=CortexInstanceResponse)
@@ -204,6 +187,7 @@ async def update_cortex_instance_endpoint(
 
     try:
         updated_instance = await update_cortex_instance(db, instance, updates)
+        await db.commit()
         
         # Update cortex manager
         cortex_manager.remove_instance(instance.name)
@@ -215,6 +199,8 @@ async def update_cortex_instance_endpoint(
 
         return CortexInstanceResponse.from_model(updated_instance)
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         tracing.error(f"Failed to update Cortex instance: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -240,6 +226,7 @@ async def delete_cortex_instance_endpoint(
 
     try:
         await delete_cortex_instance(db, instance)
+        await db.commit()
         
         # Remove from cortex manager
         cortex_manager.remove_instance(instance.name)
@@ -271,18 +258,18 @@ async def list_analyzers(
     if current_user.role not in [UserRole.ADMIN, UserRole.ORG_ADMIN, UserRole.ANALYST]:
         raise HTTPException(status_code=403, detail="Insufficient permissions")
 
-    instance = await get_cortex_instance_by_uuid(db, instance_id)
-    if not instance:
+    instance_pk = await get_cortex_instance_id(db, instance_id)
+    if instance_pk is None:
         raise HTTPException(status_code=404, detail="Cortex instance not found")
 
-    analyzers = await get_analyzers_by_instance(
+    analyzers = await get_analyzers_by_instance_rows(
         db=db,
-        instance_id=instance.id,
+        instance_id=instance_pk,
         enabled_only=enabled_only,
         data_type=data_type
     )
 
-    analyzer_responses = [CortexAnalyzerResponse.from_model(analyzer) for analyzer in analyzers]
+    analyzer_responses = [CortexAnalyzerResponse.from_row(analyzer) for analyzer in analyzers]
 
     tracing.info("Analyzers listed",
                  instance_id=str(instance_id),
@@ -310,18 +297,18 @@ async def list_responders(
     if current_user.role not in [UserRole.ADMIN, UserRole.ORG_ADMIN, UserRole.ANALYST]:
         raise HTTPException(status_code=403, detail="Insufficient permissions")
 
-    instance = await get_cortex_instance_by_uuid(db, instance_id)
-    if not instance:
+    instance_pk = await get_cortex_instance_id(db, instance_id)
+    if instance_pk is None:
         raise HTTPException(status_code=404, detail="Cortex instance not found")
 
-    responders = await get_responders_by_instance(
+    responders = await get_responders_by_instance_rows(
         db=db,
-        instance_id=instance.id,
+        instance_id=instance_pk,
         enabled_only=enabled_only,
         data_type=data_type
     )
 
-    responder_responses = [CortexResponderResponse.from_model(responder) for responder in responders]
+    responder_responses = [CortexResponderResponse.from_row(responder) for responder in responders]
 
     tracing.info("Responders listed",
                  instance_id=str(instance_id),
@@ -340,6 +327,7 @@ async def list_jobs(
     status_filter: Optional[JobStatus] = Query(None, description="Filter by job status"),
     observable_id: Optional[UUID] = Query(None, description="Filter by observable"),
     case_id: Optional[UUID] = Query(None, description="Filter by case"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     pagination: PaginationParams = Depends(get_pagination),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -350,12 +338,21 @@ async def list_jobs(
     if current_user.role not in [UserRole.ADMIN, UserRole.ORG_ADMIN, UserRole.ANALYST]:
         raise HTTPException(status_code=403, detail="Insufficient permissions")
 
+    before_created_at = before_id = None
+    if cursor:
+        try:
+            before_created_at, before_id = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
     jobs = await get_jobs(
         db=db,
         skip=pagination.skip,
         limit=pagination.limit,
         status_filter=status_filter,
-        user_id=current_user.id if current_user.role == UserRole.ANALYST else None
+        user_id=current_user.id if current_user.role == UserRole.ANALYST else None,
+        before_created_at=before_created_at,
+        before_id=before_id
     )
 
     job_responses = [CortexJobResponse.from_model(job) for job in jobs]
@@ -371,7 +368,10 @@ async def list_jobs(
                  count=len(job_responses),
                  user_id=current_user.id)
 
-    return paginator.get_response()
+    response = paginator.get_response()
+    if jobs:
+        response.next_cursor = encode_cursor(jobs[-1].created_at, jobs[-1].id)
+    return response
 
 
 @router.get("/jobs/{job_id}", response_model=CortexJobResponse)
@@ -379,12 +379,12 @@ async def list_jobs(
 async def get_cortex_job(
     request: Request,
     job_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    job_loader: JobLoader = Depends(get_job_loader),
     current_user: User = Depends(get_current_user)
 ):
     """Get specific Cortex job"""
     
-    job = await get_job_by_uuid(db, job_id)
+    job = await job_loader.load(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Cortex job not found")
 
@@ -449,6 +449,7 @@ async def run_analysis(
             created_by_id=current_user.id,
             analyzer_id=analyzer.id
         )
+        await db.commit()
 
         # Queue analysis in background
         background_tasks.add_task(
@@ -525,7 +526,8 @@ async def sync_cortex_workers(
         start_time = time.time()
         
         # Sync workers
-        stats = await cortex_manager.sync_workers(instance)
+        stats = await cortex_manager.sync_workers(instance, db=db)
+        await db.commit()
         
         duration = time.time() - start_time
 
@@ -15,7 +15,7 @@ from app.api.v1.schemas.observables import (
     SimilarObservable, ObservableSearchRequest, ObservableEnrichmentResponse
 )
 from app.auth.dependencies import get_current_user, get_user_organization
-from app.core.pagination import PaginationParams, PaginatedResponse
+from app.core.pagination import PaginationParams, PaginatedResponse, encode_cursor, decode_cursor
 
 router = APIRouter()
 
@@ -53,7 +53,8 @@ async def create_observable(
             db=db,
             observable_data=observable_data,
             case_id=internal_case_id,
-            creator_id=current_user.id
+            creator_id=current_user.id,
+            organization_id=organization.id
         )
 
         return ObservableResponse.from_model(observable)
@@ -74,11 +75,17 @@ async def list_organization_observables(
     data_type_filter: Optional[ObservableType] = Query(None, description="Filter by observable type"),
     is_ioc_filter: Optional[bool] = Query(None, description="Filter by IOC status"),
     search: Optional[str] = Query(None, description="Search in data, message, or source"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     organization: Organization = Depends(get_user_organization)
 ):
     """List observables across the organization"""
+    try:
+        before_created_at, before_id = decode_cursor(cursor) if cursor else (None, None)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     try:
         observables = await crud.observable.get_global_observables(
             db=db,
@@ -87,7 +94,9 @@ async def list_organization_observables(
             limit=pagination.limit,
             data_type_filter=data_type_filter,
             is_ioc_filter=is_ioc_filter,
-            search_term=search
+            search_term=search,
+            before_created_at=before_created_at,
+            before_id=before_id
         )
 
         # Convert to summary format
@@ -98,7 +107,8 @@ async def list_organization_observables(
             total=len(observable_summaries),  # TODO: Add proper count query
             page=pagination.page,
             per_page=pagination.limit,
-            pages=(len(observable_summaries) + pagination.limit - 1) // pagination.limit
+            pages=(len(observable_summaries) + pagination.limit - 1) // pagination.limit,
+            next_cursor=encode_cursor(observables[-1].created_at, observables[-1].id) if observables else None
         )
 
     except Exception as e:
@@ -116,11 +126,17 @@ async def list_case_observables(
     data_type_filter: Optional[ObservableType] = Query(None, description="Filter by observable type"),
     is_ioc_filter: Optional[bool] = Query(None, description="Filter by IOC status"),
     search: Optional[str] = Query(None, description="Search in data, message, or source"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     organization: Organization = Depends(get_user_organization)
 ):
     """List observables for a specific case"""
+    try:
+        before_created_at, before_id = decode_cursor(cursor) if cursor else (None, None)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     try:
         # Get the case and verify access
         case = await crud.case.get_case_by_uuid(db, case_id)
@@ -145,7 +161,9 @@ async def list_case_observables(
             limit=pagination.limit,
             data_type_filter=data_type_filter,
             is_ioc_filter=is_ioc_filter,
-            search_term=search
+            search_term=search,
+            before_created_at=before_created_at,
+            before_id=before_id
         )
 
         # Convert to summary format
@@ -156,7 +174,8 @@ async def list_case_observables(
             total=len(observable_summaries),
             page=pagination.page,
             per_page=pagination.limit,
-            pages=(len(observable_summaries) + pagination.limit - 1) // pagination.limit
+            pages=(len(observable_summaries) + pagination.limit - 1) // pagination.limit,
+            next_cursor=encode_cursor(observables[-1].created_at, observables[-1].id) if observables else None
         )
 
     except HTTPException:
@@ -383,16 +402,12 @@ async def search_observables(
             db=db,
             search_data=search_request.search_term,
             organization_id=organization.id,
-            exact_match=search_request.exact_match
+            exact_match=search_request.exact_match,
+            data_type_filter=search_request.data_type_filter,
+            is_ioc_filter=search_request.is_ioc_filter,
+            limit=search_request.limit
         )
 
-        # Apply additional filters if provided
-        if search_request.data_type_filter:
-            observables = [obs for obs in observables if obs.data_type == search_request.data_type_filter]
-
-        if search_request.is_ioc_filter is not None:
-            observables = [obs for obs in observables if obs.is_ioc == search_request.is_ioc_filter]
-
         return [ObservableResponse.from_model(obs) for obs in observables]
 
     except Exception as e:
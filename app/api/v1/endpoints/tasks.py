@@ -347,28 +347,15 @@ async def delete_task(
 ):
     """Delete a task"""
     try:
-        task = await crud.task.get_task_by_uuid(db, task_id)
-        if not task:
+        # Single DELETE scoped to the organization's cases; tasks of other
+        # organizations are indistinguishable from missing ones
+        deleted_id = await crud.task.delete_task_by_uuid(db, task_id, organization.id)
+        if deleted_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Task not found"
             )
 
-        # Check organization access through case
-        if task.case.organization_id != organization.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied to this task"
-            )
-
-        # Delete the task
-        success = await crud.task.delete_task(db, task)
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to delete task"
-            )
-
     except HTTPException:
         raise
     except Exception as e:
@@ -3,6 +3,7 @@ from pydantic import BaseModel, Field, UUID4, validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
+from app.db.models.enums import Severity, TLP
 
 
 class AlertStatus(str, Enum):
@@ -13,22 +14,6 @@ class AlertStatus(str, Enum):
     IGNORED = "ignored"
 
 
-class Severity(str, Enum):
-    """Severity enumeration"""
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    CRITICAL = "critical"
-
-
-class TLP(str, Enum):
-    """Traffic Light Protocol levels"""
-    WHITE = "white"
-    GREEN = "green"
-    AMBER = "amber"
-    RED = "red"
-
-
 class AlertObservable(BaseModel):
     """Embedded observable data in alerts"""
     data_type: str = Field(..., description="Type of observable")
@@ -160,7 +145,7 @@ class AlertSummary(BaseModel):
             source_ref=alert.source_ref,
             severity=alert.severity.value,
             status=alert.status.value,
-            observable_count=len(alert.observables or []),
+            observable_count=alert.observable_count or 0,
             created_at=alert.created_at,
             imported_at=alert.imported_at
         )
@@ -2,44 +2,10 @@
 from pydantic import BaseModel, Field, UUID4, validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from enum import Enum
+from app.db.models.enums import Severity, TLP, CaseStatus, ResolutionStatus, ImpactStatus
 
 
 # Import enums (or redefine if needed)
-class Severity(str, Enum):
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    CRITICAL = "critical"
-
-
-class TLP(str, Enum):
-    WHITE = "white"
-    GREEN = "green"
-    AMBER = "amber"
-    RED = "red"
-
-
-class CaseStatus(str, Enum):
-    OPEN = "Open"
-    RESOLVED = "Resolved"
-    DUPLICATED = "Duplicated"
-
-
-class ResolutionStatus(str, Enum):
-    INDETERMINATE = "Indeterminate"
-    FALSE_POSITIVE = "FalsePositive"
-    TRUE_POSITIVE = "TruePositive"
-    OTHER = "Other"
-    DUPLICATED = "Duplicated"
-
-
-class ImpactStatus(str, Enum):
-    NO_IMPACT = "NoImpact"
-    WITH_IMPACT = "WithImpact"
-    NOT_APPLICABLE = "NotApplicable"
-
-
 class CaseBase(BaseModel):
     """Base schema for case"""
     title: str = Field(..., min_length=1, max_length=500, description="Case title")
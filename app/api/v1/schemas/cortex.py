@@ -78,6 +78,11 @@ class CortexInstanceResponse(CortexInstanceBase):
             active_jobs=active_jobs
         )
 
+    @classmethod
+    def from_row(cls, row):
+        """Convert a get_cortex_instances_rows mapping to API response"""
+        return cls(id=row["uuid"], **{k: v for k, v in row.items() if k != "uuid"})
+
     class Config:
         from_attributes = True
 
@@ -129,6 +134,29 @@ class CortexAnalyzerResponse(CortexWorkerBase):
             updated_at=analyzer.updated_at
         )
 
+    @classmethod
+    def from_row(cls, row):
+        """Convert a analyzer column mapping to API response"""
+        return cls(
+            id=row["uuid"],
+            name=row["name"],
+            display_name=row["display_name"],
+            version=row["version"],
+            description=row["description"],
+            data_types=row["data_types"],
+            max_tlp=row["max_tlp"],
+            max_pap=row["max_pap"],
+            enabled=row["enabled"],
+            configuration=row["configuration"],
+            cortex_instance_id=row["cortex_instance_uuid"],
+            cortex_instance_name=row["cortex_instance_name"],
+            rate_limit=row["rate_limit"],
+            is_available=row["is_available"],
+            last_sync=row["last_sync"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"]
+        )
+
     class Config:
         from_attributes = True
 
@@ -165,6 +193,28 @@ class CortexResponderResponse(CortexWorkerBase):
             updated_at=responder.updated_at
         )
 
+    @classmethod
+    def from_row(cls, row):
+        """Convert a responder column mapping to API response"""
+        return cls(
+            id=row["uuid"],
+            name=row["name"],
+            display_name=row["display_name"],
+            version=row["version"],
+            description=row["description"],
+            data_types=row["data_types"],
+            max_tlp=row["max_tlp"],
+            max_pap=row["max_pap"],
+            enabled=row["enabled"],
+            configuration=row["configuration"],
+            cortex_instance_id=row["cortex_instance_uuid"],
+            cortex_instance_name=row["cortex_instance_name"],
+            is_available=row["is_available"],
+            last_sync=row["last_sync"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"]
+        )
+
     class Config:
         from_attributes = True
 
@@ -239,8 +289,8 @@ class CortexJobResponse(CortexJobBase):
             started_at=job.started_at,
             ended_at=job.ended_at,
             duration=job.duration,
-            report=job.report,
-            artifacts=job.artifacts,
+            report=job.job_report.report if job.job_report else None,
+            artifacts=job.job_report.artifacts if job.job_report else [],
             cortex_instance_id=job.cortex_instance.uuid,
             cortex_instance_name=job.cortex_instance.name,
             analyzer_id=job.analyzer.uuid if job.analyzer else None,
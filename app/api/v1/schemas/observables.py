@@ -3,6 +3,7 @@ from pydantic import BaseModel, Field, UUID4, validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
+from app.db.models.enums import TLP
 
 
 class ObservableType(str, Enum):
@@ -22,14 +23,6 @@ class ObservableType(str, Enum):
     OTHER = "other"
 
 
-class TLP(str, Enum):
-    """Traffic Light Protocol levels"""
-    WHITE = "white"
-    GREEN = "green"
-    AMBER = "amber"
-    RED = "red"
-
-
 class ObservableBase(BaseModel):
     """Base schema for observable"""
     data_type: ObservableType = Field(..., description="Type of observable data")
@@ -141,7 +134,7 @@ class ObservableSummary(BaseModel):
 
     @classmethod
     def from_model(cls, observable):
-        """Convert Observable model to summary"""
+        """Convert an Observable model or observable list row to summary"""
         return cls(
             id=observable.uuid,
             data_type=observable.data_type.value,
@@ -240,6 +233,7 @@ class ObservableSearchRequest(BaseModel):
     exact_match: bool = Field(False, description="Whether to perform exact match")
     data_type_filter: Optional[ObservableType] = Field(None, description="Filter by data type")
     is_ioc_filter: Optional[bool] = Field(None, description="Filter by IOC status")
+    limit: int = Field(100, ge=1, le=1000, description="Maximum number of results")
 
 
 class ObservableEnrichmentResponse(BaseModel):
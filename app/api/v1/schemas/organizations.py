@@ -2,17 +2,10 @@
 from pydantic import BaseModel, Field, UUID4
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from enum import Enum
+from app.db.models.enums import UserRole
 
 
 # Import the UserRole enum (or redefine it here)
-class UserRole(str, Enum):
-    ADMIN = "admin"
-    ORG_ADMIN = "org_admin"
-    ANALYST = "analyst"
-    READ_ONLY = "read_only"
-
-
 class OrganizationBase(BaseModel):
     """Base schema for organization"""
     name: str = Field(..., min_length=1, max_length=255, description="Organization name")
@@ -2,14 +2,7 @@
 from pydantic import BaseModel, Field, UUID4, validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from enum import Enum
-
-
-class TaskStatus(str, Enum):
-    WAITING = "Waiting"
-    IN_PROGRESS = "InProgress"
-    COMPLETED = "Completed"
-    CANCEL = "Cancel"
+from app.db.models.enums import TaskStatus
 
 
 class TaskBase(BaseModel):
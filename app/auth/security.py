@@ -1,4 +1,6 @@
 # app/auth/security.py
+import hashlib
+import hmac
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -38,16 +40,24 @@ class Hasher:
     def hash_refresh_token(token: str) -> str:
         """
         Hashes a refresh token before storing it in the database.
-        Using bcrypt for refresh token hashing as well for consistency and security.
+        Refresh tokens are high-entropy signed JWTs, not passwords, so a keyed
+        HMAC-SHA256 is sufficient; being deterministic, the digest can also be
+        looked up directly (a salted bcrypt hash never matches on lookup).
         """
-        return pwd_context.hash(token)
+        return hmac.new(_refresh_token_key(), token.encode(), hashlib.sha256).hexdigest()
 
     @staticmethod
     def verify_refresh_token(plain_token: str, hashed_token: str) -> bool:
         """
         Verifies a plain refresh token against its hashed version.
         """
-        return pwd_context.verify(plain_token, hashed_token)
+        return hmac.compare_digest(Hasher.hash_refresh_token(plain_token), hashed_token)
+
+
+def _refresh_token_key() -> bytes:
+    """HMAC key for refresh token digests: the dedicated pepper, else the JWT secret"""
+    key = settings.REFRESH_TOKEN_PEPPER or settings.JWT_SECRET_KEY
+    return key.get_secret_value().encode()
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -83,8 +93,10 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None)
     else:
         expire = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
 
-    # It's good practice to add a type to distinguish between access and refresh tokens
-    to_encode.update({"exp": expire, "type": "refresh"})
+    # It's good practice to add a type to distinguish between access and refresh tokens.
+    # The random jti keeps tokens issued within the same second (and so their
+    # deterministic token_hash) unique.
+    to_encode.update({"exp": expire, "jti": str(uuid.uuid4()), "type": "refresh"})
 
     encoded_jwt = jwt.encode(
         to_encode, settings.JWT_SECRET_KEY.get_secret_value(), algorithm=settings.ALGORITHM
@@ -1,7 +1,7 @@
 # app/core/config.py - Clean OpenTelemetry-optimized configuration
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, SecretStr
-from typing import List
+from typing import List, Optional
 
 class Settings(BaseSettings):
     """
@@ -17,6 +17,18 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    REFRESH_TOKEN_PEPPER: Optional[SecretStr] = Field(
+        None,
+        description="HMAC key for stored refresh token digests (defaults to JWT_SECRET_KEY)"
+    )
+    JTI_BLACKLIST_CACHE_TTL: int = Field(
+        60,
+        description="Seconds a not-blacklisted jti is cached per worker, and the blacklist filter rebuild interval (logouts reach other workers via LISTEN/NOTIFY; 0 disables both)"
+    )
+    JTI_BLOOM_CAPACITY: int = Field(
+        100_000,
+        description="Live blacklisted jtis the per-worker bloom filter is sized for (0 disables the filter)"
+    )
 
     # Application Settings
     ENVIRONMENT: str = Field("development", description="Environment name")
@@ -44,7 +56,23 @@ class Settings(BaseSettings):
 
     # Performance Settings
     DB_POOL_SIZE: int = Field(20, description="Database connection pool size")
-    DB_MAX_OVERFLOW: int = Field(0, description="Database max overflow connections")
+    DB_MAX_OVERFLOW: int = Field(10, description="Database max overflow connections")
+    DB_POOL_PRE_PING: bool = Field(False, description="Ping connections on checkout (off: rely on recycle and TCP keepalives)")
+    DB_POOL_RECYCLE: int = Field(1800, description="Recycle pooled connections older than this many seconds")
+    DB_POOL_TIMEOUT: int = Field(5, description="Seconds to wait for a pooled connection before failing")
+    DB_POOL_PREWARM: bool = Field(True, description="Open pool_size connections at startup")
+    DB_POOL_MONITOR: bool = Field(True, description="Export pool load and p95 query latency gauges")
+    DB_POOL_MONITOR_INTERVAL: float = Field(5.0, description="Seconds between pool load samples")
+    DB_STATEMENT_CACHE_SIZE: int = Field(
+        500,
+        description="Prepared statements cached per connection (set 0 behind pgbouncer in transaction mode)"
+    )
+    DB_QUERY_CACHE_SIZE: int = Field(1200, description="Compiled SQL statements kept in the engine's LRU cache")
+    BULK_BATCH_SIZE: int = Field(1000, description="Max keys per IN (...) list in bulk update statements")
+    ORM_RAISELOAD: bool = Field(
+        False,
+        description="Raise on unplanned lazy loads in list queries (enable in development/testing)"
+    )
 
     @property
     def cors_origins_list(self) -> List[str]:
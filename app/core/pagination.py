@@ -2,7 +2,10 @@
 """
 Automatic pagination system that works as a base for all list endpoints
 """
-from typing import TypeVar, Generic, List, Optional, Dict, Any, Type
+import base64
+import json
+from datetime import datetime
+from typing import TypeVar, Generic, List, Optional, Dict, Any, Type, Tuple
 from pydantic import BaseModel, Field, computed_field
 from sqlalchemy import select, func, Select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -40,11 +43,28 @@ class PaginatedResponse(BaseModel, Generic[T]):
     has_next: bool
     has_prev: bool
     links: Optional[Dict[str, Optional[str]]] = None
+    next_cursor: Optional[str] = None
 
     class Config:
         from_attributes = True
 
 
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor string"""
+    raw = json.dumps([created_at.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by encode_cursor, raising ValueError if malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
 class AutoPaginator:
     """
     Automatic paginator that can be used as a base for all list endpoints
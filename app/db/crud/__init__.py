@@ -1,14 +1,18 @@
 """CRUD operations for database models"""
 from .user import (
     get_user_by_email,
+    get_user_credentials_by_email,
     get_user_by_id,
+    get_users_by_ids,
     create_user_db,
     update_user_db,
     delete_user_db,
     get_user_count,
     get_active_user_count,
+    get_user_counts,
     search_users_by_email,
-    is_user_in_organization
+    is_user_in_organization,
+    users_in_organization
 )
 from .token import (
     create_refresh_token_db,
@@ -21,14 +25,13 @@ from .token import (
     cleanup_expired_tokens
 )
 from .organization import (
-    get_organization_by_id,
     get_organization_by_uuid,
+    get_organization_by_name,
     create_organization,
     update_organization,
-    delete_organization,
     get_user_organizations,
-    add_user_to_organization,
-    remove_user_from_organization
+    add_organization_member,
+    remove_organization_member
 )
 from . import case
 from . import task
@@ -38,13 +41,18 @@ from . import alert
 __all__ = [
     # User CRUD
     "get_user_by_email",
+    "get_user_credentials_by_email",
     "get_user_by_id",
+    "get_users_by_ids",
     "create_user_db",
     "update_user_db",
     "delete_user_db",
     "get_user_count",
     "get_active_user_count",
+    "get_user_counts",
     "search_users_by_email",
+    "is_user_in_organization",
+    "users_in_organization",
     # Token CRUD
     "create_refresh_token_db",
     "get_refresh_token_by_hash",
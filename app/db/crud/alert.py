@@ -2,7 +2,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy import func, and_, or_
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, load_only
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 from datetime import datetime, timezone
@@ -12,6 +12,12 @@ from app.db.models import Alert, Case, User, Organization
 from app.db.models.enums import AlertStatus, Severity, TLP
 from app.api.v1.schemas.alerts import AlertCreate, AlertUpdate
 
+# Columns AlertSummary reads; list queries skip the raw_data/observables JSONB payloads
+_ALERT_SUMMARY_COLUMNS = load_only(
+    Alert.uuid, Alert.title, Alert.source, Alert.source_ref, Alert.severity,
+    Alert.status, Alert.observable_count, Alert.created_at, Alert.imported_at
+)
+
 
 async def get_alert_by_uuid(db: AsyncSession, alert_uuid: UUID) -> Optional[Alert]:
     """Get alert by UUID with relationships loaded"""
@@ -59,9 +65,10 @@ async def get_organization_alerts(
         severity_filter: Optional[Severity] = None,
         source_filter: Optional[str] = None,
         search_term: Optional[str] = None,
-        include_imported: bool = True
+        include_imported: bool = True,
+        tag_filter: Optional[str] = None
 ) -> List[Alert]:
-    """Get alerts for an organization with filters"""
+    """Get alert summaries for an organization with filters"""
     try:
         query = select(Alert).filter(Alert.organization_id == organization_id)
 
@@ -78,6 +85,10 @@ async def get_organization_alerts(
         if not include_imported:
             query = query.filter(Alert.case_id.is_(None))
 
+        if tag_filter:
+            # tags @> '["tag"]' is answered by idx_alert_tags_gin
+            query = query.filter(Alert.tags.contains([tag_filter]))
+
         if search_term:
             search_pattern = f"%{search_term}%"
             query = query.filter(
@@ -93,16 +104,10 @@ async def get_organization_alerts(
         query = query.order_by(Alert.created_at.desc())
 
         # Add pagination
-        query = query.offset(skip).limit(limit)
-
-        # Load relationships
-        query = query.options(
-            joinedload(Alert.case),
-            joinedload(Alert.created_by)
-        )
+        query = query.offset(skip).limit(limit).options(_ALERT_SUMMARY_COLUMNS)
 
         result = await db.execute(query)
-        return result.scalars().unique().all()
+        return result.scalars().all()
 
     except Exception as e:
         logger.error(f"Error retrieving organization alerts: {e}")
@@ -210,10 +215,10 @@ async def delete_alert(db: AsyncSession, alert: Alert) -> bool:
 async def promote_alert_to_case(
         db: AsyncSession,
         alert: Alert,
+        creator_id: int,
         case_title: Optional[str] = None,
         case_description: Optional[str] = None,
-        assignee_id: Optional[int] = None,
-        creator_id: int
+        assignee_id: Optional[int] = None
 ) -> Case:
     """Promote an alert to a case"""
     try:
@@ -269,7 +274,8 @@ async def promote_alert_to_case(
                         db=db,
                         observable_data=observable_create,
                         case_id=case.id,
-                        creator_id=creator_id
+                        creator_id=creator_id,
+                        organization_id=case.organization_id
                     )
                 except Exception as obs_error:
                     logger.warning(f"Failed to create observable from alert: {obs_error}")
@@ -380,7 +386,7 @@ async def get_alerts_by_source(
         skip: int = 0,
         limit: int = 50
 ) -> List[Alert]:
-    """Get alerts from a specific source"""
+    """Get alert summaries from a specific source"""
     try:
         query = (
             select(Alert)
@@ -391,15 +397,11 @@ async def get_alerts_by_source(
             .order_by(Alert.created_at.desc())
             .offset(skip)
             .limit(limit)
-        )
-
-        query = query.options(
-            joinedload(Alert.case),
-            joinedload(Alert.created_by)
+            .options(_ALERT_SUMMARY_COLUMNS)
         )
 
         result = await db.execute(query)
-        return result.scalars().unique().all()
+        return result.scalars().all()
 
     except Exception as e:
         logger.error(f"Error getting alerts by source {source}: {e}")
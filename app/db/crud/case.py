@@ -12,6 +12,7 @@ from app.db.models import Case, Organization, User, Task, Observable
 from app.db.models.enums import CaseStatus, Severity, TLP, ResolutionStatus, ImpactStatus
 from app.api.v1.schemas.cases import CaseCreate, CaseUpdate
 from app.core.case_utils import CaseNumberGenerator, CaseStatusTransition
+from app.db.crud.organization import invalidate_organization_stats
 
 
 async def generate_unique_case_number(db: AsyncSession, organization: Organization) -> str:
@@ -118,7 +119,7 @@ async def get_organization_cases(
         )
 
         result = await db.execute(query)
-        return result.scalars().unique().all()
+        return result.scalars().all()
 
     except Exception as e:
         logger.error(f"Error retrieving organization cases: {e}")
@@ -165,6 +166,7 @@ async def create_case(
 
         db.add(case)
         await db.commit()
+        invalidate_organization_stats(organization_id)
         await db.refresh(case)
 
         # Load relationships
@@ -302,7 +304,7 @@ async def get_user_assigned_cases(
         )
 
         result = await db.execute(query)
-        return result.scalars().unique().all()
+        return result.scalars().all()
 
     except Exception as e:
         logger.error(f"Error getting user assigned cases: {e}")
@@ -1,9 +1,10 @@
 # app/db/crud/case_template.py
+import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, or_, exists
 from sqlalchemy.orm import joinedload, selectinload
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable
 from uuid import UUID
 from datetime import datetime, timezone, timedelta
 from loguru import logger
@@ -16,6 +17,12 @@ from app.api.v1.schemas.case_templates import (
     CaseFromTemplateRequest
 )
 from app.core.case_utils import CaseNumberGenerator
+from app.db.database import AsyncSessionLocal
+from app.db.crud.organization import invalidate_organization_stats
+
+# Column names accepted by the update paths, computed once at import
+_CASE_TEMPLATE_COLUMNS = frozenset(CaseTemplate.__mapper__.columns.keys())
+_TASK_TEMPLATE_COLUMNS = frozenset(TaskTemplate.__mapper__.columns.keys())
 
 
 async def get_case_template_by_uuid(db: AsyncSession, template_uuid: UUID) -> Optional[CaseTemplate]:
@@ -32,7 +39,7 @@ async def get_case_template_by_uuid(db: AsyncSession, template_uuid: UUID) -> Op
         )
         return result.scalars().first()
     except Exception as e:
-        logger.error(f"Error retrieving case template by UUID {template_uuid}: {e}")
+        logger.error("Error retrieving case template by UUID {template_uuid}: {error}", template_uuid=template_uuid, error=e)
         return None
 
 
@@ -56,7 +63,7 @@ async def get_case_template_by_name(
         )
         return result.scalars().first()
     except Exception as e:
-        logger.error(f"Error retrieving case template by name {name}: {e}")
+        logger.error("Error retrieving case template by name {name}: {error}", name=name, error=e)
         return None
 
 
@@ -100,13 +107,25 @@ async def get_organization_case_templates(
         )
 
         result = await db.execute(query)
-        return result.scalars().unique().all()
+        return result.scalars().all()
 
     except Exception as e:
-        logger.error(f"Error retrieving organization case templates: {e}")
+        logger.error("Error retrieving organization case templates: {error}", error=e)
         return []
 
 
+async def _get_organization_name(organization_id: int) -> Optional[str]:
+    """Read an organization name on its own pooled connection.
+
+    An AsyncSession cannot multiplex statements, so reads meant to overlap with
+    work on the caller's session need a session of their own.
+    """
+    async with AsyncSessionLocal() as session:
+        return await session.scalar(
+            select(Organization.name).filter(Organization.id == organization_id)
+        )
+
+
 async def create_case_template(
     db: AsyncSession,
     template_data: CaseTemplateCreate,
@@ -162,11 +181,11 @@ async def create_case_template(
         # Load relationships
         await db.refresh(case_template, ["organization", "created_by", "task_templates"])
 
-        logger.info(f"Case template created: {case_template.name} by user {creator_id}")
+        logger.info("Case template created: {name} by user {creator_id}", name=case_template.name, creator_id=creator_id)
         return case_template
 
     except Exception as e:
-        logger.error(f"Failed to create case template: {e}")
+        logger.error("Failed to create case template: {error}", error=e)
         await db.rollback()
         raise
 
@@ -179,12 +198,11 @@ async def update_case_template(
 ) -> CaseTemplate:
     """Update case template details"""
     try:
-        update_data = updates.dict(exclude_unset=True)
+        update_data = updates.model_dump(exclude_unset=True)
 
         # Update fields
-        for field, value in update_data.items():
-            if hasattr(case_template, field):
-                setattr(case_template, field, value)
+        for field in update_data.keys() & _CASE_TEMPLATE_COLUMNS:
+            setattr(case_template, field, update_data[field])
 
         await db.commit()
         await db.refresh(case_template)
@@ -192,11 +210,11 @@ async def update_case_template(
         # Reload relationships
         await db.refresh(case_template, ["organization", "created_by", "task_templates"])
 
-        logger.info(f"Case template {case_template.name} updated by user {editor_id}")
+        logger.info("Case template {name} updated by user {editor_id}", name=case_template.name, editor_id=editor_id)
         return case_template
 
     except Exception as e:
-        logger.error(f"Failed to update case template: {e}")
+        logger.error("Failed to update case template: {error}", error=e)
         await db.rollback()
         raise
 
@@ -204,22 +222,26 @@ async def update_case_template(
 async def delete_case_template(db: AsyncSession, case_template: CaseTemplate) -> bool:
     """Delete a case template"""
     try:
-        # Check if template is being used by any cases
-        cases_using_template = await db.scalar(
-            select(func.count(Case.id)).filter(Case.case_template_id == case_template.id)
+        # Check if template is being used by any cases (EXISTS stops at the first match)
+        in_use = await db.scalar(
+            select(exists().where(Case.case_template_id == case_template.id))
         )
-        
-        if cases_using_template > 0:
+
+        if in_use:
+            # Only count on the rare rejection path, for the error message
+            cases_using_template = await db.scalar(
+                select(func.count(Case.id)).filter(Case.case_template_id == case_template.id)
+            )
             raise ValueError(f"Cannot delete template: {cases_using_template} cases are using this template")
 
         await db.delete(case_template)
         await db.commit()
 
-        logger.info(f"Case template {case_template.name} deleted")
+        logger.info("Case template {name} deleted", name=case_template.name)
         return True
 
     except Exception as e:
-        logger.error(f"Failed to delete case template: {e}")
+        logger.error("Failed to delete case template: {error}", error=e)
         await db.rollback()
         raise
 
@@ -229,34 +251,39 @@ async def create_case_from_template(
     request: CaseFromTemplateRequest,
     organization_id: int,
     creator_id: int,
-    assignee_id: Optional[int] = None
+    assignee_id: Optional[int] = None,
+    return_loaded: Iterable[str] = ("organization", "assignee", "created_by")
 ) -> Case:
-    """Create a case from a template"""
+    """Create a case from a template
+
+    Only the relationships named in ``return_loaded`` are loaded after commit;
+    the defaults cover what ``CaseResponse.from_model`` reads.
+    """
     try:
-        # Get the template
-        template = await get_case_template_by_uuid(db, request.template_id)
+        # Template and organization name are independent reads, run them concurrently
+        template, org_name = await asyncio.gather(
+            get_case_template_by_uuid(db, request.template_id),
+            _get_organization_name(organization_id)
+        )
         if not template:
             raise ValueError("Case template not found")
         
         if template.organization_id != organization_id:
             raise ValueError("Template not accessible to this organization")
 
-        # Get organization for case number generation
-        org_result = await db.execute(
-            select(Organization).filter(Organization.id == organization_id)
-        )
-        organization = org_result.scalars().first()
+        if org_name is None:
+            raise ValueError("Organization not found")
 
         # Generate unique case number
-        case_number = await CaseNumberGenerator.generate_case_number(organization.name)
+        case_number = CaseNumberGenerator.generate_case_number(org_name)
 
         # Build case title with template prefix
         title = request.title
         if template.title_prefix:
             title = f"{template.title_prefix}: {title}"
 
-        # Merge tags from template and request
-        tags = list(set((template.tags or []) + (request.additional_tags or [])))
+        # Merge tags from template and request, keeping first-seen order
+        tags = list(dict.fromkeys((template.tags or []) + (request.additional_tags or [])))
 
         # Merge custom fields
         custom_fields = (template.custom_fields or {}).copy()
@@ -284,7 +311,8 @@ async def create_case_from_template(
 
         # Create tasks from template if requested
         if request.create_tasks and template.task_templates:
-            for task_template in sorted(template.task_templates, key=lambda t: t.order_index):
+            # task_templates is ordered by order_index at the relationship level
+            for task_template in template.task_templates:
                 # Calculate due date if offset is specified
                 due_date = None
                 if task_template.due_days_offset is not None:
@@ -310,16 +338,18 @@ async def create_case_from_template(
         template.usage_count += 1
 
         await db.commit()
+        invalidate_organization_stats(organization_id)
         await db.refresh(case)
 
-        # Load relationships
-        await db.refresh(case, ["organization", "assignee", "created_by", "template", "tasks"])
+        # Load only the relationships the caller needs
+        if return_loaded:
+            await db.refresh(case, list(return_loaded))
 
-        logger.info(f"Case created from template: {case.case_number} from {template.name}")
+        logger.info("Case created from template: {case_number} from {name}", case_number=case.case_number, name=template.name)
         return case
 
     except Exception as e:
-        logger.error(f"Failed to create case from template: {e}")
+        logger.error("Failed to create case from template: {error}", error=e)
         await db.rollback()
         raise
 
@@ -368,7 +398,7 @@ async def get_template_usage_stats(
         return sorted(stats, key=lambda x: x['cases_created'], reverse=True)
 
     except Exception as e:
-        logger.error(f"Error getting template usage stats: {e}")
+        logger.error("Error getting template usage stats: {error}", error=e)
         return []
 
 
@@ -424,11 +454,11 @@ async def bulk_template_operation(
 
         await db.commit()
         
-        logger.info(f"Bulk template operation '{operation}' completed by user {operator_id}")
+        logger.info("Bulk template operation '{operation}' completed by user {operator_id}", operation=operation, operator_id=operator_id)
         return results
 
     except Exception as e:
-        logger.error(f"Failed bulk template operation: {e}")
+        logger.error("Failed bulk template operation: {error}", error=e)
         await db.rollback()
         raise
 
@@ -448,7 +478,7 @@ async def get_task_template_by_uuid(db: AsyncSession, task_template_uuid: UUID)
         )
         return result.scalars().first()
     except Exception as e:
-        logger.error(f"Error retrieving task template by UUID {task_template_uuid}: {e}")
+        logger.error("Error retrieving task template by UUID {task_template_uuid}: {error}", task_template_uuid=task_template_uuid, error=e)
         return None
 
 
@@ -480,11 +510,11 @@ async def create_task_template(
         # Load relationships
         await db.refresh(task_template, ["case_template", "created_by"])
 
-        logger.info(f"Task template created: {task_template.title}")
+        logger.info("Task template created: {title}", title=task_template.title)
         return task_template
 
     except Exception as e:
-        logger.error(f"Failed to create task template: {e}")
+        logger.error("Failed to create task template: {error}", error=e)
         await db.rollback()
         raise
 
@@ -497,21 +527,20 @@ async def update_task_template(
 ) -> TaskTemplate:
     """Update task template details"""
     try:
-        update_data = updates.dict(exclude_unset=True)
+        update_data = updates.model_dump(exclude_unset=True)
 
         # Update fields
-        for field, value in update_data.items():
-            if hasattr(task_template, field):
-                setattr(task_template, field, value)
+        for field in update_data.keys() & _TASK_TEMPLATE_COLUMNS:
+            setattr(task_template, field, update_data[field])
 
         await db.commit()
         await db.refresh(task_template)
 
-        logger.info(f"Task template {task_template.title} updated by user {editor_id}")
+        logger.info("Task template {title} updated by user {editor_id}", title=task_template.title, editor_id=editor_id)
         return task_template
 
     except Exception as e:
-        logger.error(f"Failed to update task template: {e}")
+        logger.error("Failed to update task template: {error}", error=e)
         await db.rollback()
         raise
 
@@ -522,10 +551,10 @@ async def delete_task_template(db: AsyncSession, task_template: TaskTemplate) ->
         await db.delete(task_template)
         await db.commit()
 
-        logger.info(f"Task template {task_template.title} deleted")
+        logger.info("Task template {title} deleted", title=task_template.title)
         return True
 
     except Exception as e:
-        logger.error(f"Failed to delete task template: {e}")
+        logger.error("Failed to delete task template: {error}", error=e)
         await db.rollback()
         raise
\ No newline at end of file
@@ -1,24 +1,234 @@
 # app/db/crud/cortex.py
-"""CRUD operations for Cortex integration"""
+"""CRUD operations for Cortex integration
+
+Mutations flush but do not commit; the endpoint commits once before building
+its response so multi-step operations stay atomic.
+"""
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import joinedload, selectinload
-from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session, joinedload, noload, selectinload, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import event, delete, func, literal, or_, tuple_, update, bindparam, cast, Boolean, String
+from sqlalchemy.dialects.postgresql import insert as pg_insert, JSONB
 from typing import Optional, List, Dict, Any
 from uuid import UUID
-from datetime import datetime, timezone
+from datetime import datetime
 from loguru import logger
 
-from app.db.models.cortex import CortexInstance, CortexAnalyzer, CortexResponder, CortexJob
+from app.db.models.cortex import CortexInstance, CortexAnalyzer, CortexResponder, CortexJob, CortexJobReport
+from app.db.models import Observable, Case, User
 from app.db.models.enums import JobStatus, WorkerType
+from app.core.config import settings
+from app.core.cache import TTLCache
 from app.api.v1.schemas.cortex import (
     CortexInstanceCreate, CortexInstanceUpdate,
     CortexJobCreate, CortexJobUpdate
 )
 
 
+def _list_options(*options):
+    """Loader options for list queries, with a raiseload sentinel when enabled.
+
+    With ORM_RAISELOAD on, touching any relationship not loaded explicitly
+    raises instead of silently issuing one SELECT per row.
+    """
+    if settings.ORM_RAISELOAD:
+        return (*options, raiseload("*"))
+    return options
+
+
+# Cortex sync payload keys mapped to the worker columns they update on conflict
+_WORKER_SYNC_FIELDS = {
+    'version': 'version',
+    'description': 'description',
+    'dataTypeList': 'data_types',
+    'maxTlp': 'max_tlp',
+    'maxPap': 'max_pap',
+    'configuration': 'configuration'
+}
+
+
+def _worker_values(instance_id: int, worker_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Column values for an analyzer or responder row from a Cortex sync payload"""
+    return {
+        'name': worker_data['name'],
+        'display_name': worker_data.get('displayName', worker_data['name']),
+        'version': worker_data.get('version', '1.0'),
+        'description': worker_data.get('description'),
+        'data_types': worker_data.get('dataTypeList', []),
+        'max_tlp': worker_data.get('maxTlp', 3),
+        'max_pap': worker_data.get('maxPap', 3),
+        'configuration': worker_data.get('configuration', {}),
+        'cortex_instance_id': instance_id,
+        'last_sync': func.now(),
+        'is_available': True
+    }
+
+
+def _worker_upsert_stmt(model, rows: List[Dict[str, Any]], update_columns):
+    """Build INSERT ... ON CONFLICT DO UPDATE for analyzer or responder rows"""
+    stmt = pg_insert(model).values(rows)
+    set_ = {column: stmt.excluded[column] for column in update_columns}
+    set_.update(is_available=True, last_sync=func.now(), updated_at=func.now())
+    return stmt.on_conflict_do_update(
+        index_elements=[model.cortex_instance_id, model.name],
+        set_=set_
+    )
+
+
+async def _upsert_worker(db: AsyncSession, model, instance_id: int, worker_data: Dict[str, Any]):
+    """Upsert a single worker, overwriting only the fields present in the payload"""
+    update_columns = [
+        column for key, column in _WORKER_SYNC_FIELDS.items() if key in worker_data
+    ]
+    stmt = _worker_upsert_stmt(model, [_worker_values(instance_id, worker_data)], update_columns)
+    # populate_existing lets RETURNING overwrite a copy already in the identity map
+    result = await db.execute(
+        stmt.returning(model).execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+async def _bulk_upsert_workers(
+    db: AsyncSession,
+    model,
+    instance_id: int,
+    workers_data: List[Dict[str, Any]]
+) -> int:
+    """Upsert a full list of workers in one statement.
+
+    Sync payloads carry complete worker definitions, so every sync field is
+    overwritten on conflict. Duplicate names keep the last definition since
+    one statement cannot update the same row twice.
+    """
+    rows = {data['name']: _worker_values(instance_id, data) for data in workers_data}
+    if not rows:
+        return 0
+
+    stmt = _worker_upsert_stmt(model, list(rows.values()), _WORKER_SYNC_FIELDS.values())
+    await db.execute(stmt)
+    await db.flush()
+    _clear_worker_rows_on_commit(db)
+    return len(rows)
+
+
+def _worker_filters(model):
+    """Bound-parameter filters shared by the worker listing queries"""
+    data_type = bindparam('data_type', type_=String)
+    return (
+        model.cortex_instance_id == bindparam('instance_id'),
+        or_(bindparam('enabled_only', type_=Boolean).is_(False), model.enabled.is_(True)),
+        or_(
+            data_type.is_(None),
+            cast(model.data_types, JSONB).contains(func.jsonb_build_array(data_type))
+        )
+    )
+
+
+def _workers_by_instance_stmt(model):
+    """Fixed-shape worker listing query driven entirely by bound parameters.
+
+    The optional filters are folded into SQL conditionals instead of being
+    appended conditionally, so every call reuses one compiled statement.
+    """
+    return (
+        select(model)
+        .options(*_list_options(joinedload(model.cortex_instance)))
+        .where(*_worker_filters(model))
+        .order_by(model.name)
+    )
+
+
+_ANALYZERS_BY_INSTANCE = _workers_by_instance_stmt(CortexAnalyzer)
+_RESPONDERS_BY_INSTANCE = _workers_by_instance_stmt(CortexResponder)
+
+
+def _worker_rows_stmt(model):
+    """Column-only variant of the worker listing for serialization without ORM hydration"""
+    return (
+        select(
+            *model.__table__.c,
+            CortexInstance.uuid.label('cortex_instance_uuid'),
+            CortexInstance.name.label('cortex_instance_name')
+        )
+        .join(CortexInstance, model.cortex_instance_id == CortexInstance.id)
+        .where(*_worker_filters(model))
+        .order_by(model.name)
+    )
+
+
+_ANALYZER_ROWS_BY_INSTANCE = _worker_rows_stmt(CortexAnalyzer)
+_RESPONDER_ROWS_BY_INSTANCE = _worker_rows_stmt(CortexResponder)
+
+# Worker catalogs only change on sync. Cleared when a transaction writing workers
+# or instances commits (clearing earlier would let a concurrent request re-cache
+# the pre-commit rows); other workers may serve the old catalog for up to the TTL.
+_worker_rows_cache = TTLCache(maxsize=512, ttl=30)
+
+
+def _clear_worker_rows_on_commit(db: AsyncSession) -> None:
+    """Drop the cached worker listings once this session's transaction commits"""
+    db.sync_session.info['clear_worker_rows'] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_worker_rows_after_commit(session: Session) -> None:
+    if session.info.pop('clear_worker_rows', False):
+        _worker_rows_cache.clear()
+
+
+async def _cached_worker_rows(
+    db: AsyncSession,
+    stmt,
+    instance_id: int,
+    enabled_only: bool,
+    data_type: Optional[str]
+) -> List[Dict[str, Any]]:
+    """Run a worker rows statement, serving repeated filter combinations from cache"""
+    params = {'instance_id': instance_id, 'enabled_only': enabled_only, 'data_type': data_type or None}
+    key = (stmt, *params.values())
+    rows = _worker_rows_cache.get(key)
+    if rows is None:
+        result = await db.execute(stmt, params)
+        rows = [dict(row) for row in result.mappings()]
+        _worker_rows_cache.set(key, rows)
+    return rows
+
+
 # Cortex Instance CRUD
 
+_CORTEX_INSTANCE_COLS = frozenset(c.key for c in CortexInstance.__mapper__.column_attrs)
+_CORTEX_JOB_COLS = frozenset(c.key for c in CortexJob.__mapper__.column_attrs)
+
+# uuid -> primary key; instances change rarely but are resolved on every Cortex request
+_instance_ids = TTLCache(maxsize=256, ttl=60)
+
+
+def _remember_instance(instance: Optional[CortexInstance]) -> Optional[CortexInstance]:
+    """Record an instance's primary key in the id cache"""
+    if instance is not None:
+        _instance_ids.set(instance.uuid, instance.id)
+    return instance
+
+
+async def get_cortex_instance_id(db: AsyncSession, instance_uuid: UUID) -> Optional[int]:
+    """Resolve a Cortex instance UUID to its primary key, served from cache when possible"""
+    instance_id = _instance_ids.get(instance_uuid)
+    if instance_id is not None:
+        return instance_id
+    try:
+        result = await db.execute(
+            select(CortexInstance.id).filter(CortexInstance.uuid == instance_uuid)
+        )
+        instance_id = result.scalar_one_or_none()
+        if instance_id is not None:
+            _instance_ids.set(instance_uuid, instance_id)
+        return instance_id
+    except Exception as e:
+        logger.error(f"Error resolving Cortex instance UUID {instance_uuid}: {e}")
+        return None
+
+
 async def get_cortex_instance_by_uuid(db: AsyncSession, instance_uuid: UUID) -> Optional[CortexInstance]:
     """Get Cortex instance by UUID"""
     try:
@@ -30,7 +240,7 @@ async def get_cortex_instance_by_uuid(db: AsyncSession, instance_uuid: UUID) ->
             )
             .filter(CortexInstance.uuid == instance_uuid)
         )
-        return result.scalars().first()
+        return _remember_instance(result.scalars().first())
     except Exception as e:
         logger.error(f"Error retrieving Cortex instance by UUID {instance_uuid}: {e}")
         return None
@@ -47,12 +257,20 @@ async def get_cortex_instance_by_name(db: AsyncSession, name: str) -> Optional[C
             )
             .filter(CortexInstance.name == name)
         )
-        return result.scalars().first()
+        return _remember_instance(result.scalars().first())
     except Exception as e:
         logger.error(f"Error retrieving Cortex instance by name {name}: {e}")
         return None
 
 
+async def exists_cortex_instance_by_name(db: AsyncSession, name: str) -> bool:
+    """Check whether a Cortex instance name is taken without loading the instance"""
+    result = await db.execute(
+        select(literal(1)).where(CortexInstance.name == name).limit(1)
+    )
+    return result.scalar() is not None
+
+
 async def get_cortex_instances(
     db: AsyncSession,
     skip: int = 0,
@@ -61,7 +279,13 @@ async def get_cortex_instances(
 ) -> List[CortexInstance]:
     """Get list of Cortex instances"""
     try:
-        query = select(CortexInstance)
+        query = select(CortexInstance).options(
+            *_list_options(
+                selectinload(CortexInstance.analyzers),
+                selectinload(CortexInstance.responders),
+                selectinload(CortexInstance.jobs)
+            )
+        )
         
         if enabled_only:
             query = query.filter(CortexInstance.enabled == True)
@@ -75,39 +299,108 @@ async def get_cortex_instances(
         return []
 
 
+def _instance_count(model, *criteria):
+    """Correlated per-instance count of child rows"""
+    return (
+        select(func.count(model.id))
+        .where(model.cortex_instance_id == CortexInstance.id, *criteria)
+        .correlate(CortexInstance)
+        .scalar_subquery()
+    )
+
+
+def _instance_rows_stmt():
+    """Instance response columns plus worker and active-job counts, aggregated in SQL"""
+    return select(
+        CortexInstance.uuid,
+        CortexInstance.name,
+        CortexInstance.url,
+        CortexInstance.enabled,
+        CortexInstance.version,
+        CortexInstance.included_organizations,
+        CortexInstance.excluded_organizations,
+        CortexInstance.verify_ssl,
+        CortexInstance.timeout,
+        CortexInstance.max_concurrent_jobs,
+        CortexInstance.created_at,
+        CortexInstance.updated_at,
+        _instance_count(CortexAnalyzer, CortexAnalyzer.enabled.is_(True)).label('analyzer_count'),
+        _instance_count(CortexResponder, CortexResponder.enabled.is_(True)).label('responder_count'),
+        _instance_count(
+            CortexJob, CortexJob.status.in_([JobStatus.WAITING, JobStatus.IN_PROGRESS])
+        ).label('active_jobs')
+    )
+
+
+async def get_cortex_instance_row(db: AsyncSession, instance_uuid: UUID) -> Optional[Dict[str, Any]]:
+    """Get one Cortex instance with its statistics in a single round trip"""
+    try:
+        result = await db.execute(
+            _instance_rows_stmt().filter(CortexInstance.uuid == instance_uuid)
+        )
+        return result.mappings().first()
+    except Exception as e:
+        logger.error(f"Error retrieving Cortex instance row {instance_uuid}: {e}")
+        return None
+
+
+async def get_cortex_instances_rows(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 50,
+    enabled_only: bool = False
+) -> List[Dict[str, Any]]:
+    """Get Cortex instances as column mappings with worker and active-job counts"""
+    try:
+        query = _instance_rows_stmt()
+
+        if enabled_only:
+            query = query.filter(CortexInstance.enabled == True)
+
+        query = query.offset(skip).limit(limit).order_by(CortexInstance.name)
+
+        result = await db.execute(query)
+        return result.mappings().all()
+    except Exception as e:
+        logger.error(f"Error retrieving Cortex instance rows: {e}")
+        return []
+
+
 async def create_cortex_instance(
     db: AsyncSession,
     instance_data: CortexInstanceCreate
 ) -> CortexInstance:
     """Create new Cortex instance"""
     try:
-        # Check if name already exists
-        existing = await get_cortex_instance_by_name(db, instance_data.name)
-        if existing:
-            raise ValueError(f"Cortex instance with name '{instance_data.name}' already exists")
-
-        instance = CortexInstance(
-            name=instance_data.name,
-            url=instance_data.url,
-            api_key=instance_data.api_key,  # Should be encrypted before storing
-            enabled=instance_data.enabled,
-            included_organizations=instance_data.included_organizations,
-            excluded_organizations=instance_data.excluded_organizations,
-            verify_ssl=instance_data.verify_ssl,
-            timeout=instance_data.timeout,
-            max_concurrent_jobs=instance_data.max_concurrent_jobs
+        # Let the unique name constraint reject duplicates in the same round trip
+        stmt = (
+            pg_insert(CortexInstance)
+            .values(
+                name=instance_data.name,
+                url=str(instance_data.url),
+                api_key=instance_data.api_key,  # Should be encrypted before storing
+                enabled=instance_data.enabled,
+                included_organizations=instance_data.included_organizations,
+                excluded_organizations=instance_data.excluded_organizations,
+                verify_ssl=instance_data.verify_ssl,
+                timeout=instance_data.timeout,
+                max_concurrent_jobs=instance_data.max_concurrent_jobs
+            )
+            .on_conflict_do_nothing(index_elements=[CortexInstance.name])
+            .returning(CortexInstance)
         )
+        result = await db.execute(stmt)
+        instance = result.scalar_one_or_none()
+        if instance is None:
+            raise ValueError(f"Cortex instance with name '{instance_data.name}' already exists")
 
-        db.add(instance)
-        await db.commit()
-        await db.refresh(instance)
+        await db.flush()
 
         logger.info(f"Cortex instance created: {instance.name}")
         return instance
 
     except Exception as e:
         logger.error(f"Failed to create Cortex instance: {e}")
-        await db.rollback()
         raise
 
 
@@ -118,36 +411,46 @@ async def update_cortex_instance(
 ) -> CortexInstance:
     """Update Cortex instance"""
     try:
-        update_data = updates.dict(exclude_unset=True)
+        update_data = updates.model_dump(exclude_unset=True)
+        if update_data.get("url") is not None:
+            update_data["url"] = str(update_data["url"])
+
+        new_name = update_data.get("name")
+        if new_name and new_name != instance.name and await exists_cortex_instance_by_name(db, new_name):
+            raise ValueError(f"Cortex instance with name '{new_name}' already exists")
 
-        for field, value in update_data.items():
-            if hasattr(instance, field):
-                setattr(instance, field, value)
+        for field in update_data.keys() & _CORTEX_INSTANCE_COLS:
+            setattr(instance, field, update_data[field])
 
-        await db.commit()
-        await db.refresh(instance)
+        await db.flush()
+        _clear_worker_rows_on_commit(db)  # Listings embed the instance name
 
         logger.info(f"Cortex instance updated: {instance.name}")
         return instance
 
     except Exception as e:
         logger.error(f"Failed to update Cortex instance: {e}")
-        await db.rollback()
         raise
 
 
 async def delete_cortex_instance(db: AsyncSession, instance: CortexInstance) -> bool:
     """Delete Cortex instance"""
     try:
-        await db.delete(instance)
-        await db.commit()
+        # ON DELETE CASCADE removes analyzers, responders and jobs server-side
+        await db.execute(
+            delete(CortexInstance)
+            .where(CortexInstance.id == instance.id)
+            .execution_options(synchronize_session=False)
+        )
+        await db.flush()
+        _instance_ids.pop(instance.uuid)
+        _clear_worker_rows_on_commit(db)
 
         logger.info(f"Cortex instance deleted: {instance.name}")
         return True
 
     except Exception as e:
         logger.error(f"Failed to delete Cortex instance: {e}")
-        await db.rollback()
         raise
 
 
@@ -175,23 +478,32 @@ async def get_analyzers_by_instance(
 ) -> List[CortexAnalyzer]:
     """Get analyzers for Cortex instance"""
     try:
-        query = select(CortexAnalyzer).filter(CortexAnalyzer.cortex_instance_id == instance_id)
-        
-        if enabled_only:
-            query = query.filter(CortexAnalyzer.enabled == True)
-        
-        if data_type:
-            query = query.filter(CortexAnalyzer.data_types.contains([data_type]))
-        
-        query = query.order_by(CortexAnalyzer.name)
-        
-        result = await db.execute(query)
+        result = await db.execute(
+            _ANALYZERS_BY_INSTANCE,
+            {'instance_id': instance_id, 'enabled_only': enabled_only, 'data_type': data_type or None}
+        )
         return result.scalars().all()
     except Exception as e:
         logger.error(f"Error retrieving analyzers: {e}")
         return []
 
 
+async def get_analyzers_by_instance_rows(
+    db: AsyncSession,
+    instance_id: int,
+    enabled_only: bool = False,
+    data_type: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Get analyzers for Cortex instance as column mappings"""
+    try:
+        return await _cached_worker_rows(
+            db, _ANALYZER_ROWS_BY_INSTANCE, instance_id, enabled_only, data_type
+        )
+    except Exception as e:
+        logger.error(f"Error retrieving analyzer rows: {e}")
+        return []
+
+
 async def create_or_update_analyzer(
     db: AsyncSession,
     instance_id: int,
@@ -199,53 +511,14 @@ async def create_or_update_analyzer(
 ) -> CortexAnalyzer:
     """Create or update analyzer from Cortex sync"""
     try:
-        # Check if analyzer exists
-        result = await db.execute(
-            select(CortexAnalyzer).filter(
-                and_(
-                    CortexAnalyzer.cortex_instance_id == instance_id,
-                    CortexAnalyzer.name == analyzer_data['name']
-                )
-            )
-        )
-        existing = result.scalars().first()
-
-        if existing:
-            # Update existing
-            existing.version = analyzer_data.get('version', existing.version)
-            existing.description = analyzer_data.get('description', existing.description)
-            existing.data_types = analyzer_data.get('dataTypeList', existing.data_types)
-            existing.max_tlp = analyzer_data.get('maxTlp', existing.max_tlp)
-            existing.max_pap = analyzer_data.get('maxPap', existing.max_pap)
-            existing.configuration = analyzer_data.get('configuration', existing.configuration)
-            existing.is_available = True
-            existing.last_sync = datetime.now(timezone.utc)
-            
-            analyzer = existing
-        else:
-            # Create new
-            analyzer = CortexAnalyzer(
-                name=analyzer_data['name'],
-                display_name=analyzer_data.get('displayName', analyzer_data['name']),
-                version=analyzer_data.get('version', '1.0'),
-                description=analyzer_data.get('description'),
-                data_types=analyzer_data.get('dataTypeList', []),
-                max_tlp=analyzer_data.get('maxTlp', 3),
-                max_pap=analyzer_data.get('maxPap', 3),
-                configuration=analyzer_data.get('configuration', {}),
-                cortex_instance_id=instance_id,
-                last_sync=datetime.now(timezone.utc),
-                is_available=True
-            )
-            db.add(analyzer)
+        analyzer = await _upsert_worker(db, CortexAnalyzer, instance_id, analyzer_data)
 
-        await db.commit()
-        await db.refresh(analyzer)
+        await db.flush()
+        _clear_worker_rows_on_commit(db)
         return analyzer
 
     except Exception as e:
         logger.error(f"Failed to create/update analyzer: {e}")
-        await db.rollback()
         raise
 
 
@@ -273,23 +546,32 @@ async def get_responders_by_instance(
 ) -> List[CortexResponder]:
     """Get responders for Cortex instance"""
     try:
-        query = select(CortexResponder).filter(CortexResponder.cortex_instance_id == instance_id)
-        
-        if enabled_only:
-            query = query.filter(CortexResponder.enabled == True)
-        
-        if data_type:
-            query = query.filter(CortexResponder.data_types.contains([data_type]))
-        
-        query = query.order_by(CortexResponder.name)
-        
-        result = await db.execute(query)
+        result = await db.execute(
+            _RESPONDERS_BY_INSTANCE,
+            {'instance_id': instance_id, 'enabled_only': enabled_only, 'data_type': data_type or None}
+        )
         return result.scalars().all()
     except Exception as e:
         logger.error(f"Error retrieving responders: {e}")
         return []
 
 
+async def get_responders_by_instance_rows(
+    db: AsyncSession,
+    instance_id: int,
+    enabled_only: bool = False,
+    data_type: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Get responders for Cortex instance as column mappings"""
+    try:
+        return await _cached_worker_rows(
+            db, _RESPONDER_ROWS_BY_INSTANCE, instance_id, enabled_only, data_type
+        )
+    except Exception as e:
+        logger.error(f"Error retrieving responder rows: {e}")
+        return []
+
+
 async def create_or_update_responder(
     db: AsyncSession,
     instance_id: int,
@@ -297,71 +579,66 @@ async def create_or_update_responder(
 ) -> CortexResponder:
     """Create or update responder from Cortex sync"""
     try:
-        # Check if responder exists
-        result = await db.execute(
-            select(CortexResponder).filter(
-                and_(
-                    CortexResponder.cortex_instance_id == instance_id,
-                    CortexResponder.name == responder_data['name']
-                )
-            )
-        )
-        existing = result.scalars().first()
-
-        if existing:
-            # Update existing
-            existing.version = responder_data.get('version', existing.version)
-            existing.description = responder_data.get('description', existing.description)
-            existing.data_types = responder_data.get('dataTypeList', existing.data_types)
-            existing.max_tlp = responder_data.get('maxTlp', existing.max_tlp)
-            existing.max_pap = responder_data.get('maxPap', existing.max_pap)
-            existing.configuration = responder_data.get('configuration', existing.configuration)
-            existing.is_available = True
-            existing.last_sync = datetime.now(timezone.utc)
-            
-            responder = existing
-        else:
-            # Create new
-            responder = CortexResponder(
-                name=responder_data['name'],
-                display_name=responder_data.get('displayName', responder_data['name']),
-                version=responder_data.get('version', '1.0'),
-                description=responder_data.get('description'),
-                data_types=responder_data.get('dataTypeList', []),
-                max_tlp=responder_data.get('maxTlp', 3),
-                max_pap=responder_data.get('maxPap', 3),
-                configuration=responder_data.get('configuration', {}),
-                cortex_instance_id=instance_id,
-                last_sync=datetime.now(timezone.utc),
-                is_available=True
-            )
-            db.add(responder)
+        responder = await _upsert_worker(db, CortexResponder, instance_id, responder_data)
 
-        await db.commit()
-        await db.refresh(responder)
+        await db.flush()
+        _clear_worker_rows_on_commit(db)
         return responder
 
     except Exception as e:
         logger.error(f"Failed to create/update responder: {e}")
-        await db.rollback()
+        raise
+
+
+async def bulk_upsert_analyzers(
+    db: AsyncSession,
+    instance_id: int,
+    analyzers_data: List[Dict[str, Any]]
+) -> int:
+    """Create or update all analyzers from a Cortex sync in one statement"""
+    try:
+        return await _bulk_upsert_workers(db, CortexAnalyzer, instance_id, analyzers_data)
+    except Exception as e:
+        logger.error(f"Failed to bulk upsert analyzers: {e}")
+        raise
+
+
+async def bulk_upsert_responders(
+    db: AsyncSession,
+    instance_id: int,
+    responders_data: List[Dict[str, Any]]
+) -> int:
+    """Create or update all responders from a Cortex sync in one statement"""
+    try:
+        return await _bulk_upsert_workers(db, CortexResponder, instance_id, responders_data)
+    except Exception as e:
+        logger.error(f"Failed to bulk upsert responders: {e}")
         raise
 
 
 # Cortex Job CRUD
 
+_JOB_DETAIL_OPTIONS = (
+    # Small many-to-one lookups stay in the main JOIN
+    joinedload(CortexJob.cortex_instance),
+    joinedload(CortexJob.analyzer),
+    joinedload(CortexJob.responder),
+    # Wide rows are fetched with separate IN queries
+    selectinload(CortexJob.observable),
+    selectinload(CortexJob.case),
+    selectinload(CortexJob.created_by),
+    selectinload(CortexJob.job_report)
+)
+
+_JOB_REPORT_FIELDS = ('report', 'artifacts')
+
+
 async def get_job_by_uuid(db: AsyncSession, job_uuid: UUID) -> Optional[CortexJob]:
     """Get job by UUID"""
     try:
         result = await db.execute(
             select(CortexJob)
-            .options(
-                joinedload(CortexJob.cortex_instance),
-                joinedload(CortexJob.analyzer),
-                joinedload(CortexJob.responder),
-                joinedload(CortexJob.observable),
-                joinedload(CortexJob.case),
-                joinedload(CortexJob.created_by)
-            )
+            .options(*_JOB_DETAIL_OPTIONS)
             .filter(CortexJob.uuid == job_uuid)
         )
         return result.scalars().first()
@@ -370,6 +647,18 @@ async def get_job_by_uuid(db: AsyncSession, job_uuid: UUID) -> Optional[CortexJo
         return None
 
 
+async def get_jobs_by_uuids(db: AsyncSession, job_uuids: List[UUID]) -> List[CortexJob]:
+    """Get jobs for a batch of UUIDs in one query, in no particular order"""
+    if not job_uuids:
+        return []
+    result = await db.execute(
+        select(CortexJob)
+        .options(*_JOB_DETAIL_OPTIONS)
+        .filter(CortexJob.uuid.in_(job_uuids))
+    )
+    return result.scalars().all()
+
+
 async def get_job_by_cortex_id(db: AsyncSession, cortex_job_id: str) -> Optional[CortexJob]:
     """Get job by Cortex job ID"""
     try:
@@ -395,15 +684,28 @@ async def get_jobs(
     status_filter: Optional[JobStatus] = None,
     observable_id: Optional[int] = None,
     case_id: Optional[int] = None,
-    user_id: Optional[int] = None
+    user_id: Optional[int] = None,
+    before_created_at: Optional[datetime] = None,
+    before_id: Optional[int] = None
 ) -> List[CortexJob]:
-    """Get jobs with filters"""
+    """Get jobs with filters
+
+    Passing the (created_at, id) of the last job of the previous page as
+    before_created_at/before_id seeks straight to the next page instead of
+    scanning and discarding skip rows.
+    """
     try:
+        # Related rows only contribute identifiers and display names to the listing
         query = select(CortexJob).options(
-            joinedload(CortexJob.cortex_instance),
-            joinedload(CortexJob.analyzer),
-            joinedload(CortexJob.responder),
-            joinedload(CortexJob.created_by)
+            *_list_options(
+                selectinload(CortexJob.cortex_instance).load_only(CortexInstance.uuid, CortexInstance.name),
+                selectinload(CortexJob.analyzer).load_only(CortexAnalyzer.uuid, CortexAnalyzer.name),
+                selectinload(CortexJob.responder).load_only(CortexResponder.uuid, CortexResponder.name),
+                selectinload(CortexJob.observable).load_only(Observable.uuid),
+                selectinload(CortexJob.case).load_only(Case.uuid),
+                selectinload(CortexJob.created_by).load_only(User.uuid, User.email),
+                noload(CortexJob.job_report)  # Listings never carry reports
+            )
         )
         
         if status_filter:
@@ -418,7 +720,14 @@ async def get_jobs(
         if user_id:
             query = query.filter(CortexJob.created_by_id == user_id)
         
-        query = query.order_by(CortexJob.created_at.desc()).offset(skip).limit(limit)
+        if before_created_at is not None and before_id is not None:
+            query = query.filter(
+                tuple_(CortexJob.created_at, CortexJob.id) < tuple_(before_created_at, before_id)
+            )
+        else:
+            query = query.offset(skip)
+
+        query = query.order_by(CortexJob.created_at.desc(), CortexJob.id.desc()).limit(limit)
         
         result = await db.execute(query)
         return result.scalars().all()
@@ -451,61 +760,88 @@ async def create_cortex_job(
         )
 
         db.add(job)
-        await db.commit()
-        await db.refresh(job)
+        await db.flush()
 
         logger.info(f"Cortex job created: {job.cortex_job_id}")
         return job
 
     except Exception as e:
         logger.error(f"Failed to create Cortex job: {e}")
-        await db.rollback()
         raise
 
 
 async def update_cortex_job(
     db: AsyncSession,
-    job: CortexJob,
+    job_uuid: UUID,
     updates: CortexJobUpdate
-) -> CortexJob:
-    """Update Cortex job"""
+) -> Optional[CortexJob]:
+    """Update Cortex job in a single UPDATE ... RETURNING
+
+    Status timestamps are derived in SQL from the database clock, so the job
+    does not need to be loaded first; duration is a generated column. A report
+    or artifacts update is upserted into cortex_job_reports.
+    Returns None if the job does not exist.
+    """
     try:
-        update_data = updates.dict(exclude_unset=True)
-
-        for field, value in update_data.items():
-            if hasattr(job, field):
-                setattr(job, field, value)
+        changes = updates.model_dump(exclude_unset=True)
+        values = {field: value for field, value in changes.items() if field in _CORTEX_JOB_COLS}
+        report_values = {field: changes[field] for field in _JOB_REPORT_FIELDS if field in changes}
 
         # Update timestamps based on status
-        if updates.status == JobStatus.IN_PROGRESS and not job.started_at:
-            job.started_at = datetime.now(timezone.utc)
-        elif updates.status in [JobStatus.SUCCESS, JobStatus.FAILURE] and not job.ended_at:
-            job.ended_at = datetime.now(timezone.utc)
-            if job.started_at:
-                job.duration = (job.ended_at - job.started_at).total_seconds()
+        if updates.status == JobStatus.IN_PROGRESS:
+            values['started_at'] = func.coalesce(CortexJob.started_at, func.now())
+        elif updates.status in [JobStatus.SUCCESS, JobStatus.FAILURE]:
+            values['ended_at'] = func.coalesce(CortexJob.ended_at, func.now())
+
+        values.setdefault('updated_at', func.now())
+
+        result = await db.execute(
+            update(CortexJob)
+            .where(CortexJob.uuid == job_uuid)
+            .values(**values)
+            .returning(CortexJob)
+            .execution_options(populate_existing=True)
+        )
+        job = result.scalar_one_or_none()
+
+        if job and report_values:
+            if report_values.get('artifacts') is None:
+                report_values.pop('artifacts', None)
+            stmt = pg_insert(CortexJobReport).values(job_id=job.id, **report_values)
+            report_result = await db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[CortexJobReport.job_id],
+                    set_={field: stmt.excluded[field] for field in report_values}
+                )
+                .returning(CortexJobReport)
+                .execution_options(populate_existing=True)
+            )
+            set_committed_value(job, 'job_report', report_result.scalar_one())
 
-        await db.commit()
-        await db.refresh(job)
+        await db.flush()
 
-        logger.info(f"Cortex job updated: {job.cortex_job_id} -> {job.status}")
+        if job:
+            logger.info(f"Cortex job updated: {job.cortex_job_id} -> {job.status}")
         return job
 
     except Exception as e:
         logger.error(f"Failed to update Cortex job: {e}")
-        await db.rollback()
         raise
 
 
 async def delete_cortex_job(db: AsyncSession, job: CortexJob) -> bool:
     """Delete Cortex job"""
     try:
-        await db.delete(job)
-        await db.commit()
+        await db.execute(
+            delete(CortexJob)
+            .where(CortexJob.id == job.id)
+            .execution_options(synchronize_session=False)
+        )
+        await db.flush()
 
         logger.info(f"Cortex job deleted: {job.cortex_job_id}")
         return True
 
     except Exception as e:
         logger.error(f"Failed to delete Cortex job: {e}")
-        await db.rollback()
         raise
\ No newline at end of file
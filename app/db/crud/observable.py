@@ -1,17 +1,28 @@
 # app/db/crud/observable.py
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func, and_, or_
-from sqlalchemy.orm import joinedload
-from typing import Optional, List, Dict, Any
+from sqlalchemy import func, and_, or_, tuple_, update, cast, distinct, literal, lambda_stmt, JSON, Row
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from typing import Optional, List, Dict, Any, AsyncIterator
 from uuid import UUID
+from datetime import datetime
+from itertools import batched
 from loguru import logger
 
-from app.db.models import Observable, Case, User
+from app.db.models import Observable, User
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.db.models.enums import ObservableType, TLP
 from app.api.v1.schemas.observables import ObservableCreate, ObservableUpdate
 
 
+# Per-case IOC stats for dashboards; dropped whenever a write can change them
+_ioc_stats_cache = TTLCache(maxsize=1024, ttl=60)
+
+
 async def get_observable_by_uuid(db: AsyncSession, observable_uuid: UUID) -> Optional[Observable]:
     """Get observable by UUID with relationships loaded"""
     try:
@@ -29,6 +40,68 @@ async def get_observable_by_uuid(db: AsyncSession, observable_uuid: UUID) -> Opt
         return None
 
 
+# Rows buffered per round trip by the stream_* generators
+_STREAM_BATCH_SIZE = 500
+
+
+# Columns read by ObservableSummary (plus id for keyset cursors); list queries
+# return rows of just these instead of hydrating full entities
+_OBSERVABLE_LIST = select(
+    Observable.id,
+    Observable.uuid,
+    Observable.data_type,
+    Observable.data,
+    Observable.is_ioc,
+    Observable.tags,
+    Observable.sighted_count,
+    Observable.created_at
+)
+
+
+def _filter_observable_list(
+        stmt: StatementLambdaElement,
+        skip: int,
+        limit: int,
+        data_type_filter: Optional[ObservableType],
+        is_ioc_filter: Optional[bool],
+        search_term: Optional[str],
+        before_created_at: Optional[datetime],
+        before_id: Optional[int]
+) -> StatementLambdaElement:
+    """Append the shared list filters, keyset/offset and ordering to a lambda statement
+
+    Each branch is its own lambda, so every filter combination is built and
+    compiled once and the closure values are sent as bound parameters.
+    """
+    if data_type_filter:
+        stmt += lambda s: s.where(Observable.data_type == data_type_filter)
+
+    if is_ioc_filter is not None:
+        stmt += lambda s: s.where(Observable.is_ioc == is_ioc_filter)
+
+    if search_term:
+        search_pattern = f"%{search_term.lower()}%"
+        stmt += lambda s: s.where(
+            or_(
+                func.lower(Observable.data).like(search_pattern),
+                func.lower(Observable.message).like(search_pattern),
+                func.lower(Observable.source).like(search_pattern)
+            )
+        )
+
+    # Add pagination
+    if before_created_at is not None and before_id is not None:
+        stmt += lambda s: s.where(
+            tuple_(Observable.created_at, Observable.id) < tuple_(before_created_at, before_id)
+        )
+    else:
+        stmt += lambda s: s.offset(skip)
+
+    # Order by created_at desc (most recent first)
+    stmt += lambda s: s.order_by(Observable.created_at.desc(), Observable.id.desc()).limit(limit)
+    return stmt
+
+
 async def get_case_observables(
         db: AsyncSession,
         case_id: int,
@@ -36,40 +109,24 @@ async def get_case_observables(
         limit: int = 50,
         data_type_filter: Optional[ObservableType] = None,
         is_ioc_filter: Optional[bool] = None,
-        search_term: Optional[str] = None
-) -> List[Observable]:
-    """Get observables for a case with filters"""
+        search_term: Optional[str] = None,
+        before_created_at: Optional[datetime] = None,
+        before_id: Optional[int] = None
+) -> List[Row]:
+    """Get summary rows of a case's observables with filters
+
+    Passing the (created_at, id) of the last observable of the previous page
+    as before_created_at/before_id seeks to the next page instead of offsetting.
+    """
     try:
-        query = select(Observable).filter(Observable.case_id == case_id)
-
-        # Apply filters
-        if data_type_filter:
-            query = query.filter(Observable.data_type == data_type_filter)
-
-        if is_ioc_filter is not None:
-            query = query.filter(Observable.is_ioc == is_ioc_filter)
-
-        if search_term:
-            search_pattern = f"%{search_term}%"
-            query = query.filter(
-                or_(
-                    Observable.data.ilike(search_pattern),
-                    Observable.message.ilike(search_pattern),
-                    Observable.source.ilike(search_pattern)
-                )
-            )
-
-        # Order by created_at desc (most recent first)
-        query = query.order_by(Observable.created_at.desc())
-
-        # Add pagination
-        query = query.offset(skip).limit(limit)
-
-        # Load relationships
-        query = query.options(joinedload(Observable.created_by))
+        stmt = lambda_stmt(lambda: _OBSERVABLE_LIST.where(Observable.case_id == case_id))
+        stmt = _filter_observable_list(
+            stmt, skip, limit, data_type_filter, is_ioc_filter,
+            search_term, before_created_at, before_id
+        )
 
-        result = await db.execute(query)
-        return result.scalars().unique().all()
+        result = await db.execute(stmt)
+        return result.all()
 
     except Exception as e:
         logger.error(f"Error retrieving case observables: {e}")
@@ -83,48 +140,23 @@ async def get_global_observables(
         limit: int = 50,
         data_type_filter: Optional[ObservableType] = None,
         is_ioc_filter: Optional[bool] = None,
-        search_term: Optional[str] = None
-) -> List[Observable]:
-    """Get observables across all cases in an organization"""
+        search_term: Optional[str] = None,
+        before_created_at: Optional[datetime] = None,
+        before_id: Optional[int] = None
+) -> List[Row]:
+    """Get summary rows of observables across an organization
+
+    Supports the same before_created_at/before_id keyset as get_case_observables.
+    """
     try:
-        # Join with Case to filter by organization
-        query = (
-            select(Observable)
-            .join(Case, Observable.case_id == Case.id)
-            .filter(Case.organization_id == organization_id)
-        )
-
-        # Apply filters
-        if data_type_filter:
-            query = query.filter(Observable.data_type == data_type_filter)
-
-        if is_ioc_filter is not None:
-            query = query.filter(Observable.is_ioc == is_ioc_filter)
-
-        if search_term:
-            search_pattern = f"%{search_term}%"
-            query = query.filter(
-                or_(
-                    Observable.data.ilike(search_pattern),
-                    Observable.message.ilike(search_pattern),
-                    Observable.source.ilike(search_pattern)
-                )
-            )
-
-        # Order by created_at desc
-        query = query.order_by(Observable.created_at.desc())
-
-        # Add pagination
-        query = query.offset(skip).limit(limit)
-
-        # Load relationships
-        query = query.options(
-            joinedload(Observable.case),
-            joinedload(Observable.created_by)
+        stmt = lambda_stmt(lambda: _OBSERVABLE_LIST.where(Observable.organization_id == organization_id))
+        stmt = _filter_observable_list(
+            stmt, skip, limit, data_type_filter, is_ioc_filter,
+            search_term, before_created_at, before_id
         )
 
-        result = await db.execute(query)
-        return result.scalars().unique().all()
+        result = await db.execute(stmt)
+        return result.all()
 
     except Exception as e:
         logger.error(f"Error retrieving global observables: {e}")
@@ -135,7 +167,8 @@ async def create_observable(
         db: AsyncSession,
         observable_data: ObservableCreate,
         case_id: Optional[int],
-        creator_id: int
+        creator_id: int,
+        organization_id: int
 ) -> Observable:
     """Create a new observable"""
     try:
@@ -151,14 +184,15 @@ async def create_observable(
             sighted=observable_data.sighted,
             ignore_similarity=observable_data.ignore_similarity,
             case_id=case_id,
+            organization_id=organization_id,
             created_by_id=creator_id
         )
 
         db.add(observable)
         await db.commit()
-        await db.refresh(observable)
+        _ioc_stats_cache.pop(case_id)
 
-        # Load relationships
+        # Timestamps come back via eager_defaults; only relationships need loading
         if case_id:
             await db.refresh(observable, ["case", "created_by"])
         else:
@@ -177,27 +211,40 @@ async def update_observable(
         db: AsyncSession,
         observable: Observable,
         updates: ObservableUpdate,
-        editor_id: int
+        editor_id: int,
+        load_relationships: bool = False
 ) -> Observable:
-    """Update observable details"""
-    try:
-        update_data = updates.dict(exclude_unset=True)
+    """Update observable details
 
-        # Update fields
-        for field, value in update_data.items():
-            if hasattr(observable, field):
-                if field == 'data' and value:
-                    value = value.strip()
-                setattr(observable, field, value)
+    ObservableUpdate only carries scalar columns, and the session does not
+    expire on commit, so relationships already loaded on the instance stay
+    valid. Pass load_relationships=True to reload case/created_by anyway
+    (one extra SELECT) when the caller obtained the instance without them.
+    """
+    try:
+        update_data = updates.model_dump(exclude_unset=True)
+        if update_data.get('data'):
+            update_data['data'] = update_data['data'].strip()
+
+        if update_data:
+            # Single UPDATE instead of ORM attribute diffing; every ObservableUpdate field is a column
+            result = await db.execute(
+                update(Observable)
+                .where(Observable.id == observable.id)
+                .values(**update_data)
+                .returning(Observable.updated_at)
+                .execution_options(synchronize_session=False)
+            )
+            updated_at = result.scalar_one()
+            await db.commit()
 
-        await db.commit()
-        await db.refresh(observable)
+            for field, value in update_data.items():
+                set_committed_value(observable, field, value)
+            set_committed_value(observable, 'updated_at', updated_at)
+            _ioc_stats_cache.pop(observable.case_id)
 
-        # Reload relationships
-        if observable.case_id:
-            await db.refresh(observable, ["case", "created_by"])
-        else:
-            await db.refresh(observable, ["created_by"])
+        if load_relationships:
+            await db.refresh(observable, ["case", "created_by"] if observable.case_id else ["created_by"])
 
         logger.info(f"Observable {observable.data} updated by user {editor_id}")
         return observable
@@ -213,6 +260,7 @@ async def delete_observable(db: AsyncSession, observable: Observable) -> bool:
     try:
         await db.delete(observable)
         await db.commit()
+        _ioc_stats_cache.pop(observable.case_id)
         logger.info(f"Observable {observable.data} deleted")
         return True
 
@@ -225,9 +273,19 @@ async def delete_observable(db: AsyncSession, observable: Observable) -> bool:
 async def increment_sighted_count(db: AsyncSession, observable: Observable) -> Observable:
     """Increment the sighted count for an observable"""
     try:
-        observable.sighted_count += 1
+        # Atomic in SQL so concurrent sightings are not lost
+        result = await db.execute(
+            update(Observable)
+            .where(Observable.id == observable.id)
+            .values(sighted_count=Observable.sighted_count + 1)
+            .returning(Observable.sighted_count, Observable.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        sighted_count, updated_at = result.one()
         await db.commit()
-        await db.refresh(observable)
+
+        set_committed_value(observable, 'sighted_count', sighted_count)
+        set_committed_value(observable, 'updated_at', updated_at)
         
         logger.info(f"Observable {observable.data} sighted count incremented to {observable.sighted_count}")
         return observable
@@ -238,35 +296,65 @@ async def increment_sighted_count(db: AsyncSession, observable: Observable) -> O
         raise
 
 
-async def find_similar_observables(
+def _similar_observables_stmt(
+        data: str,
+        data_type: ObservableType,
+        organization_id: int,
+        exclude_observable_id: Optional[int]
+):
+    query = (
+        select(Observable)
+        .filter(
+            Observable.organization_id == organization_id,
+            Observable.data_type == data_type,
+            func.lower(Observable.data).like(f"%{data.strip().lower()}%")
+        )
+    )
+
+    if exclude_observable_id:
+        query = query.filter(Observable.id != exclude_observable_id)
+
+    return query.options(
+        selectinload(Observable.case),
+        selectinload(Observable.created_by)
+    ).order_by(Observable.created_at.desc(), Observable.id.desc())
+
+
+async def stream_similar_observables(
         db: AsyncSession,
         data: str,
         data_type: ObservableType,
         organization_id: int,
         exclude_observable_id: Optional[int] = None
-) -> List[Observable]:
-    """Find similar observables in the organization"""
+) -> AsyncIterator[Observable]:
+    """Yield every similar observable, holding at most one batch in memory"""
     try:
-        query = (
-            select(Observable)
-            .join(Case, Observable.case_id == Case.id)
-            .filter(
-                Case.organization_id == organization_id,
-                Observable.data_type == data_type,
-                Observable.data.ilike(f"%{data.strip()}%")
-            )
+        result = await db.stream_scalars(
+            _similar_observables_stmt(data, data_type, organization_id, exclude_observable_id)
+            .execution_options(yield_per=_STREAM_BATCH_SIZE)
         )
+        async for observable in result:
+            yield observable
 
-        if exclude_observable_id:
-            query = query.filter(Observable.id != exclude_observable_id)
+    except Exception as e:
+        logger.error(f"Error streaming similar observables: {e}")
+        raise
 
-        query = query.options(
-            joinedload(Observable.case),
-            joinedload(Observable.created_by)
-        )
 
-        result = await db.execute(query)
-        return result.scalars().unique().all()
+async def find_similar_observables(
+        db: AsyncSession,
+        data: str,
+        data_type: ObservableType,
+        organization_id: int,
+        exclude_observable_id: Optional[int] = None,
+        limit: int = 100
+) -> List[Observable]:
+    """Find the most recent similar observables in the organization"""
+    try:
+        query = _similar_observables_stmt(data, data_type, organization_id, exclude_observable_id)
+
+        result = await db.execute(query.limit(limit))
+        return result.scalars().all()
 
     except Exception as e:
         logger.error(f"Error finding similar observables: {e}")
@@ -275,36 +363,34 @@ async def find_similar_observables(
 
 async def get_ioc_stats_by_case(db: AsyncSession, case_id: int) -> Dict[str, int]:
     """Get IOC statistics for a case"""
-    try:
-        # Count observables by type
-        total_count = await db.scalar(
-            select(func.count(Observable.id)).filter(Observable.case_id == case_id)
-        )
+    cached = _ioc_stats_cache.get(case_id)
+    if cached is not None:
+        return cached
 
-        ioc_count = await db.scalar(
-            select(func.count(Observable.id)).filter(
-                Observable.case_id == case_id,
-                Observable.is_ioc == True
-            )
+    try:
+        # One grouped scan, folded per type and IOC flag
+        result = await db.execute(
+            select(Observable.data_type, Observable.is_ioc, func.count(Observable.id))
+            .filter(Observable.case_id == case_id)
+            .group_by(Observable.data_type, Observable.is_ioc)
         )
 
-        # Count by data type
-        type_counts = {}
-        for obs_type in ObservableType:
-            count = await db.scalar(
-                select(func.count(Observable.id)).filter(
-                    Observable.case_id == case_id,
-                    Observable.data_type == obs_type
-                )
-            )
-            type_counts[obs_type.value] = count or 0
-
-        return {
-            "total": total_count or 0,
-            "ioc": ioc_count or 0,
-            "artifacts": (total_count or 0) - (ioc_count or 0),
+        total_count = ioc_count = 0
+        type_counts = {obs_type.value: 0 for obs_type in ObservableType}
+        for data_type, is_ioc, count in result:
+            total_count += count
+            if is_ioc:
+                ioc_count += count
+            type_counts[data_type.value] += count
+
+        stats = {
+            "total": total_count,
+            "ioc": ioc_count,
+            "artifacts": total_count - ioc_count,
             "by_type": type_counts
         }
+        _ioc_stats_cache.set(case_id, stats)
+        return stats
 
     except Exception as e:
         logger.error(f"Error getting IOC stats for case {case_id}: {e}")
@@ -318,23 +404,31 @@ async def bulk_update_observable_tags(
         case_id: int
 ) -> int:
     """Bulk update tags for multiple observables"""
+    if not observable_uuids:
+        return 0
+
     try:
-        # Get observables to update
-        result = await db.execute(
-            select(Observable).filter(
-                Observable.uuid.in_(observable_uuids),
-                Observable.case_id == case_id
-            )
-        )
-        observables = result.scalars().all()
+        # Merge tags server-side: union of existing and new, without duplicates
+        empty = cast('[]', JSONB)
+        elements = func.jsonb_array_elements_text(
+            func.coalesce(cast(Observable.tags, JSONB), empty).op('||')(literal(tags, JSONB))
+        ).table_valued('value')
+        merged = select(
+            func.coalesce(func.jsonb_agg(distinct(elements.c.value)), empty)
+        ).scalar_subquery()
 
         updated_count = 0
-        for observable in observables:
-            # Merge tags (add new ones without duplicates)
-            existing_tags = set(observable.tags or [])
-            new_tags = set(tags)
-            observable.tags = list(existing_tags.union(new_tags))
-            updated_count += 1
+        for batch in batched(observable_uuids, settings.BULK_BATCH_SIZE):
+            result = await db.execute(
+                update(Observable)
+                .where(
+                    Observable.uuid.in_(batch),
+                    Observable.case_id == case_id
+                )
+                .values(tags=cast(merged, JSON))
+                .execution_options(synchronize_session=False)
+            )
+            updated_count += result.rowcount
 
         await db.commit()
         logger.info(f"Bulk updated tags for {updated_count} observables")
@@ -353,22 +447,25 @@ async def bulk_mark_as_ioc(
         is_ioc: bool = True
 ) -> int:
     """Bulk mark observables as IOC or artifact"""
-    try:
-        # Get observables to update
-        result = await db.execute(
-            select(Observable).filter(
-                Observable.uuid.in_(observable_uuids),
-                Observable.case_id == case_id
-            )
-        )
-        observables = result.scalars().all()
+    if not observable_uuids:
+        return 0
 
+    try:
         updated_count = 0
-        for observable in observables:
-            observable.is_ioc = is_ioc
-            updated_count += 1
+        for batch in batched(observable_uuids, settings.BULK_BATCH_SIZE):
+            result = await db.execute(
+                update(Observable)
+                .where(
+                    Observable.uuid.in_(batch),
+                    Observable.case_id == case_id
+                )
+                .values(is_ioc=is_ioc)
+                .execution_options(synchronize_session=False)
+            )
+            updated_count += result.rowcount
 
         await db.commit()
+        _ioc_stats_cache.pop(case_id)
         logger.info(f"Bulk marked {updated_count} observables as {'IOC' if is_ioc else 'artifact'}")
         return updated_count
 
@@ -378,42 +475,74 @@ async def bulk_mark_as_ioc(
         return 0
 
 
+def _search_observables_stmt(
+        search_data: str,
+        organization_id: int,
+        exact_match: bool,
+        data_type_filter: Optional[ObservableType],
+        is_ioc_filter: Optional[bool]
+) -> StatementLambdaElement:
+    stmt = lambda_stmt(lambda: select(Observable).where(Observable.organization_id == organization_id))
+
+    if exact_match:
+        search_value = search_data.strip()
+        stmt += lambda s: s.where(Observable.data == search_value)
+    else:
+        search_pattern = f"%{search_data.strip().lower()}%"
+        stmt += lambda s: s.where(func.lower(Observable.data).like(search_pattern))
+
+    if data_type_filter:
+        stmt += lambda s: s.where(Observable.data_type == data_type_filter)
+
+    if is_ioc_filter is not None:
+        stmt += lambda s: s.where(Observable.is_ioc == is_ioc_filter)
+
+    stmt += lambda s: s.options(
+        selectinload(Observable.case),
+        selectinload(Observable.created_by)
+    ).order_by(Observable.created_at.desc(), Observable.id.desc())
+    return stmt
+
+
+async def stream_observables_by_data(
+        db: AsyncSession,
+        search_data: str,
+        organization_id: int,
+        exact_match: bool = False,
+        data_type_filter: Optional[ObservableType] = None,
+        is_ioc_filter: Optional[bool] = None
+) -> AsyncIterator[Observable]:
+    """Yield every observable matching a data value, holding at most one batch in memory"""
+    try:
+        result = await db.stream_scalars(
+            _search_observables_stmt(search_data, organization_id, exact_match, data_type_filter, is_ioc_filter),
+            execution_options={"yield_per": _STREAM_BATCH_SIZE}
+        )
+        async for observable in result:
+            yield observable
+
+    except Exception as e:
+        logger.error(f"Error streaming observables by data: {e}")
+        raise
+
+
 async def search_observables_by_data(
         db: AsyncSession,
         search_data: str,
         organization_id: int,
-        exact_match: bool = False
+        exact_match: bool = False,
+        data_type_filter: Optional[ObservableType] = None,
+        is_ioc_filter: Optional[bool] = None,
+        limit: int = 100
 ) -> List[Observable]:
-    """Search observables by data value across organization"""
+    """Search the most recent observables by data value across organization"""
     try:
-        if exact_match:
-            query = (
-                select(Observable)
-                .join(Case, Observable.case_id == Case.id)
-                .filter(
-                    Case.organization_id == organization_id,
-                    Observable.data == search_data.strip()
-                )
-            )
-        else:
-            search_pattern = f"%{search_data.strip()}%"
-            query = (
-                select(Observable)
-                .join(Case, Observable.case_id == Case.id)
-                .filter(
-                    Case.organization_id == organization_id,
-                    Observable.data.ilike(search_pattern)
-                )
-            )
-
-        query = query.options(
-            joinedload(Observable.case),
-            joinedload(Observable.created_by)  
-        ).order_by(Observable.created_at.desc())
+        stmt = _search_observables_stmt(search_data, organization_id, exact_match, data_type_filter, is_ioc_filter)
+        stmt += lambda s: s.limit(limit)
 
-        result = await db.execute(query)
-        return result.scalars().unique().all()
+        result = await db.execute(stmt)
+        return result.scalars().all()
 
     except Exception as e:
         logger.error(f"Error searching observables by data: {e}")
-        return []
\ No newline at end of file
+        return []
@@ -1,14 +1,25 @@
 # app/db/crud/organization.py
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 from loguru import logger
 
 from app.db.models import Organization, UserOrganization, User, Case, UserRole
 from app.api.v1.schemas.organizations import OrganizationCreate, OrganizationUpdate
+from app.core.cache import TTLCache
+
+# Member/case counts for dashboards; dropped on membership changes and case creation
+_organization_stats_cache = TTLCache(maxsize=1024, ttl=60)
+
+
+def invalidate_organization_stats(org_id: int) -> None:
+    """Drop cached statistics for an organization"""
+    _organization_stats_cache.pop(org_id)
 
 
 async def get_organization_by_uuid(db: AsyncSession, org_uuid: UUID) -> Optional[Organization]:
@@ -26,6 +37,16 @@ async def get_organization_by_uuid(db: AsyncSession, org_uuid: UUID) -> Optional
         return None
 
 
+async def get_organizations_by_uuids(db: AsyncSession, org_uuids: List[UUID]) -> List[Organization]:
+    """Get organizations for a batch of UUIDs in one query, in no particular order"""
+    if not org_uuids:
+        return []
+    result = await db.execute(
+        select(Organization).filter(Organization.uuid.in_(org_uuids))
+    )
+    return result.scalars().all()
+
+
 async def get_organization_by_name(db: AsyncSession, name: str) -> Optional[Organization]:
     """Get organization by name"""
     try:
@@ -49,14 +70,14 @@ async def get_user_organizations(
         result = await db.execute(
             select(UserOrganization)
             .options(
-                joinedload(UserOrganization.organization),
-                joinedload(UserOrganization.user)
+                selectinload(UserOrganization.organization),
+                selectinload(UserOrganization.user)
             )
             .filter(UserOrganization.user_id == user_id)
             .offset(skip)
             .limit(limit)
         )
-        return result.scalars().unique().all()
+        return result.scalars().all()
     except Exception as e:
         logger.error(f"Error retrieving user organizations: {e}")
         return []
@@ -140,14 +161,23 @@ async def update_organization(
 ) -> Organization:
     """Update organization details"""
     try:
-        update_data = updates.dict(exclude_unset=True)
+        update_data = updates.model_dump(exclude_unset=True)
+
+        if update_data:
+            # Single UPDATE instead of ORM attribute diffing plus a refresh SELECT
+            result = await db.execute(
+                update(Organization)
+                .where(Organization.id == org.id)
+                .values(**update_data)
+                .returning(Organization.updated_at)
+                .execution_options(synchronize_session=False)
+            )
+            updated_at = result.scalar_one()
+            await db.commit()
 
-        for field, value in update_data.items():
-            if hasattr(org, field):
-                setattr(org, field, value)
-
-        await db.commit()
-        await db.refresh(org)
+            for field, value in update_data.items():
+                set_committed_value(org, field, value)
+            set_committed_value(org, 'updated_at', updated_at)
 
         logger.info(f"Organization updated: {org.name}")
         return org
@@ -166,26 +196,19 @@ async def add_organization_member(
 ) -> UserOrganization:
     """Add user to organization with specified role"""
     try:
-        # Check if already a member
-        existing = await db.execute(
-            select(UserOrganization).filter(
-                UserOrganization.organization_id == org_id,
-                UserOrganization.user_id == user_id
-            )
+        # The unique (user_id, organization_id) index rejects existing members in the same round trip
+        result = await db.execute(
+            pg_insert(UserOrganization)
+            .values(user_id=user_id, organization_id=org_id, role=role)
+            .on_conflict_do_nothing(index_elements=[UserOrganization.user_id, UserOrganization.organization_id])
+            .returning(UserOrganization)
         )
-
-        if existing.scalars().first():
+        membership = result.scalar_one_or_none()
+        if membership is None:
             raise ValueError("User is already a member of this organization")
 
-        membership = UserOrganization(
-            user_id=user_id,
-            organization_id=org_id,
-            role=role
-        )
-
-        db.add(membership)
         await db.commit()
-        await db.refresh(membership)
+        invalidate_organization_stats(org_id)
 
         # Load relationships
         await db.refresh(membership, ["user", "organization"])
@@ -219,6 +242,7 @@ async def remove_organization_member(
 
         await db.delete(membership)
         await db.commit()
+        invalidate_organization_stats(org_id)
 
         logger.info(f"User {user_id} removed from org {org_id}")
         return True
@@ -231,23 +255,33 @@ async def remove_organization_member(
 
 async def get_organization_stats(db: AsyncSession, org_id: int) -> Dict[str, int]:
     """Get organization statistics"""
+    cached = _organization_stats_cache.get(org_id)
+    if cached is not None:
+        return cached
+
     try:
-        # Member count
-        member_count = await db.scalar(
+        # Both counts as scalar subqueries of one SELECT: one round trip, one snapshot
+        member_count = (
             select(func.count(UserOrganization.id))
             .filter(UserOrganization.organization_id == org_id)
+            .scalar_subquery()
         )
-
-        # Case count
-        case_count = await db.scalar(
+        case_count = (
             select(func.count(Case.id))
             .filter(Case.organization_id == org_id)
+            .scalar_subquery()
+        )
+        result = await db.execute(
+            select(member_count.label("member_count"), case_count.label("case_count"))
         )
+        row = result.one()
 
-        return {
-            "member_count": member_count or 0,
-            "case_count": case_count or 0
+        stats = {
+            "member_count": row.member_count or 0,
+            "case_count": row.case_count or 0
         }
+        _organization_stats_cache.set(org_id, stats)
+        return stats
 
     except Exception as e:
         logger.error(f"Error getting organization stats: {e}")
@@ -1,11 +1,12 @@
 # app/db/crud/task.py
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func, and_, or_
-from sqlalchemy.orm import joinedload
+from sqlalchemy import func, and_, or_, tuple_, delete, update, values, column, Integer
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import joinedload, selectinload
 from typing import Optional, List, Dict, Any
 from uuid import UUID
-from datetime import datetime, timezone
+from datetime import datetime
 from loguru import logger
 
 from app.db.models import Task, Case, User
@@ -37,9 +38,15 @@ async def get_case_tasks(
         skip: int = 0,
         limit: int = 50,
         status_filter: Optional[TaskStatus] = None,
-        assignee_id: Optional[int] = None
+        assignee_id: Optional[int] = None,
+        after_order_index: Optional[int] = None,
+        after_created_at: Optional[datetime] = None
 ) -> List[Task]:
-    """Get tasks for a case with filters"""
+    """Get tasks for a case with filters
+
+    Passing the (order_index, created_at) of the last task of the previous page
+    as after_order_index/after_created_at seeks to the next page instead of offsetting.
+    """
     try:
         query = select(Task).filter(Task.case_id == case_id)
 
@@ -57,16 +64,22 @@ async def get_case_tasks(
         query = query.order_by(Task.order_index.asc(), Task.created_at.asc())
 
         # Add pagination
-        query = query.offset(skip).limit(limit)
+        if after_order_index is not None and after_created_at is not None:
+            query = query.filter(
+                tuple_(Task.order_index, Task.created_at) > tuple_(after_order_index, after_created_at)
+            )
+        else:
+            query = query.offset(skip)
+        query = query.limit(limit)
 
         # Load relationships
         query = query.options(
-            joinedload(Task.assignee),
-            joinedload(Task.created_by)
+            selectinload(Task.assignee),
+            selectinload(Task.created_by)
         )
 
         result = await db.execute(query)
-        return result.scalars().unique().all()
+        return result.scalars().all()
 
     except Exception as e:
         logger.error(f"Error retrieving case tasks: {e}")
@@ -78,16 +91,23 @@ async def create_task(
         task_data: TaskCreate,
         case_id: int,
         creator_id: int,
-        assignee_id: Optional[int] = None
+        assignee_id: Optional[int] = None,
+        load_relationships: bool = True
 ) -> Task:
-    """Create a new task"""
+    """Create a new task
+
+    id and the timestamps come back with the INSERT (eager_defaults), so the
+    row itself is never re-read. Pass load_relationships=False when the caller
+    does not need case/assignee/created_by to skip loading them.
+    """
     try:
-        # Get the next order index for this case
-        max_order = await db.scalar(
-            select(func.coalesce(func.max(Task.order_index), -1))
+        # Next order index is computed inside the INSERT itself (one statement,
+        # fetched back with RETURNING) rather than by a separate SELECT max()
+        next_order = (
+            select(func.coalesce(func.max(Task.order_index), -1) + 1)
             .filter(Task.case_id == case_id)
+            .scalar_subquery()
         )
-        next_order = (max_order or -1) + 1
 
         # Create task
         task = Task(
@@ -104,10 +124,9 @@ async def create_task(
 
         db.add(task)
         await db.commit()
-        await db.refresh(task)
 
-        # Load relationships
-        await db.refresh(task, ["case", "assignee", "created_by"])
+        if load_relationships:
+            await db.refresh(task, ["case", "assignee", "created_by"])
 
         logger.info(f"Task created: {task.title} for case {case_id} by user {creator_id}")
         return task
@@ -127,27 +146,19 @@ async def update_task(
     """Update task details"""
     try:
         update_data = updates.dict(exclude_unset=True)
-
-        # Handle status change to completed
-        if 'status' in update_data:
-            new_status = update_data['status']
-            if new_status == TaskStatus.COMPLETED and task.status != TaskStatus.COMPLETED:
-                task.completed_at = datetime.now(timezone.utc)
-            elif new_status != TaskStatus.COMPLETED and task.status == TaskStatus.COMPLETED:
-                task.completed_at = None
+        previous_assignee_id = task.assignee_id
 
         # Handle assignee by email
         if 'assignee_email' in update_data:
             assignee_email = update_data.pop('assignee_email')
             if assignee_email:
-                # Find user by email
-                user_result = await db.execute(
-                    select(User).filter(User.email == assignee_email)
+                # Resolve just the id; no User entity is hydrated
+                assignee_id = await db.scalar(
+                    select(User.id).filter(User.email == assignee_email)
                 )
-                assignee = user_result.scalars().first()
-                if not assignee:
+                if assignee_id is None:
                     raise ValueError(f"User with email {assignee_email} not found")
-                task.assignee_id = assignee.id
+                task.assignee_id = assignee_id
             else:
                 task.assignee_id = None
 
@@ -156,11 +167,13 @@ async def update_task(
             if hasattr(task, field):
                 setattr(task, field, value)
 
+        assignee_changed = task.assignee_id != previous_assignee_id
+
         await db.commit()
-        await db.refresh(task)
 
-        # Reload relationships
-        await db.refresh(task, ["case", "assignee", "created_by"])
+        # Only the assignee can change here; case and created_by stay valid
+        if assignee_changed:
+            await db.refresh(task, ["assignee"])
 
         logger.info(f"Task {task.title} updated by user {editor_id}")
         return task
@@ -185,6 +198,38 @@ async def delete_task(db: AsyncSession, task: Task) -> bool:
         return False
 
 
+async def delete_task_by_uuid(
+        db: AsyncSession,
+        task_uuid: UUID,
+        organization_id: int
+) -> Optional[int]:
+    """Delete a task by UUID without loading it, scoped to the organization's cases
+
+    Returns the deleted task's id, or None when no such task exists in the organization.
+    """
+    try:
+        result = await db.execute(
+            delete(Task)
+            .where(
+                Task.uuid == task_uuid,
+                Task.case_id.in_(select(Case.id).filter(Case.organization_id == organization_id))
+            )
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        )
+        task_id = result.scalar_one_or_none()
+        await db.commit()
+
+        if task_id is not None:
+            logger.info(f"Task {task_uuid} deleted")
+        return task_id
+
+    except Exception as e:
+        logger.error(f"Failed to delete task {task_uuid}: {e}")
+        await db.rollback()
+        raise
+
+
 async def reorder_tasks(
         db: AsyncSession,
         case_id: int,
@@ -193,21 +238,25 @@ async def reorder_tasks(
     """Reorder tasks in a case"""
     try:
         # task_orders should be list of {"task_uuid": UUID, "order_index": int}
-        for task_order in task_orders:
-            task_uuid = task_order["task_uuid"]
-            new_order = task_order["order_index"]
-            
-            # Update the task order
-            result = await db.execute(
-                select(Task).filter(
-                    Task.uuid == task_uuid,
-                    Task.case_id == case_id
-                )
-            )
-            task = result.scalars().first()
-            
-            if task:
-                task.order_index = new_order
+        if not task_orders:
+            return True
+
+        # One UPDATE ... FROM (VALUES ...) instead of a SELECT and UPDATE per task
+        new_orders = values(
+            column("uuid", PG_UUID(as_uuid=True)),
+            column("order_index", Integer),
+            name="new_orders"
+        ).data([
+            (UUID(str(task_order["task_uuid"])), task_order["order_index"])
+            for task_order in task_orders
+        ])
+
+        await db.execute(
+            update(Task)
+            .where(Task.case_id == case_id, Task.uuid == new_orders.c.uuid)
+            .values(order_index=new_orders.c.order_index)
+            .execution_options(synchronize_session=False)
+        )
 
         await db.commit()
         logger.info(f"Tasks reordered for case {case_id}")
@@ -245,12 +294,12 @@ async def get_user_assigned_tasks(
         query = query.offset(skip).limit(limit)
 
         query = query.options(
-            joinedload(Task.case),
-            joinedload(Task.created_by)
+            selectinload(Task.case),
+            selectinload(Task.created_by)
         )
 
         result = await db.execute(query)
-        return result.scalars().unique().all()
+        return result.scalars().all()
 
     except Exception as e:
         logger.error(f"Error getting user assigned tasks: {e}")
@@ -260,37 +309,19 @@ async def get_user_assigned_tasks(
 async def get_task_stats_by_case(db: AsyncSession, case_id: int) -> Dict[str, int]:
     """Get task statistics for a case"""
     try:
-        # Count tasks by status
-        pending_count = await db.scalar(
-            select(func.count(Task.id)).filter(
-                Task.case_id == case_id,
-                Task.status == TaskStatus.PENDING
-            )
-        )
-
-        in_progress_count = await db.scalar(
-            select(func.count(Task.id)).filter(
-                Task.case_id == case_id,
-                Task.status == TaskStatus.IN_PROGRESS
-            )
-        )
-
-        completed_count = await db.scalar(
-            select(func.count(Task.id)).filter(
-                Task.case_id == case_id,
-                Task.status == TaskStatus.COMPLETED
-            )
-        )
-
-        total_count = await db.scalar(
-            select(func.count(Task.id)).filter(Task.case_id == case_id)
+        # One grouped scan over (case_id, status), folded per status
+        result = await db.execute(
+            select(Task.status, func.count(Task.id))
+            .filter(Task.case_id == case_id)
+            .group_by(Task.status)
         )
+        counts = dict(result.all())
 
         return {
-            "total": total_count or 0,
-            "pending": pending_count or 0,
-            "in_progress": in_progress_count or 0,
-            "completed": completed_count or 0
+            "total": sum(counts.values()),
+            "pending": counts.get(TaskStatus.WAITING, 0),
+            "in_progress": counts.get(TaskStatus.IN_PROGRESS, 0),
+            "completed": counts.get(TaskStatus.COMPLETED, 0)
         }
 
     except Exception as e:
@@ -306,27 +337,17 @@ async def bulk_update_task_status(
 ) -> int:
     """Bulk update task status for multiple tasks"""
     try:
-        # Get tasks to update
+        if not task_uuids:
+            return 0
+
+        # completed_at is maintained by the tasks_completion trigger
         result = await db.execute(
-            select(Task).filter(
-                Task.uuid.in_(task_uuids),
-                Task.case_id == case_id
-            )
+            update(Task)
+            .where(Task.uuid.in_(task_uuids), Task.case_id == case_id)
+            .values(status=new_status)
+            .execution_options(synchronize_session=False)
         )
-        tasks = result.scalars().all()
-
-        updated_count = 0
-        for task in tasks:
-            old_status = task.status
-            task.status = new_status
-            
-            # Handle completion timestamp
-            if new_status == TaskStatus.COMPLETED and old_status != TaskStatus.COMPLETED:
-                task.completed_at = datetime.now(timezone.utc)
-            elif new_status != TaskStatus.COMPLETED and old_status == TaskStatus.COMPLETED:
-                task.completed_at = None
-                
-            updated_count += 1
+        updated_count = result.rowcount
 
         await db.commit()
         logger.info(f"Bulk updated {updated_count} tasks to status {new_status.value}")
@@ -1,13 +1,53 @@
 import asyncio
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any
-from sqlalchemy.ext.asyncio import AsyncSession
+import time
+from datetime import datetime
+from typing import Optional, Dict, Any, Set
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.future import select
-from sqlalchemy import delete, and_, or_  # Removed text import
+from sqlalchemy import delete, update, or_, func, any_, exists, literal_column, bindparam
+from sqlalchemy.orm.attributes import set_committed_value
 from loguru import logger
 
+from app.db.database import AsyncSessionLocal, engine
 from app.db.models import RefreshToken, BlacklistedToken
 from app.auth.security import Hasher
+from app.core.cache import BloomFilter, TTLCache
+from app.core.config import settings
+
+# jtis confirmed not blacklisted, so the per-request check can skip the database.
+# Only trusted while this worker is LISTENing on _BLACKLIST_CHANNEL: every
+# add_to_blacklist NOTIFYs on commit and each worker evicts the jti on receipt.
+_jti_not_blacklisted = TTLCache(maxsize=50_000, ttl=settings.JTI_BLACKLIST_CACHE_TTL)
+_BLACKLIST_CHANNEL = "jti_blacklist"
+_LISTENER_HEARTBEAT = 5.0
+# monotonic time the current LISTEN connection was established; None while not listening
+_listener_connected_at: Optional[float] = None
+# bumped on every eviction and reconnect, so a lookup racing a logout is not cached
+_invalidation_seq = 0
+
+# Per-worker bloom filter of live blacklisted jtis, rebuilt from the table every
+# JTI_BLACKLIST_CACHE_TTL seconds and fed every NOTIFY in between. A filter miss
+# means "not blacklisted" only if its snapshot began after the current LISTEN
+# connection came up; otherwise it may lack jtis and every check hits the database.
+_blacklist_filter: Optional[BloomFilter] = None
+_blacklist_filter_built_at: Optional[float] = None
+_blacklist_rebuild_added: Optional[Set[str]] = None
+_FILTER_BATCH_SIZE = 5000
+
+# Per-request auth lookups built once; each call only binds the parameter
+_ACTIVE_REFRESH_TOKEN_BY_HASH = select(RefreshToken).filter(
+    RefreshToken.token_hash == bindparam('token_hash'),
+    RefreshToken.revoked_at.is_(None),
+    RefreshToken.expires_at > func.now()
+)
+_LIVE_BLACKLISTED_JTIS = select(BlacklistedToken.jti).filter(BlacklistedToken.expires_at > func.now())
+# SELECT EXISTS(...): a boolean straight from the index, no row hydration
+_JTI_BLACKLISTED = select(
+    exists().where(
+        BlacklistedToken.jti == bindparam('jti'),
+        BlacklistedToken.expires_at > func.now()
+    )
+)
 
 
 async def create_refresh_token_db(
@@ -44,15 +84,7 @@ async def get_refresh_token_by_hash(db: AsyncSession, token_hash: str) -> Option
     Enhanced with logging.
     """
     try:
-        result = await db.execute(
-            select(RefreshToken).filter(
-                and_(
-                    RefreshToken.token_hash == token_hash,
-                    RefreshToken.revoked_at.is_(None),
-                    RefreshToken.expires_at > datetime.now(timezone.utc)
-                )
-            )
-        )
+        result = await db.execute(_ACTIVE_REFRESH_TOKEN_BY_HASH, {'token_hash': token_hash})
         token = result.scalars().first()
         if token:
             logger.debug(f"Valid refresh token found for user {token.user_id}")
@@ -68,9 +100,19 @@ async def revoke_refresh_token_db(db: AsyncSession, refresh_token_record: Refres
     Enhanced with error handling.
     """
     try:
-        refresh_token_record.revoked_at = datetime.now(timezone.utc)
+        # One UPDATE on the database clock; RETURNING replaces the refresh SELECT
+        result = await db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.id == refresh_token_record.id)
+            .values(revoked_at=func.now())
+            .returning(RefreshToken.revoked_at, RefreshToken.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        revoked_at, updated_at = result.one()
         await db.commit()
-        await db.refresh(refresh_token_record)
+
+        set_committed_value(refresh_token_record, 'revoked_at', revoked_at)
+        set_committed_value(refresh_token_record, 'updated_at', updated_at)
         logger.info(f"Refresh token revoked for user {refresh_token_record.user_id}")
         return refresh_token_record
     except Exception as e:
@@ -79,49 +121,48 @@ async def revoke_refresh_token_db(db: AsyncSession, refresh_token_record: Refres
         raise
 
 
-async def delete_expired_refresh_tokens(db: AsyncSession, batch_size: int = 1000) -> int:
+async def _delete_expired(db: AsyncSession, model, condition, batch_size: Optional[int]) -> int:
+    """Delete rows matching condition; one statement, or ctid-addressed batches when batch_size is set"""
+    if batch_size is None:
+        result = await db.execute(
+            delete(model).where(condition).execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        return result.rowcount
+
+    # ctid = ANY(ARRAY(...)) addresses each batch by physical row, avoiding an id IN (...) rescan
+    ctid = literal_column("ctid")
+    total_deleted = 0
+    while True:
+        batch = select(ctid).select_from(model).where(condition).limit(batch_size).scalar_subquery()
+        result = await db.execute(
+            delete(model)
+            .where(ctid == any_(func.array(batch)))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        total_deleted += result.rowcount
+
+        if result.rowcount < batch_size:
+            return total_deleted
+
+
+async def delete_expired_refresh_tokens(db: AsyncSession, batch_size: Optional[int] = None) -> int:
     """
     Deletes refresh tokens that have expired or been revoked.
-    Uses subquery approach for batch operations.
+    Uses a single DELETE unless batch_size is given.
     Returns the number of deleted tokens.
     """
     try:
-        total_deleted = 0
-
-        while True:
-            # Get IDs of tokens to delete in this batch
-            subquery = (
-                select(RefreshToken.id)
-                .where(
-                    or_(
-                        RefreshToken.expires_at <= datetime.now(timezone.utc),
-                        RefreshToken.revoked_at.isnot(None)
-                    )
-                )
-                .limit(batch_size)
-            )
-
-            # Delete using the subquery
-            result = await db.execute(
-                delete(RefreshToken)
-                .where(RefreshToken.id.in_(subquery))
-            )
-
-            deleted_count = result.rowcount
-            total_deleted += deleted_count
-
-            # Commit this batch
-            await db.commit()
-
-            logger.info(f"Deleted batch of {deleted_count} expired refresh tokens")
-
-            # If we deleted less than batch_size, we're done
-            if deleted_count < batch_size:
-                break
-
-            # Small delay between batches to prevent overwhelming the database
-            if deleted_count == batch_size:  # Only sleep if there might be more batches
-                await asyncio.sleep(0.1)
+        total_deleted = await _delete_expired(
+            db,
+            RefreshToken,
+            or_(
+                RefreshToken.expires_at <= func.now(),
+                RefreshToken.revoked_at.isnot(None)
+            ),
+            batch_size
+        )
 
         logger.info(f"Total expired refresh tokens deleted: {total_deleted}")
         return total_deleted
@@ -140,8 +181,11 @@ async def add_to_blacklist(db: AsyncSession, jti: str, expires_at: datetime) ->
     try:
         blacklisted_entry = BlacklistedToken(jti=jti, expires_at=expires_at)
         db.add(blacklisted_entry)
+        # Delivered to every listening worker when the insert commits
+        await db.execute(select(func.pg_notify(_BLACKLIST_CHANNEL, jti)))
         await db.commit()
         await db.refresh(blacklisted_entry)
+        _on_jti_blacklisted(jti)
         logger.info(f"Token blacklisted: {jti}")
         return blacklisted_entry
     except Exception as e:
@@ -155,62 +199,131 @@ async def is_jti_blacklisted(db: AsyncSession, jti: str) -> bool:
     Checks if a JWT ID (jti) is in the blacklist and is not expired.
     Enhanced with error handling.
     """
+    if _blacklist_filter_is_fresh() and jti not in _blacklist_filter:
+        return False
+    if _blacklist_listener_live() and _jti_not_blacklisted.get(jti):
+        return False
+
+    seq = _invalidation_seq
     try:
-        result = await db.execute(
-            select(BlacklistedToken).filter(
-                and_(
-                    BlacklistedToken.jti == jti,
-                    BlacklistedToken.expires_at > datetime.now(timezone.utc)
-                )
-            )
-        )
-        is_blacklisted = result.scalars().first() is not None
+        result = await db.execute(_JTI_BLACKLISTED, {'jti': jti})
+        is_blacklisted = bool(result.scalar())
         if is_blacklisted:
             logger.warning(f"Blacklisted token used: {jti}")
+        elif _blacklist_listener_live() and seq == _invalidation_seq:
+            _jti_not_blacklisted.set(jti, True)
         return is_blacklisted
     except Exception as e:
         logger.error(f"Error checking blacklist for token {jti}: {e}")
         return False  # Fail open for availability
 
 
-async def delete_expired_blacklisted_tokens(db: AsyncSession, batch_size: int = 1000) -> int:
+def _on_jti_blacklisted(jti: str) -> None:
+    """Evict a newly blacklisted jti from this worker's caches"""
+    global _invalidation_seq
+    _invalidation_seq += 1
+    _jti_not_blacklisted.pop(jti)
+    if _blacklist_filter is not None:
+        _blacklist_filter.add(jti)
+    # Folded into a rebuild in flight, whose snapshot may predate this jti
+    if _blacklist_rebuild_added is not None:
+        _blacklist_rebuild_added.add(jti)
+
+
+def _blacklist_listener_live() -> bool:
+    """True while blacklist notifications are being received, so cached answers hold"""
+    return _listener_connected_at is not None and settings.JTI_BLACKLIST_CACHE_TTL > 0
+
+
+async def listen_for_blacklisted_jtis(db_engine: AsyncEngine = engine) -> None:
     """
-    Deletes blacklisted tokens that have expired.
-    Uses subquery approach for batch operations.
-    Returns the number of deleted tokens.
+    Background loop holding one pooled connection LISTENing for blacklisted jtis.
+    Reconnects on failure; nothing is cached while disconnected. Cancel to stop.
     """
-    try:
-        total_deleted = 0
-
-        while True:
-            # Get IDs of expired blacklisted tokens to delete in this batch
-            subquery = (
-                select(BlacklistedToken.id)
-                .where(BlacklistedToken.expires_at <= datetime.now(timezone.utc))
-                .limit(batch_size)
-            )
+    global _listener_connected_at, _invalidation_seq
+
+    def _notified(connection, pid, channel, payload):
+        _on_jti_blacklisted(payload)
+
+    while True:
+        try:
+            async with db_engine.connect() as conn:
+                driver = (await conn.get_raw_connection()).driver_connection
+                await driver.add_listener(_BLACKLIST_CHANNEL, _notified)
+                # Notifications sent while disconnected are lost: start from empty
+                _invalidation_seq += 1
+                _jti_not_blacklisted.clear()
+                _listener_connected_at = time.monotonic()
+                try:
+                    while True:
+                        await asyncio.sleep(_LISTENER_HEARTBEAT)
+                        # A dead socket surfaces here rather than as silently missed NOTIFYs
+                        await driver.execute("SELECT 1")
+                finally:
+                    _listener_connected_at = None
+                    if not driver.is_closed():
+                        await driver.remove_listener(_BLACKLIST_CHANNEL, _notified)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Blacklist listener disconnected: {e}")
+        await asyncio.sleep(_LISTENER_HEARTBEAT)
+
+
+def _blacklist_filter_is_fresh() -> bool:
+    """True while the filter has seen every blacklisted jti, so a miss can be trusted"""
+    return (
+        _blacklist_filter is not None
+        and _blacklist_listener_live()
+        and _blacklist_filter_built_at is not None
+        and _blacklist_filter_built_at >= _listener_connected_at
+    )
+
+
+async def rebuild_blacklist_filter(session_factory: async_sessionmaker = AsyncSessionLocal) -> int:
+    """
+    Rebuilds the blacklist bloom filter from the live blacklisted jtis.
+    Returns the number of jtis loaded.
+    """
+    global _blacklist_filter, _blacklist_filter_built_at, _blacklist_rebuild_added
 
-            # Delete using the subquery
-            result = await db.execute(
-                delete(BlacklistedToken)
-                .where(BlacklistedToken.id.in_(subquery))
+    bloom = BloomFilter(capacity=settings.JTI_BLOOM_CAPACITY)
+    count = 0
+    # jtis blacklisted while the snapshot streams are folded in before the swap
+    _blacklist_rebuild_added = set()
+    started_at = time.monotonic()
+    try:
+        async with session_factory() as db:
+            result = await db.stream_scalars(
+                _LIVE_BLACKLISTED_JTIS.execution_options(yield_per=_FILTER_BATCH_SIZE)
             )
+            async for jti in result:
+                bloom.add(jti)
+                count += 1
+        for jti in _blacklist_rebuild_added:
+            bloom.add(jti)
+        _blacklist_filter, _blacklist_filter_built_at = bloom, started_at
+    finally:
+        _blacklist_rebuild_added = None
 
-            deleted_count = result.rowcount
-            total_deleted += deleted_count
-
-            # Commit this batch
-            await db.commit()
+    if count > settings.JTI_BLOOM_CAPACITY:
+        logger.warning(f"Blacklist filter holds {count} jtis, above its capacity of {settings.JTI_BLOOM_CAPACITY}")
+    return count
 
-            logger.info(f"Deleted batch of {deleted_count} expired blacklisted tokens")
 
-            # If we deleted less than batch_size, we're done
-            if deleted_count < batch_size:
-                break
-
-            # Small delay between batches
-            if deleted_count == batch_size:  # Only sleep if there might be more batches
-                await asyncio.sleep(0.1)
+async def delete_expired_blacklisted_tokens(db: AsyncSession, batch_size: Optional[int] = None) -> int:
+    """
+    Deletes blacklisted tokens that have expired.
+    Uses a single DELETE unless batch_size is given.
+    Returns the number of deleted tokens.
+    """
+    try:
+        total_deleted = await _delete_expired(
+            db,
+            BlacklistedToken,
+            BlacklistedToken.expires_at <= func.now(),
+            batch_size
+        )
 
         logger.info(f"Total expired blacklisted tokens deleted: {total_deleted}")
         return total_deleted
@@ -221,9 +334,14 @@ async def delete_expired_blacklisted_tokens(db: AsyncSession, batch_size: int =
         raise
 
 
-async def cleanup_expired_tokens(db: AsyncSession, batch_size: int = 1000) -> Dict[str, int]:
+async def cleanup_expired_tokens(
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        batch_size: Optional[int] = None
+) -> Dict[str, int]:
     """
-    Cleanup all types of expired tokens using batch operations.
+    Cleanup all types of expired tokens.
+    The two tables are purged concurrently, each on its own pooled connection,
+    so this takes a session factory rather than a request-scoped session.
     Returns statistics of cleaned-up tokens.
     """
     stats = {
@@ -232,12 +350,15 @@ async def cleanup_expired_tokens(db: AsyncSession, batch_size: int = 1000) -> Di
         "total_deleted": 0
     }
 
-    try:
-        # Clean up refresh tokens
-        stats["refresh_tokens_deleted"] = await delete_expired_refresh_tokens(db, batch_size)
+    async def _purge(delete_expired) -> int:
+        async with session_factory() as db:
+            return await delete_expired(db, batch_size)
 
-        # Clean up blocklisted tokens
-        stats["blacklisted_tokens_deleted"] = await delete_expired_blacklisted_tokens(db, batch_size)
+    try:
+        stats["refresh_tokens_deleted"], stats["blacklisted_tokens_deleted"] = await asyncio.gather(
+            _purge(delete_expired_refresh_tokens),
+            _purge(delete_expired_blacklisted_tokens)
+        )
 
         stats["total_deleted"] = stats["refresh_tokens_deleted"] + stats["blacklisted_tokens_deleted"]
 
@@ -246,4 +367,4 @@ async def cleanup_expired_tokens(db: AsyncSession, batch_size: int = 1000) -> Di
 
     except Exception as e:
         logger.error(f"Token cleanup failed: {e}")
-        raise
\ No newline at end of file
+        raise
@@ -1,10 +1,21 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func
-from typing import Optional, Dict, Any, List
+from sqlalchemy import func, bindparam
+from sqlalchemy.orm import load_only
+from typing import Optional, Dict, Any, Iterable, List, Set, Tuple
 from loguru import logger
 
-from app.db.models import User
+from app.db.models import User, UserOrganization
+
+# Hot auth-path lookups built once; each call only binds the parameter
+_USER_BY_EMAIL = select(User).filter(User.email == bindparam('email'))
+_USER_BY_ID = select(User).filter(User.id == bindparam('user_id'))
+# Only the columns idx_user_login_covering carries, so Postgres can skip the heap
+_USER_LOGIN_BY_EMAIL = (
+    select(User)
+    .options(load_only(User.id, User.email, User.hashed_password, User.is_active))
+    .filter(User.email == bindparam('email'))
+)
 
 
 async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
@@ -13,7 +24,7 @@ async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
     Enhanced with error handling.
     """
     try:
-        result = await db.execute(select(User).filter(User.email == email))
+        result = await db.execute(_USER_BY_EMAIL, {'email': email})
         user = result.scalars().first()
         if user:
             logger.debug(f"User found: {email}")
@@ -23,13 +34,35 @@ async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
         return None
 
 
+async def get_users_by_ids(db: AsyncSession, user_ids: Iterable[int]) -> List[User]:
+    """Get users for a batch of IDs in one query, in no particular order"""
+    user_ids = list(user_ids)
+    if not user_ids:
+        return []
+    result = await db.execute(select(User).filter(User.id.in_(user_ids)))
+    return result.scalars().all()
+
+
+async def get_user_credentials_by_email(db: AsyncSession, email: str) -> Optional[User]:
+    """
+    Retrieves the id, email, password hash and active flag of a user for login.
+    Other attributes are not loaded and must not be accessed on the result.
+    """
+    try:
+        result = await db.execute(_USER_LOGIN_BY_EMAIL, {'email': email})
+        return result.scalars().first()
+    except Exception as e:
+        logger.error(f"Error retrieving credentials for {email}: {e}")
+        return None
+
+
 async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
     """
     Asynchronously retrieves a user by their ID.
     Enhanced with error handling.
     """
     try:
-        result = await db.execute(select(User).filter(User.id == user_id))
+        result = await db.execute(_USER_BY_ID, {'user_id': user_id})
         user = result.scalars().first()
         if user:
             logger.debug(f"User found: ID {user_id}")
@@ -106,42 +139,51 @@ async def delete_user_db(db: AsyncSession, user: User) -> None:
         raise
 
 
-async def get_user_count(db: AsyncSession) -> int:
+async def get_user_counts(db: AsyncSession) -> Tuple[int, int]:
     """
-    Get total count of users in the database.
+    Get (total, active) user counts in a single pass over users.
     """
     try:
-        result = await db.execute(select(func.count(User.id)))
-        count = result.scalar() or 0
-        return count
+        result = await db.execute(
+            select(
+                func.count(User.id),
+                func.count(User.id).filter(User.is_active.is_(True))
+            )
+        )
+        total, active = result.one()
+        return total or 0, active or 0
     except Exception as e:
-        logger.error(f"Error getting user count: {e}")
-        return 0
+        logger.error(f"Error getting user counts: {e}")
+        return 0, 0
+
+
+async def get_user_count(db: AsyncSession) -> int:
+    """
+    Get total count of users in the database.
+    """
+    total, _ = await get_user_counts(db)
+    return total
 
 
 async def get_active_user_count(db: AsyncSession) -> int:
     """
     Get count of active users in the database.
     """
-    try:
-        result = await db.execute(
-            select(func.count(User.id)).where(User.is_active == True)
-        )
-        count = result.scalar() or 0
-        return count
-    except Exception as e:
-        logger.error(f"Error getting active user count: {e}")
-        return 0
+    _, active = await get_user_counts(db)
+    return active
 
 
 async def search_users_by_email(db: AsyncSession, email_pattern: str, limit: int = 50) -> List[User]:
     """
     Search users by email pattern (for admin purposes).
+    Patterns shorter than a trigram match as a prefix to stay selective.
     """
     try:
+        term = email_pattern.lower()
+        search_pattern = f"%{term}%" if len(term) >= 3 else f"{term}%"
         result = await db.execute(
             select(User)
-            .filter(User.email.like(f"%{email_pattern}%"))
+            .filter(func.lower(User.email).like(search_pattern))
             .limit(limit)
         )
         users = result.scalars().all()
@@ -152,17 +194,25 @@ async def search_users_by_email(db: AsyncSession, email_pattern: str, limit: int
         return []
 
 
-async def is_user_in_organization(db: AsyncSession, user_id: int, organization_id: int) -> bool:
-    """Check if a user belongs to a specific organization"""
+async def users_in_organization(db: AsyncSession, user_ids: Iterable[int], organization_id: int) -> Set[int]:
+    """Return which of user_ids belong to an organization, in one query"""
+    user_ids = set(user_ids)
+    if not user_ids:
+        return set()
+
     try:
-        from app.db.models import UserOrganization
         result = await db.execute(
-            select(UserOrganization).filter(
-                UserOrganization.user_id == user_id,
+            select(UserOrganization.user_id).filter(
+                UserOrganization.user_id.in_(user_ids),
                 UserOrganization.organization_id == organization_id
             )
         )
-        return result.scalars().first() is not None
+        return set(result.scalars().all())
     except Exception as e:
         logger.error(f"Error checking user organization membership: {e}")
-        return False
\ No newline at end of file
+        return set()
+
+
+async def is_user_in_organization(db: AsyncSession, user_id: int, organization_id: int) -> bool:
+    """Check if a user belongs to a specific organization"""
+    return user_id in await users_in_organization(db, [user_id], organization_id)
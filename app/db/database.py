@@ -1,7 +1,13 @@
+import asyncio
 import logging
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker, declarative_base
+import time
+from collections import deque
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from fastapi import HTTPException
+from prometheus_client import Gauge
 from app.core import tracing as logger
 from app.core.config import settings
 
@@ -10,29 +16,38 @@ logging.basicConfig()
 logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
 # SQLAlchemy Engine
+# Pooled connections are reused across requests; sizes come from settings.
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
-    pool_size=20,
-    max_overflow=0,
-    pool_pre_ping=True,
-    pool_recycle=300,
+    echo_pool=False,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,  # Room for every filter combination the CRUD modules emit
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
     connect_args={
         "server_settings": {
-            "application_name": "chawk_api"
+            "application_name": "chawk_api",
+            "jit": "off"  # Short OLTP queries pay JIT compile cost without benefit
         },
         # ✅ CORRECT parameters for asyncpg:
         "command_timeout": 5,      # Command execution timeout
+        # Prepared statements kept per connection (asyncpg's own cache and the
+        # dialect's); warm connections then skip Parse. 0 for pgbouncer transaction mode.
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
         # Remove "connect_timeout" - not supported by asyncpg
     }
 )
 
 # Async session factory
-AsyncSessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
+AsyncSessionLocal = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
+    autoflush=False,
     expire_on_commit=False
 )
 
@@ -51,8 +66,99 @@ async def init_db():
         raise
 
 
+async def prewarm_pool():
+    """Open pool_size connections up front so early requests skip the connect handshake."""
+    if not settings.DB_POOL_PREWARM:
+        return
+
+    async def _checkout():
+        async with engine.connect():
+            pass
+
+    try:
+        await asyncio.gather(*(_checkout() for _ in range(settings.DB_POOL_SIZE)))
+        logger.info("Database pool pre-warmed", connections=settings.DB_POOL_SIZE)
+    except Exception as e:
+        logger.error("Database pool pre-warm failed", error=str(e), type=type(e).__name__)
+
+
+DB_POOL_SIZE_GAUGE = Gauge('db_pool_size', 'Connections the pool keeps open')
+DB_POOL_CHECKED_OUT = Gauge('db_pool_checked_out', 'Connections currently checked out')
+DB_QUERY_P95 = Gauge('db_query_latency_p95_seconds', 'p95 cursor execution time over the recent window')
+
+
+class LoadMonitor:
+    """
+    Samples connection pool load and query latency into Prometheus gauges.
+
+    The pool itself keeps a fixed DB_POOL_SIZE plus DB_MAX_OVERFLOW: QueuePool
+    has no public resize, and poking its queue in place neither keeps grown
+    connections nor closes surplus idle ones. These gauges are what to watch
+    when tuning those two settings. Cursor timing hooks are only attached while
+    run() is active, so with DB_POOL_MONITOR off queries carry no extra listeners.
+    """
+
+    def __init__(self, engine, window: int = 1000):
+        self.engine = engine
+        self._latencies = deque(maxlen=window)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info["query_start"] = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        start = conn.info.pop("query_start", None)
+        if start is not None:
+            self._latencies.append(time.perf_counter() - start)
+
+    def p95_latency(self) -> float:
+        """p95 cursor execution time in seconds over the recent window"""
+        if not self._latencies:
+            return 0.0
+        ordered = sorted(self._latencies)
+        return ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+
+    def snapshot(self) -> dict:
+        """Current pool size, checked-out connections and p95 latency"""
+        pool = self.engine.sync_engine.pool
+        return {
+            "pool_size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "p95_latency": self.p95_latency()
+        }
+
+    def evaluate(self) -> None:
+        """Sample the pool once into the gauges"""
+        stats = self.snapshot()
+        DB_POOL_SIZE_GAUGE.set(stats["pool_size"])
+        DB_POOL_CHECKED_OUT.set(stats["checked_out"])
+        DB_QUERY_P95.set(stats["p95_latency"])
+
+    async def run(self) -> None:
+        """Background loop; cancel to stop. Queries are only timed while it runs."""
+        sync_engine = self.engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        try:
+            while True:
+                await asyncio.sleep(settings.DB_POOL_MONITOR_INTERVAL)
+                try:
+                    self.evaluate()
+                except Exception as e:
+                    logger.error("Database pool monitor failed", error=str(e), type=type(e).__name__)
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+            event.remove(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+
+load_monitor = LoadMonitor(engine)
+
+
 async def get_db():
-    """Async session dependency with trace-aware error logging."""
+    """
+    Async session dependency with trace-aware error logging.
+    Handlers commit before returning: teardown runs after the response is
+    sent, so a commit here could fail after the client was told it succeeded.
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -0,0 +1,137 @@
+# app/db/loaders.py
+"""
+Request-scoped batch loaders.
+
+Lookups issued during the same event-loop tick are coalesced into a single
+``WHERE key IN (...)`` query, and each key is resolved at most once per request.
+"""
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Hashable, List, Optional, Set
+from uuid import UUID
+
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import get_db
+from app.db.models import Organization, User
+from app.db.models.cortex import CortexJob
+from app.db.crud.cortex import get_jobs_by_uuids
+from app.db.crud.organization import get_organizations_by_uuids
+from app.db.crud.user import get_users_by_ids
+
+
+class DataLoader(ABC):
+    """Minimal DataLoader: batches and memoizes key lookups against one session"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+        self._pending: List[Hashable] = []
+        # Strong references: the loop only keeps weak ones to running tasks
+        self._tasks: Set[asyncio.Task] = set()
+
+    @abstractmethod
+    async def batch_load(self, keys: List[Hashable]) -> List[Any]:
+        """Return one value (or None) per key, in key order"""
+
+    def load(self, key: Hashable) -> "asyncio.Future":
+        """Schedule a key for the next batch and return its future"""
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[key] = future
+            if not self._pending:
+                loop.call_soon(self._schedule_dispatch)
+            self._pending.append(key)
+        return future
+
+    async def load_many(self, keys: List[Hashable]) -> List[Any]:
+        """Resolve several keys with a single batch"""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: Hashable, value: Any) -> None:
+        """Seed the memo with an already-loaded value"""
+        if key not in self._futures:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._futures[key] = future
+
+    def _schedule_dispatch(self) -> None:
+        task = asyncio.ensure_future(self._dispatch())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self) -> None:
+        keys, self._pending = self._pending, []
+        try:
+            values = list(await self.batch_load(keys))
+        except Exception as e:
+            for key in keys:
+                future = self._futures.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, value in zip(keys, values):
+            future = self._futures[key]
+            if not future.done():
+                future.set_result(value)
+        # A short result must not leave callers awaiting forever
+        for key in keys[len(values):]:
+            future = self._futures.pop(key)
+            if not future.done():
+                future.set_exception(ValueError(
+                    f"{type(self).__name__}.batch_load returned {len(values)} values for {len(keys)} keys"
+                ))
+
+
+class JobLoader(DataLoader):
+    """Cortex jobs by UUID, with the relationships the job detail view needs"""
+
+    async def batch_load(self, keys: List[UUID]) -> List[Optional[CortexJob]]:
+        jobs = await get_jobs_by_uuids(self.db, keys)
+        by_uuid = {job.uuid: job for job in jobs}
+        return [by_uuid.get(key) for key in keys]
+
+
+class OrganizationLoader(DataLoader):
+    """Organizations by UUID"""
+
+    async def batch_load(self, keys: List[UUID]) -> List[Optional[Organization]]:
+        organizations = await get_organizations_by_uuids(self.db, keys)
+        by_uuid = {org.uuid: org for org in organizations}
+        return [by_uuid.get(key) for key in keys]
+
+
+class UserLoader(DataLoader):
+    """Users by primary key, e.g. created_by_id/assignee_id of a page of rows"""
+
+    async def batch_load(self, keys: List[int]) -> List[Optional[User]]:
+        users = await get_users_by_ids(self.db, keys)
+        by_id = {user.id: user for user in users}
+        return [by_id.get(key) for key in keys]
+
+
+def _request_loader(request: Request, attr: str, loader_cls, db: AsyncSession) -> DataLoader:
+    """Return the loader cached on request.state, creating it on first use"""
+    loader = getattr(request.state, attr, None)
+    if loader is None:
+        loader = loader_cls(db)
+        setattr(request.state, attr, loader)
+    return loader
+
+
+async def get_job_loader(request: Request, db: AsyncSession = Depends(get_db)) -> JobLoader:
+    """Dependency returning the request's JobLoader"""
+    return _request_loader(request, "job_loader", JobLoader, db)
+
+
+async def get_organization_loader(request: Request, db: AsyncSession = Depends(get_db)) -> OrganizationLoader:
+    """Dependency returning the request's OrganizationLoader"""
+    return _request_loader(request, "organization_loader", OrganizationLoader, db)
+
+
+async def get_user_loader(request: Request, db: AsyncSession = Depends(get_db)) -> UserLoader:
+    """Dependency returning the request's UserLoader"""
+    return _request_loader(request, "user_loader", UserLoader, db)
@@ -28,6 +28,14 @@ from app.db.models.task import Task
 from app.db.models.observable import Observable
 from app.db.models.alert import Alert
 
+# Import integration models; every mapped class must be registered before any
+# module-level loader option configures the mappers
+from app.db.models.case_template import CaseTemplate, TaskTemplate
+from app.db.models.cortex import (
+    CortexInstance, CortexAnalyzer, CortexResponder, CortexJob, CortexJobReport
+)
+from app.db.models.webhook import Webhook, WebhookDelivery, WebhookTemplate
+
 # Export all models and enums
 __all__ = [
     # Base classes
@@ -48,4 +56,9 @@ __all__ = [
 
     # SIRP models
     'Case', 'Task', 'Observable', 'Alert',
+
+    # Integration models
+    'CaseTemplate', 'TaskTemplate',
+    'CortexInstance', 'CortexAnalyzer', 'CortexResponder', 'CortexJob', 'CortexJobReport',
+    'Webhook', 'WebhookDelivery', 'WebhookTemplate',
 ]
@@ -1,9 +1,10 @@
 # app/db/models/alert.py
 """Alert management model"""
-from sqlalchemy import Column, Integer, String, Text, Boolean, JSON, ForeignKey, Index, Enum, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, Index, DateTime, Computed, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
-from app.db.models.base import Base, TimestampMixin, UUIDMixin
+from app.db.models.base import Base, TimestampMixin, UUIDMixin, STRICT_LAZY, SEVERITY_TYPE, TLP_TYPE, ALERT_STATUS_TYPE
 from app.db.models.enums import Severity, TLP, AlertStatus
 
 
@@ -15,20 +16,22 @@ class Alert(Base, UUIDMixin, TimestampMixin):
     type = Column(String(100), nullable=False, index=True)  # Alert type
     title = Column(String(500), nullable=False)
     description = Column(Text, nullable=True)
-    source = Column(String(255), nullable=False, index=True)
+    source = Column(String(255), nullable=False)  # Leading column of idx_alert_source_ref
     source_ref = Column(String(255), nullable=False)  # Reference in source system
     external_link = Column(String(1000), nullable=True)  # Link to source system
-    severity = Column(Enum(Severity), nullable=False, default=Severity.MEDIUM)
-    tlp = Column(Enum(TLP), nullable=False, default=TLP.AMBER)
-    pap = Column(Enum(TLP), nullable=False, default=TLP.AMBER)  # PAP uses same levels as TLP
-    status = Column(Enum(AlertStatus), nullable=False, default=AlertStatus.NEW, index=True)
+    severity = Column(SEVERITY_TYPE, nullable=False, default=Severity.MEDIUM)
+    tlp = Column(TLP_TYPE, nullable=False, default=TLP.AMBER)
+    pap = Column(TLP_TYPE, nullable=False, default=TLP.AMBER)  # PAP uses same levels as TLP
+    status = Column(ALERT_STATUS_TYPE, nullable=False, default=AlertStatus.NEW, index=True)
     date = Column(DateTime(timezone=True), nullable=False)  # Alert occurrence date
     last_sync_date = Column(DateTime(timezone=True), nullable=False)  # Last sync from source
     read = Column(Boolean, default=False, nullable=False, index=True)  # Has been read
     follow = Column(Boolean, default=False, nullable=False, index=True)  # Follow for updates
-    tags = Column(JSON, default=list, nullable=False)  # Alert tags
-    raw_data = Column(JSON, default=dict, nullable=False)
-    observables = Column(JSON, default=list, nullable=False)  # Embedded observables
+    tags = Column(JSONB, default=list, nullable=False)  # Alert tags
+    raw_data = Column(JSONB, default=dict, nullable=False)
+    observables = Column(JSONB, default=list, nullable=False)  # Embedded observables
+    # Maintained by Postgres so list views never have to load the observables payload
+    observable_count = Column(Integer, Computed("jsonb_array_length(observables)", persisted=True))
     imported_at = Column(DateTime(timezone=True), nullable=True)  # When converted to case
 
     # Foreign keys
@@ -37,16 +40,24 @@ class Alert(Base, UUIDMixin, TimestampMixin):
     created_by_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
 
     # Relationships
-    organization = relationship("Organization", back_populates="alerts")
-    case = relationship("Case", back_populates="alert", uselist=False)
-    created_by = relationship("User", backref="created_alerts")
+    organization = relationship("Organization", back_populates="alerts", lazy=STRICT_LAZY)
+    case = relationship("Case", back_populates="alert", uselist=False, lazy=STRICT_LAZY)
+    created_by = relationship("User", backref="created_alerts", lazy=STRICT_LAZY)
 
     __table_args__ = (
         Index('idx_alert_org_status', 'organization_id', 'status'),
-        Index('idx_alert_source', 'source'),
+        # Triage inbox: new alerts per organization, newest first
+        Index('idx_alert_org_new_created', 'organization_id', 'created_at', postgresql_where=text("status = 'NEW'")),
         Index('idx_alert_created', 'created_at'),
         Index('idx_alert_source_ref', 'source', 'source_ref', unique=True),
-        Index('idx_alert_uuid', 'uuid'),
+        # Containment (@>) lookups; jsonb_path_ops keeps these indexes compact.
+        # Filter with col.contains({...}) rather than ->>, which cannot use them.
+        Index('idx_alert_tags_gin', 'tags', postgresql_using='gin', postgresql_ops={'tags': 'jsonb_path_ops'}),
+        Index('idx_alert_observables_gin', 'observables', postgresql_using='gin',
+              postgresql_ops={'observables': 'jsonb_path_ops'}),
+        # raw_data is queried by single scalar keys: a btree on the extracted value
+        # answers raw_data->>'sensor' predicates and is far smaller than a document GIN
+        Index('idx_alert_raw_data_sensor', text("(raw_data->>'sensor')")),
     )
 
     def __repr__(self):
@@ -1,9 +1,8 @@
 # app/db/models/auth.py
 """Authentication-related models"""
-import uuid
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, func, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, func, ForeignKey, Index, select, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, selectinload
 
 from app.db.models.base import Base, TimestampMixin, UUIDMixin
 
@@ -12,22 +11,35 @@ class User(Base, UUIDMixin, TimestampMixin):
     """User model with UUID security"""
     __tablename__ = "users"
 
-    email = Column(String(255), unique=True, index=True, nullable=False)
+    email = Column(String(255), nullable=False)  # Unique via ix_users_email below
     hashed_password = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
 
     # Relationships
-    refresh_tokens = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan")
-    organizations = relationship("UserOrganization", back_populates="user", cascade="all, delete-orphan")
+    # Never lazy-loaded: query with User.with_orgs() (or an explicit loader option).
+    # passive_deletes leaves row removal to the ON DELETE CASCADE foreign keys.
+    refresh_tokens = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan",
+                                  lazy="raise", passive_deletes=True)
+    organizations = relationship("UserOrganization", back_populates="user", cascade="all, delete-orphan",
+                                 lazy="raise", passive_deletes=True)
 
     # Enhanced indexes for better performance
     __table_args__ = (
-        Index('idx_user_email_active', 'email', 'is_active'),
+        # The unique email index also covers the login lookup (get_user_credentials_by_email),
+        # making it an index-only scan without a second B-tree on email
+        Index('ix_users_email', 'email', unique=True,
+              postgresql_include=['hashed_password', 'is_active', 'id']),
+        # Admin search filters on lower(email) LIKE '%term%'
+        Index('idx_user_email_trgm', func.lower(email).label('email_lower'),
+              postgresql_using='gin', postgresql_ops={'email_lower': 'gin_trgm_ops'}),
         Index('idx_user_created_at', 'created_at'),
-        Index('idx_user_active', 'is_active'),
-        Index('idx_user_uuid', 'uuid'),
     )
 
+    @classmethod
+    def with_orgs(cls):
+        """SELECT of users with their organization memberships loaded in one IN query"""
+        return select(cls).options(selectinload(cls.organizations))
+
     def __repr__(self):
         return f"<User email={self.email}>"
 
@@ -36,8 +48,7 @@ class RefreshToken(Base, TimestampMixin):
     """Refresh token model with UUID"""
     __tablename__ = "refresh_tokens"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    uuid = Column(UUID(as_uuid=True), unique=True, default=uuid.uuid4, index=True, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())  # Also the external identifier
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     token_hash = Column(String(255), unique=True, nullable=False, index=True)
     expires_at = Column(DateTime(timezone=True), nullable=False)
@@ -45,15 +56,18 @@ class RefreshToken(Base, TimestampMixin):
     revoked_at = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships
-    user = relationship("User", back_populates="refresh_tokens")
+    user = relationship("User", back_populates="refresh_tokens", lazy="joined")  # Token lookups always need the owner
 
     # Enhanced indexes for better query performance
     __table_args__ = (
-        Index('idx_refresh_token_uuid', 'uuid'),
-        Index('idx_refresh_token_user_active', 'user_id', 'revoked_at'),
-        Index('idx_refresh_token_expires', 'expires_at'),
-        Index('idx_refresh_token_hash', 'token_hash'),
-        Index('idx_refresh_token_cleanup', 'expires_at', 'revoked_at'),
+        # Partial indexes cover only live tokens, a small slice of the table
+        Index('idx_refresh_token_user_active', 'user_id', postgresql_where=text('revoked_at IS NULL')),
+        # Refresh lookups are pure equality on live tokens; uniqueness stays on the column's B-tree
+        Index('idx_refresh_token_hash_active', 'token_hash', postgresql_using='hash',
+              postgresql_where=text('revoked_at IS NULL')),
+        # Cleanup deletes expires_at <= now() OR revoked_at IS NOT NULL: one bitmap branch each
+        Index('idx_refresh_token_cleanup', 'expires_at'),
+        Index('idx_refresh_token_revoked', 'revoked_at', postgresql_where=text('revoked_at IS NOT NULL')),
     )
 
     def __repr__(self):
@@ -64,17 +78,16 @@ class BlacklistedToken(Base):
     """Blacklisted JWT tokens with UUID"""
     __tablename__ = "blacklisted_tokens"
 
-    id = Column(Integer, primary_key=True, index=True)
-    uuid = Column(UUID(as_uuid=True), unique=True, default=uuid.uuid4, index=True, nullable=False)
-    jti = Column(String(255), unique=True, nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    uuid = Column(UUID(as_uuid=True), unique=True, server_default=func.gen_random_uuid(), index=True, nullable=False)
+    jti = Column(String(255), unique=True, nullable=False, index=True)  # Unique B-tree also serves lookups
     expires_at = Column(DateTime(timezone=True), nullable=False)
     blacklisted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
+    __mapper_args__ = {"eager_defaults": True}
+
     # Enhanced indexes for cleanup and lookup performance
     __table_args__ = (
-        Index('idx_blacklisted_uuid', 'uuid'),
-        Index('idx_blacklisted_jti_expires', 'jti', 'expires_at'),
-        Index('idx_blacklisted_expires', 'expires_at'),
         Index('idx_blacklisted_cleanup', 'expires_at', 'blacklisted_at'),
     )
 
@@ -1,17 +1,72 @@
 # app/db/models/base.py
-import uuid
-from sqlalchemy import Column, Integer, DateTime, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Integer, DateTime, DDL, event, func
+from sqlalchemy.dialects.postgresql import UUID, ENUM
 from app.db.database import Base
+from app.core.config import settings
+from app.db.models.enums import (
+    Severity, TLP, CaseStatus, ResolutionStatus, ImpactStatus, TaskStatus,
+    AlertStatus, UserRole, ObservableType, JobStatus, WorkerType,
+    WebhookEvent, WebhookStatus
+)
+
+# Loader for relationships that list/detail queries are expected to load explicitly:
+# with ORM_RAISELOAD on (development/CI) an unplanned lazy SELECT raises instead of
+# silently issuing one query per row
+STRICT_LAZY = "raise_on_sql" if settings.ORM_RAISELOAD else "select"
+
+
+# Native Postgres enum types, declared once and shared by every column that uses them.
+# Bound to the metadata so create_all() issues each CREATE TYPE exactly once, before
+# the tables; names match the ones the per-column Enum() types generated.
+SEVERITY_TYPE = ENUM(Severity, name="severity", metadata=Base.metadata)
+TLP_TYPE = ENUM(TLP, name="tlp", metadata=Base.metadata)
+CASE_STATUS_TYPE = ENUM(CaseStatus, name="casestatus", metadata=Base.metadata)
+RESOLUTION_STATUS_TYPE = ENUM(ResolutionStatus, name="resolutionstatus", metadata=Base.metadata)
+IMPACT_STATUS_TYPE = ENUM(ImpactStatus, name="impactstatus", metadata=Base.metadata)
+TASK_STATUS_TYPE = ENUM(TaskStatus, name="taskstatus", metadata=Base.metadata)
+ALERT_STATUS_TYPE = ENUM(AlertStatus, name="alertstatus", metadata=Base.metadata)
+USER_ROLE_TYPE = ENUM(UserRole, name="userrole", metadata=Base.metadata)
+OBSERVABLE_TYPE_TYPE = ENUM(ObservableType, name="observabletype", metadata=Base.metadata)
+JOB_STATUS_TYPE = ENUM(JobStatus, name="jobstatus", metadata=Base.metadata)
+WORKER_TYPE_TYPE = ENUM(WorkerType, name="workertype", metadata=Base.metadata)
+WEBHOOK_EVENT_TYPE = ENUM(WebhookEvent, name="webhookevent", metadata=Base.metadata)
+WEBHOOK_STATUS_TYPE = ENUM(WebhookStatus, name="webhookstatus", metadata=Base.metadata)
 
 
 class TimestampMixin:
-    """Mixin for created_at and updated_at timestamps"""
+    """Mixin for created_at and updated_at timestamps
+
+    eager_defaults fetches the server-generated timestamps with RETURNING
+    during flush, so they are readable after commit without a refresh().
+    """
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), default=func.now(), nullable=False)
 
+    __mapper_args__ = {"eager_defaults": True}
+
 
 class UUIDMixin:
-    """Mixin for UUID fields with internal ID"""
-    id = Column(Integer, primary_key=True, index=True)
-    uuid = Column(UUID(as_uuid=True), unique=True, default=uuid.uuid4, index=True, nullable=False)
\ No newline at end of file
+    """Mixin for UUID fields with internal ID
+
+    The UUID is generated by Postgres, so bulk INSERT ... SELECT/RETURNING
+    paths never call back into Python per row; eager_defaults on
+    TimestampMixin returns it during flush. The primary key and the unique
+    uuid index are the only indexes these columns need.
+    """
+    id = Column(Integer, primary_key=True)
+    uuid = Column(UUID(as_uuid=True), unique=True, server_default=func.gen_random_uuid(), index=True, nullable=False)
+
+
+# gin_trgm_ops indexes (users, observables) need the extension before any table is created
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
+# gen_random_uuid() is built in from Postgres 13; pgcrypto provides it on older servers
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pgcrypto").execute_if(dialect="postgresql")
+)
@@ -1,10 +1,11 @@
 # app/db/models/case.py
 """Case management model"""
-from sqlalchemy import Column, Integer, String, Text, JSON, ForeignKey, Index, Enum, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Index, DateTime, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
-from app.db.models.base import Base, TimestampMixin, UUIDMixin
-from app.db.models.enums import Severity, TLP, CaseStatus, ResolutionStatus, ImpactStatus
+from app.db.models.base import Base, TimestampMixin, UUIDMixin, STRICT_LAZY, SEVERITY_TYPE, TLP_TYPE, CASE_STATUS_TYPE, RESOLUTION_STATUS_TYPE, IMPACT_STATUS_TYPE
+from app.db.models.enums import Severity, TLP, CaseStatus
 
 
 class Case(Base, UUIDMixin, TimestampMixin):
@@ -15,18 +16,18 @@ class Case(Base, UUIDMixin, TimestampMixin):
     title = Column(String(500), nullable=False)
     description = Column(Text, nullable=True)
     case_number = Column(String(50), unique=True, nullable=False, index=True)  # Auto-generated
-    severity = Column(Enum(Severity), nullable=False, default=Severity.MEDIUM)
-    tlp = Column(Enum(TLP), nullable=False, default=TLP.AMBER)
-    status = Column(Enum(CaseStatus), nullable=False, default=CaseStatus.OPEN, index=True)
-    tags = Column(JSON, default=list, nullable=False)
-    custom_fields = Column(JSON, default=dict, nullable=False)
+    severity = Column(SEVERITY_TYPE, nullable=False, default=Severity.MEDIUM)
+    tlp = Column(TLP_TYPE, nullable=False, default=TLP.AMBER)
+    status = Column(CASE_STATUS_TYPE, nullable=False, default=CaseStatus.OPEN, index=True)
+    tags = Column(JSONB, default=list, nullable=False)
+    custom_fields = Column(JSONB, default=dict, nullable=False)
     due_date = Column(DateTime(timezone=True), nullable=True)
     closed_at = Column(DateTime(timezone=True), nullable=True)
     
     # New fields matching TheHive 4.1.24
     summary = Column(Text, nullable=True)  # Case closure summary
-    impact_status = Column(Enum(ImpactStatus), nullable=True)  # Impact assessment
-    resolution_status = Column(Enum(ResolutionStatus), nullable=True)  # Resolution classification
+    impact_status = Column(IMPACT_STATUS_TYPE, nullable=True)  # Impact assessment
+    resolution_status = Column(RESOLUTION_STATUS_TYPE, nullable=True)  # Resolution classification
     case_template = Column(String(100), nullable=True)  # Template name (for backward compatibility)
 
     # Foreign keys
@@ -37,8 +38,8 @@ class Case(Base, UUIDMixin, TimestampMixin):
 
     # Relationships
     organization = relationship("Organization", back_populates="cases")
-    assignee = relationship("User", foreign_keys=[assignee_id], backref="assigned_cases")
-    created_by = relationship("User", foreign_keys=[created_by_id], backref="created_cases")
+    assignee = relationship("User", foreign_keys=[assignee_id], backref="assigned_cases", lazy=STRICT_LAZY)
+    created_by = relationship("User", foreign_keys=[created_by_id], backref="created_cases", lazy=STRICT_LAZY)
     template = relationship("CaseTemplate", back_populates="cases", foreign_keys=[case_template_id])
     tasks = relationship("Task", back_populates="case", cascade="all, delete-orphan")
     observables = relationship("Observable", back_populates="case", cascade="all, delete-orphan")
@@ -49,7 +50,8 @@ class Case(Base, UUIDMixin, TimestampMixin):
         Index('idx_case_assignee', 'assignee_id'),
         Index('idx_case_severity', 'severity'),
         Index('idx_case_created', 'created_at'),
-        Index('idx_case_uuid', 'uuid'),
+        # Scalar custom field filters (custom_fields->>'priority')
+        Index('idx_case_custom_priority', text("(custom_fields->>'priority')")),
     )
 
     def __repr__(self):
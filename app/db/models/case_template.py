@@ -1,10 +1,10 @@
 # app/db/models/case_template.py
 """Case Template model for template-based case creation"""
-from sqlalchemy import Column, Integer, String, Text, Boolean, JSON, ForeignKey, Index, Enum
+from sqlalchemy import Column, Integer, String, Text, Boolean, JSON, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
-from app.db.models.base import Base, TimestampMixin, UUIDMixin
-from app.db.models.enums import Severity, TLP
+from app.db.models.base import Base, TimestampMixin, UUIDMixin, SEVERITY_TYPE, TLP_TYPE
+from app.db.models.enums import TLP
 
 
 class CaseTemplate(Base, UUIDMixin, TimestampMixin):
@@ -18,9 +18,9 @@ class CaseTemplate(Base, UUIDMixin, TimestampMixin):
     description = Column(Text, nullable=True)  # Template description
     
     # Default case settings
-    severity = Column(Enum(Severity), nullable=True)  # Default severity
-    tlp = Column(Enum(TLP), nullable=True, default=TLP.AMBER)  # Default TLP
-    pap = Column(Enum(TLP), nullable=True, default=TLP.AMBER)  # Default PAP (uses TLP enum)
+    severity = Column(SEVERITY_TYPE, nullable=True)  # Default severity
+    tlp = Column(TLP_TYPE, nullable=True, default=TLP.AMBER)  # Default TLP
+    pap = Column(TLP_TYPE, nullable=True, default=TLP.AMBER)  # Default PAP (uses TLP enum)
     flag = Column(Boolean, default=False, nullable=False)  # Default flag status
     tags = Column(JSON, default=list, nullable=False)  # Default tags
     custom_fields = Column(JSON, default=dict, nullable=False)  # Default custom fields
@@ -37,7 +37,12 @@ class CaseTemplate(Base, UUIDMixin, TimestampMixin):
     # Relationships
     organization = relationship("Organization", back_populates="case_templates")
     created_by = relationship("User", backref="created_case_templates")
-    task_templates = relationship("TaskTemplate", back_populates="case_template", cascade="all, delete-orphan")
+    task_templates = relationship(
+        "TaskTemplate",
+        back_populates="case_template",
+        cascade="all, delete-orphan",
+        order_by="TaskTemplate.order_index"
+    )
     cases = relationship("Case", back_populates="template", foreign_keys="Case.case_template_id")
 
     __table_args__ = (
@@ -45,7 +50,6 @@ class CaseTemplate(Base, UUIDMixin, TimestampMixin):
         Index('idx_case_template_active', 'is_active'),
         Index('idx_case_template_usage', 'usage_count'),
         Index('idx_case_template_created', 'created_at'),
-        Index('idx_case_template_uuid', 'uuid'),
     )
 
     def __repr__(self):
@@ -82,7 +86,6 @@ class TaskTemplate(Base, UUIDMixin, TimestampMixin):
         Index('idx_task_template_case', 'case_template_id'),
         Index('idx_task_template_order', 'case_template_id', 'order_index'),
         Index('idx_task_template_group', 'group'),
-        Index('idx_task_template_uuid', 'uuid'),
     )
 
     def __repr__(self):
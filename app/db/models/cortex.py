@@ -1,18 +1,19 @@
 # app/db/models/cortex.py
 """Cortex integration models for analyzers, responders, and jobs"""
-from sqlalchemy import Column, Integer, String, Text, JSON, ForeignKey, Index, Enum, Boolean, DateTime, Float
+from sqlalchemy import Column, Integer, SmallInteger, String, Text, JSON, ForeignKey, Index, Boolean, DateTime, Float, Computed, DDL, event, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
-from app.db.models.base import Base, TimestampMixin, UUIDMixin
-from app.db.models.enums import JobStatus, WorkerType
+from app.db.models.base import Base, TimestampMixin, UUIDMixin, STRICT_LAZY, JOB_STATUS_TYPE, WORKER_TYPE_TYPE
+from app.db.models.enums import JobStatus
 
 
 class CortexInstance(Base, UUIDMixin, TimestampMixin):
     """Cortex instance configuration"""
     __tablename__ = "cortex_instances"
 
-    name = Column(String(255), nullable=False, index=True)
+    name = Column(String(255), nullable=False, unique=True, index=True)
     url = Column(String(500), nullable=False)
     api_key = Column(String(255), nullable=False)  # Encrypted
     enabled = Column(Boolean, default=True, nullable=False)
@@ -28,13 +29,12 @@ class CortexInstance(Base, UUIDMixin, TimestampMixin):
     max_concurrent_jobs = Column(Integer, default=10, nullable=False)
     
     # Relationships
-    analyzers = relationship("CortexAnalyzer", back_populates="cortex_instance", cascade="all, delete-orphan")
-    responders = relationship("CortexResponder", back_populates="cortex_instance", cascade="all, delete-orphan")
-    jobs = relationship("CortexJob", back_populates="cortex_instance")
+    analyzers = relationship("CortexAnalyzer", back_populates="cortex_instance", cascade="all, delete-orphan", passive_deletes=True)
+    responders = relationship("CortexResponder", back_populates="cortex_instance", cascade="all, delete-orphan", passive_deletes=True)
+    jobs = relationship("CortexJob", back_populates="cortex_instance", passive_deletes=True)
 
     __table_args__ = (
         Index('idx_cortex_name_enabled', 'name', 'enabled'),
-        Index('idx_cortex_uuid', 'uuid'),
     )
 
     def __repr__(self):
@@ -52,11 +52,11 @@ class CortexAnalyzer(Base, UUIDMixin, TimestampMixin):
     
     # Analyzer capabilities
     data_types = Column(JSON, nullable=False)  # ['ip', 'domain', 'hash', etc.]
-    max_tlp = Column(Integer, default=3, nullable=False)  # 0=RED, 1=AMBER, 2=GREEN, 3=WHITE
-    max_pap = Column(Integer, default=3, nullable=False)
+    max_tlp = Column(SmallInteger, default=3, nullable=False)  # 0=RED, 1=AMBER, 2=GREEN, 3=WHITE
+    max_pap = Column(SmallInteger, default=3, nullable=False)
     
     # Configuration
-    configuration = Column(JSON, default=dict, nullable=False)
+    configuration = Column(JSONB, default=dict, nullable=False)
     enabled = Column(Boolean, default=True, nullable=False)
     rate_limit = Column(Integer, nullable=True)  # requests per minute
     
@@ -70,7 +70,7 @@ class CortexAnalyzer(Base, UUIDMixin, TimestampMixin):
     jobs = relationship("CortexJob", back_populates="analyzer")
 
     __table_args__ = (
-        Index('idx_analyzer_cortex_name', 'cortex_instance_id', 'name'),
+        Index('idx_analyzer_cortex_name', 'cortex_instance_id', 'name', unique=True),
         Index('idx_analyzer_enabled', 'enabled'),
         Index('idx_analyzer_data_types', 'data_types'),
     )
@@ -90,11 +90,11 @@ class CortexResponder(Base, UUIDMixin, TimestampMixin):
     
     # Responder capabilities
     data_types = Column(JSON, nullable=False)  # ['ip', 'domain', 'hash', etc.]
-    max_tlp = Column(Integer, default=3, nullable=False)
-    max_pap = Column(Integer, default=3, nullable=False)
+    max_tlp = Column(SmallInteger, default=3, nullable=False)
+    max_pap = Column(SmallInteger, default=3, nullable=False)
     
     # Configuration
-    configuration = Column(JSON, default=dict, nullable=False)
+    configuration = Column(JSONB, default=dict, nullable=False)
     enabled = Column(Boolean, default=True, nullable=False)
     
     # Status
@@ -107,7 +107,7 @@ class CortexResponder(Base, UUIDMixin, TimestampMixin):
     jobs = relationship("CortexJob", back_populates="responder")
 
     __table_args__ = (
-        Index('idx_responder_cortex_name', 'cortex_instance_id', 'name'),
+        Index('idx_responder_cortex_name', 'cortex_instance_id', 'name', unique=True),
         Index('idx_responder_enabled', 'enabled'),
         Index('idx_responder_data_types', 'data_types'),
     )
@@ -121,23 +121,28 @@ class CortexJob(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "cortex_jobs"
 
     # Job identification
-    cortex_job_id = Column(String(255), nullable=False, index=True)  # ID from Cortex
-    worker_type = Column(Enum(WorkerType), nullable=False, index=True)
+    cortex_job_id = Column(String(255), nullable=False)  # ID from Cortex
+    worker_type = Column(WORKER_TYPE_TYPE, nullable=False, index=True)
     
     # Job details
-    status = Column(Enum(JobStatus), nullable=False, default=JobStatus.WAITING, index=True)
+    status = Column(JOB_STATUS_TYPE, nullable=False, default=JobStatus.WAITING)
     message = Column(Text, nullable=True)
-    progress = Column(Integer, default=0, nullable=False)  # 0-100
+    progress = Column(SmallInteger, default=0, nullable=False)  # 0-100
     
     # Execution timing
     started_at = Column(DateTime(timezone=True), nullable=True)
     ended_at = Column(DateTime(timezone=True), nullable=True)
-    duration = Column(Float, nullable=True)  # seconds
-    
-    # Job data
+    duration = Column(
+        Float,
+        Computed("EXTRACT(EPOCH FROM (ended_at - started_at))", persisted=True),
+        nullable=True
+    )  # seconds, derived by the database
+    
+    # Job data; the (possibly very large) report lives in cortex_job_reports so
+    # status polling and job listings never read or detoast it
     parameters = Column(JSON, default=dict, nullable=False)
-    report = Column(JSON, nullable=True)  # Analysis/response report
-    artifacts = Column(JSON, default=list, nullable=False)  # Generated artifacts
+    job_report = relationship("CortexJobReport", uselist=False, lazy="noload",
+                              cascade="all, delete-orphan", passive_deletes=True)
     
     # Relationships
     cortex_instance_id = Column(Integer, ForeignKey("cortex_instances.id", ondelete="CASCADE"), nullable=False)
@@ -158,16 +163,55 @@ class CortexJob(Base, UUIDMixin, TimestampMixin):
     
     # User who triggered the job
     created_by_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=False)
-    created_by = relationship("User", backref="cortex_jobs")
+    created_by = relationship("User", backref="cortex_jobs", lazy=STRICT_LAZY)
 
+    # Single-column status/observable/case/user/created_at lookups use the leading
+    # column of the composites below
     __table_args__ = (
-        Index('idx_cortex_job_status', 'status'),
         Index('idx_cortex_job_cortex_id', 'cortex_job_id'),
-        Index('idx_cortex_job_observable', 'observable_id'),
-        Index('idx_cortex_job_case', 'case_id'),
-        Index('idx_cortex_job_created', 'created_at'),
-        Index('idx_cortex_job_user', 'created_by_id'),
+        Index('idx_cortex_job_created_id', 'created_at', 'id'),  # Keyset pagination
+        Index('idx_cortex_job_status_created', 'status', 'created_at'),
+        Index('idx_cortex_job_observable_created', 'observable_id', 'created_at'),
+        Index('idx_cortex_job_case_created', 'case_id', 'created_at'),
+        Index('idx_cortex_job_user_created', 'created_by_id', 'created_at'),
+        Index(
+            'idx_cortex_job_active_created', 'created_at',
+            postgresql_where=text("status IN ('WAITING', 'IN_PROGRESS')")
+        ),  # Dashboard view of queued/running jobs
     )
 
     def __repr__(self):
-        return f"<CortexJob id={self.cortex_job_id} status={self.status} type={self.worker_type}>"
\ No newline at end of file
+        return f"<CortexJob id={self.cortex_job_id} status={self.status} type={self.worker_type}>"
+
+
+class CortexJobReport(Base):
+    """Report and artifacts of a Cortex job, loaded only when explicitly requested"""
+    __tablename__ = "cortex_job_reports"
+
+    job_id = Column(Integer, ForeignKey("cortex_jobs.id", ondelete="CASCADE"), primary_key=True)
+    report = Column(JSONB, nullable=True)  # Analysis/response report
+    artifacts = Column(JSONB, default=list, nullable=False)  # Generated artifacts
+
+    def __repr__(self):
+        return f"<CortexJobReport job_id={self.job_id}>"
+
+
+# Reports are written once and read rarely: lz4 (Postgres 14+) decompresses them
+# much faster than the default pglz
+event.listen(
+    CortexJobReport.__table__,
+    "after_create",
+    DDL("""
+        DO $$
+        BEGIN
+            IF current_setting('server_version_num')::int >= 140000 THEN
+                EXECUTE 'ALTER TABLE cortex_job_reports '
+                        'ALTER COLUMN report SET COMPRESSION lz4, '
+                        'ALTER COLUMN artifacts SET COMPRESSION lz4';
+            END IF;
+        EXCEPTION WHEN feature_not_supported THEN
+            RAISE NOTICE 'lz4 not available, keeping pglz for cortex_job_reports';
+        END
+        $$
+    """).execute_if(dialect="postgresql")
+)
@@ -2,14 +2,36 @@
 import enum
 
 
-class Severity(str, enum.Enum):
+class _FastLookupMeta(enum.EnumMeta):
+    """EnumMeta whose value lookup is a single dict hit
+
+    ``Member(value)`` normally goes through EnumMeta.__call__, Enum.__new__ and
+    several sentinel checks; for a known value this returns the member straight
+    from ``_value2member_map_``. Anything else (unknown values, the functional
+    API) falls back to the standard path, so errors are unchanged.
+    """
+
+    def __call__(cls, value, *args, **kwargs):
+        if not args and not kwargs:
+            try:
+                return cls._value2member_map_[value]
+            except (KeyError, TypeError):
+                pass
+        return super().__call__(value, *args, **kwargs)
+
+
+class FastStrEnum(str, enum.Enum, metaclass=_FastLookupMeta):
+    """str-valued Enum with a fast ``Member(value)`` lookup"""
+
+
+class Severity(FastStrEnum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
     CRITICAL = "critical"
 
 
-class TLP(str, enum.Enum):
+class TLP(FastStrEnum):
     WHITE = "white"
     GREEN = "green"
     AMBER = "amber"
@@ -59,7 +81,7 @@ class UserRole(str, enum.Enum):
     READ_ONLY = "read_only"
 
 
-class ObservableType(str, enum.Enum):
+class ObservableType(FastStrEnum):
     DOMAIN = "domain"
     FILE = "file"
     FILENAME = "filename"
@@ -91,7 +113,7 @@ class WorkerType(str, enum.Enum):
     RESPONDER = "responder"
 
 
-class WebhookEvent(str, enum.Enum):
+class WebhookEvent(FastStrEnum):
     """Webhook event types"""
     CASE_CREATED = "case.created"
     CASE_UPDATED = "case.updated"
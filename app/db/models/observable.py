@@ -1,11 +1,11 @@
 # app/db/models/observable.py
 """Observable (IOC/Artifact) model"""
-from sqlalchemy import Column, Integer, String, Text, Boolean, JSON, ForeignKey, Index, Enum
+from sqlalchemy import Column, Integer, String, Text, Boolean, JSON, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 
-from app.db.models.base import Base, TimestampMixin, UUIDMixin
-from app.db.models.enums import ObservableType, TLP
+from app.db.models.base import Base, TimestampMixin, UUIDMixin, TLP_TYPE, OBSERVABLE_TYPE_TYPE
+from app.db.models.enums import TLP
 
 
 class Observable(Base, UUIDMixin, TimestampMixin):
@@ -13,9 +13,9 @@ class Observable(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "observables"
 
     # Observable fields
-    data_type = Column(Enum(ObservableType), nullable=False, index=True)
+    data_type = Column(OBSERVABLE_TYPE_TYPE, nullable=False, index=True)
     data = Column(String(1000), nullable=False, index=True)  # The actual observable value
-    tlp = Column(Enum(TLP), nullable=False, default=TLP.AMBER)
+    tlp = Column(TLP_TYPE, nullable=False, default=TLP.AMBER)
     is_ioc = Column(Boolean, default=False, nullable=False, index=True)
     tags = Column(JSON, default=list, nullable=False)
     source = Column(String(255), nullable=True)
@@ -29,6 +29,9 @@ class Observable(Base, UUIDMixin, TimestampMixin):
 
     # Foreign keys
     case_id = Column(Integer, ForeignKey("cases.id", ondelete="CASCADE"), nullable=True)
+    # Denormalized from the case (or set directly for case-less observables) so
+    # organization-wide listings filter without joining cases
+    organization_id = Column(Integer, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     created_by_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=False)
 
     # Relationships
@@ -39,8 +42,25 @@ class Observable(Base, UUIDMixin, TimestampMixin):
         Index('idx_observable_type_ioc', 'data_type', 'is_ioc'),
         Index('idx_observable_data', 'data'),
         Index('idx_observable_case', 'case_id'),
-        Index('idx_observable_uuid', 'uuid'),
+        # Keyset pagination; INCLUDE lets type/IOC filters be checked without heap fetches
+        Index('idx_observable_case_created_id', 'case_id', 'created_at', 'id',
+              postgresql_include=['data_type', 'is_ioc']),
+        Index('idx_observable_org_created_id', 'organization_id', 'created_at', 'id',
+              postgresql_include=['data_type', 'is_ioc']),
+        # Searches filter on lower(col) LIKE :pattern; trigram indexes serve '%term%'
+        Index('idx_observable_data_trgm', func.lower(data).label('data_lower'),
+              postgresql_using='gin', postgresql_ops={'data_lower': 'gin_trgm_ops'}),
+        Index('idx_observable_message_trgm', func.lower(message).label('message_lower'),
+              postgresql_using='gin', postgresql_ops={'message_lower': 'gin_trgm_ops'}),
+        Index('idx_observable_source_trgm', func.lower(source).label('source_lower'),
+              postgresql_using='gin', postgresql_ops={'source_lower': 'gin_trgm_ops'}),
+        # ...and text_pattern_ops btrees serve left-anchored 'prefix%'
+        Index('idx_observable_data_lower', func.lower(data).label('data_lower'),
+              postgresql_ops={'data_lower': 'text_pattern_ops'}),
+        Index('idx_observable_message_lower', func.lower(message).label('message_lower'),
+              postgresql_ops={'message_lower': 'text_pattern_ops'}),
     )
 
     def __repr__(self):
-        return f"<Observable type={self.data_type} data={self.data[:50]}>"
\ No newline at end of file
+        return f"<Observable type={self.data_type} data={self.data[:50]}>"
+
@@ -1,9 +1,9 @@
 # app/db/models/organization.py
 """Organization and multi-tenancy models"""
-from sqlalchemy import Column, Integer, String, Boolean, Text, JSON, ForeignKey, Index, Enum
+from sqlalchemy import Column, Integer, String, Boolean, Text, JSON, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
-from app.db.models.base import Base, TimestampMixin, UUIDMixin
+from app.db.models.base import Base, TimestampMixin, UUIDMixin, USER_ROLE_TYPE
 from app.db.models.enums import UserRole
 
 
@@ -25,7 +25,6 @@ class Organization(Base, UUIDMixin, TimestampMixin):
 
     __table_args__ = (
         Index('idx_org_name_active', 'name', 'is_active'),
-        Index('idx_org_uuid', 'uuid'),
     )
 
     def __repr__(self):
@@ -36,10 +35,10 @@ class UserOrganization(Base, TimestampMixin):
     """Many-to-many relationship between users and organizations with roles"""
     __tablename__ = "user_organizations"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     organization_id = Column(Integer, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
-    role = Column(Enum(UserRole), nullable=False, default=UserRole.ANALYST)
+    role = Column(USER_ROLE_TYPE, nullable=False, default=UserRole.ANALYST)
 
     # Note: joined_at is handled by TimestampMixin's created_at
 
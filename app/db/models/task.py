@@ -1,9 +1,9 @@
 # app/db/models/task.py
 """Task management model"""
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Index, Enum, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Index, DateTime, DDL, FetchedValue, event
 from sqlalchemy.orm import relationship
 
-from app.db.models.base import Base, TimestampMixin, UUIDMixin
+from app.db.models.base import Base, TimestampMixin, UUIDMixin, TASK_STATUS_TYPE
 from app.db.models.enums import TaskStatus
 
 
@@ -14,10 +14,11 @@ class Task(Base, UUIDMixin, TimestampMixin):
     # Task fields
     title = Column(String(500), nullable=False)
     description = Column(Text, nullable=True)
-    status = Column(Enum(TaskStatus), nullable=False, default=TaskStatus.WAITING, index=True)
+    status = Column(TASK_STATUS_TYPE, nullable=False, default=TaskStatus.WAITING, index=True)
     order_index = Column(Integer, nullable=False, default=0)
     due_date = Column(DateTime(timezone=True), nullable=True)
-    completed_at = Column(DateTime(timezone=True), nullable=True)
+    # Set/cleared by the tasks_completion trigger on status transitions; fetched back on UPDATE
+    completed_at = Column(DateTime(timezone=True), nullable=True, server_onupdate=FetchedValue())
     
     # New field matching TheHive 4.1.24
     group = Column(String(100), nullable=False, default="default")  # Task grouping
@@ -33,10 +34,41 @@ class Task(Base, UUIDMixin, TimestampMixin):
     created_by = relationship("User", foreign_keys=[created_by_id], backref="created_tasks")
 
     __table_args__ = (
-        Index('idx_task_case_order', 'case_id', 'order_index'),
+        # Matches get_case_tasks' filter + ORDER BY, so pages (and keyset seeks) skip the sort
+        Index('idx_task_case_order', 'case_id', 'order_index', 'created_at'),
+        Index('idx_task_case_status', 'case_id', 'status'),
         Index('idx_task_assignee_status', 'assignee_id', 'status'),
-        Index('idx_task_uuid', 'uuid'),
     )
 
     def __repr__(self):
-        return f"<Task title={self.title} status={self.status}>"
\ No newline at end of file
+        return f"<Task title={self.title} status={self.status}>"
+
+
+# Stamp completed_at when a task becomes COMPLETED and clear it when it leaves that
+# status, for every UPDATE path (ORM flushes and bulk statements alike)
+event.listen(
+    Task.__table__,
+    "after_create",
+    DDL("""
+        CREATE OR REPLACE FUNCTION set_task_completed_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.completed_at := CASE
+                WHEN NEW.status = 'COMPLETED' THEN now()
+                WHEN OLD.status = 'COMPLETED' THEN NULL
+                ELSE NEW.completed_at
+            END;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """).execute_if(dialect="postgresql")
+)
+event.listen(
+    Task.__table__,
+    "after_create",
+    DDL("""
+        CREATE TRIGGER tasks_completion
+        BEFORE UPDATE ON tasks
+        FOR EACH ROW WHEN (NEW.status IS DISTINCT FROM OLD.status)
+        EXECUTE FUNCTION set_task_completed_at()
+    """).execute_if(dialect="postgresql")
+)
@@ -1,11 +1,11 @@
 # app/db/models/webhook.py
 """Webhook models for event notifications"""
-from sqlalchemy import Column, Integer, String, Text, JSON, ForeignKey, Index, Enum, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, JSON, ForeignKey, Index, Boolean, DateTime
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
-from app.db.models.base import Base, TimestampMixin, UUIDMixin
-from app.db.models.enums import WebhookEvent, WebhookStatus
+from app.db.models.base import Base, TimestampMixin, UUIDMixin, WEBHOOK_EVENT_TYPE, WEBHOOK_STATUS_TYPE
+from app.db.models.enums import WebhookStatus
 
 
 class Webhook(Base, UUIDMixin, TimestampMixin):
@@ -68,8 +68,8 @@ class WebhookDelivery(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "webhook_deliveries"
 
     # Delivery details
-    event_type = Column(Enum(WebhookEvent), nullable=False, index=True)
-    status = Column(Enum(WebhookStatus), nullable=False, default=WebhookStatus.PENDING, index=True)
+    event_type = Column(WEBHOOK_EVENT_TYPE, nullable=False, index=True)
+    status = Column(WEBHOOK_STATUS_TYPE, nullable=False, default=WebhookStatus.PENDING, index=True)
     
     # Request details
     request_url = Column(String(500), nullable=False)
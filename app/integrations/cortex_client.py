@@ -11,7 +11,10 @@ from loguru import logger
 from cryptography.fernet import Fernet
 import os
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.db.models.cortex import CortexInstance, CortexAnalyzer, CortexResponder
+from app.db.crud.cortex import bulk_upsert_analyzers, bulk_upsert_responders
 from app.db.models.enums import JobStatus, WorkerType
 from app.core.config import settings
 
@@ -274,14 +277,21 @@ class CortexManager:
         """Get client for specific instance"""
         return self.clients.get(instance_name)
     
-    async def sync_workers(self, instance: CortexInstance) -> Dict[str, int]:
-        """Sync analyzers and responders from Cortex instance"""
+    async def sync_workers(self, instance: CortexInstance, db: Optional[AsyncSession] = None) -> Dict[str, int]:
+        """Sync analyzers and responders from Cortex instance
+
+        With a database session, each worker list is upserted in a single
+        statement; without one, workers are only logged.
+        """
         client = self.get_client(instance.name)
         if not client:
             raise CortexError(f"Client for instance '{instance.name}' not found")
         
         stats = {'analyzers': 0, 'responders': 0, 'errors': 0}
         
+        if db is not None:
+            return await self._sync_workers_db(client, instance, db, stats)
+
         try:
             # Sync analyzers
             analyzers_data = await client.get_analyzers()
@@ -309,6 +319,40 @@ class CortexManager:
         
         return stats
     
+    async def _sync_workers_db(
+        self,
+        client: CortexClient,
+        instance: CortexInstance,
+        db: AsyncSession,
+        stats: Dict[str, int]
+    ) -> Dict[str, int]:
+        """Persist the full analyzer and responder lists with one upsert each.
+
+        Each upsert runs in a savepoint so a failed half does not abort the other.
+        """
+        try:
+            analyzers_data = await client.get_analyzers()
+            try:
+                async with db.begin_nested():
+                    stats['analyzers'] = await bulk_upsert_analyzers(db, instance.id, analyzers_data)
+            except Exception as e:
+                logger.error(f"Failed to sync analyzers for instance {instance.name}: {e}")
+                stats['errors'] += len(analyzers_data)
+
+            responders_data = await client.get_responders()
+            try:
+                async with db.begin_nested():
+                    stats['responders'] = await bulk_upsert_responders(db, instance.id, responders_data)
+            except Exception as e:
+                logger.error(f"Failed to sync responders for instance {instance.name}: {e}")
+                stats['errors'] += len(responders_data)
+
+        except Exception as e:
+            logger.error(f"Failed to sync workers for instance {instance.name}: {e}")
+            raise CortexError(f"Sync failed: {e}")
+
+        return stats
+
     async def _sync_analyzer(self, instance: CortexInstance, data: Dict[str, Any]) -> None:
         """Sync individual analyzer (this would be implemented with database access)"""
         # This is a placeholder - would need database session to implement
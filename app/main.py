@@ -13,7 +13,7 @@ import asyncio
 
 # Core imports
 from app.core.config import settings
-from app.db.database import get_db, init_db, engine, AsyncSessionLocal
+from app.db.database import get_db, init_db, prewarm_pool, engine, AsyncSessionLocal, load_monitor
 
 # Import tracing
 from app.core import tracing
@@ -39,7 +39,7 @@ from app.exceptions.handlers import (
 )
 
 # Import token cleanup
-from app.db.crud.token import cleanup_expired_tokens
+from app.db.crud.token import cleanup_expired_tokens, rebuild_blacklist_filter, listen_for_blacklisted_jtis
 
 # Rate limiter
 limiter = Limiter(
@@ -61,6 +61,7 @@ async def lifespan(app: FastAPI):
     # Initialize database
     try:
         await init_db()
+        await prewarm_pool()
         tracing.info("Database initialized successfully")
     except Exception as e:
         tracing.error(f"Database initialization failed: {e}")
@@ -69,6 +70,21 @@ async def lifespan(app: FastAPI):
     # Start background token cleanup task
     cleanup_task = asyncio.create_task(periodic_token_cleanup())
 
+    # Receive other workers' logouts so cached blacklist answers stay valid
+    blacklist_listener_task = (
+        asyncio.create_task(listen_for_blacklisted_jtis(engine))
+        if settings.JTI_BLACKLIST_CACHE_TTL else None
+    )
+
+    # Keep the per-worker blacklist bloom filter in step with the table
+    blacklist_filter_task = (
+        asyncio.create_task(periodic_blacklist_filter_rebuild())
+        if settings.JTI_BLOOM_CAPACITY and settings.JTI_BLACKLIST_CACHE_TTL else None
+    )
+
+    # Start pool load sampling
+    monitor_task = asyncio.create_task(load_monitor.run()) if settings.DB_POOL_MONITOR else None
+
     # Log startup configuration
     tracing.info(f"Environment: {settings.ENVIRONMENT}")
     tracing.info(f"Log Level: {settings.LOG_LEVEL}")
@@ -82,11 +98,14 @@ async def lifespan(app: FastAPI):
 
     # Cleanup
     tracing.info("CHawk API shutdown initiated")
-    cleanup_task.cancel()
-    try:
-        await cleanup_task
-    except asyncio.CancelledError:
-        pass
+    for task in (cleanup_task, blacklist_listener_task, blacklist_filter_task, monitor_task):
+        if task is None:
+            continue
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
     tracing.info("CHawk API shutdown complete")
 
 
@@ -326,14 +345,13 @@ if settings.ENVIRONMENT == "development":
 # =============================================================================
 
 async def periodic_token_cleanup():
-    """Background task for token cleanup using batch operations"""
+    """Background task for token cleanup"""
     while True:
         try:
-            async with AsyncSessionLocal() as db:
-                stats = await cleanup_expired_tokens(db, batch_size=1000)
-                tracing.info("Token cleanup completed",
-                             cleanup_stats=stats,
-                             task="periodic_cleanup")
+            stats = await cleanup_expired_tokens(AsyncSessionLocal)
+            tracing.info("Token cleanup completed",
+                         cleanup_stats=stats,
+                         task="periodic_cleanup")
         except Exception as e:
             tracing.error(f"Token cleanup failed: {e}",
                           task="periodic_cleanup",
@@ -343,6 +361,19 @@ async def periodic_token_cleanup():
         await asyncio.sleep(3600)
 
 
+async def periodic_blacklist_filter_rebuild():
+    """Background task rebuilding the token blacklist bloom filter"""
+    while True:
+        try:
+            await rebuild_blacklist_filter(AsyncSessionLocal)
+        except Exception as e:
+            tracing.error(f"Blacklist filter rebuild failed: {e}",
+                          task="blacklist_filter",
+                          error_type=type(e).__name__)
+
+        await asyncio.sleep(settings.JTI_BLACKLIST_CACHE_TTL)
+
+
 # Final initialization log
 tracing.info("CHawk API fully initialized with enterprise-grade features!")
 tracing.info("Ready for production traffic with comprehensive security and monitoring!")
\ No newline at end of file
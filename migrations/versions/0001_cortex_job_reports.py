@@ -0,0 +1,77 @@
+"""Move Cortex job report and artifacts into cortex_job_reports
+
+Revision ID: 0001_cortex_job_reports
+Revises:
+Create Date: 2026-10-16 21:16:55
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision: str = '0001_cortex_job_reports'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_LZ4_COMPRESSION = """
+    DO $$
+    BEGIN
+        IF current_setting('server_version_num')::int >= 140000 THEN
+            EXECUTE 'ALTER TABLE cortex_job_reports '
+                    'ALTER COLUMN report SET COMPRESSION lz4, '
+                    'ALTER COLUMN artifacts SET COMPRESSION lz4';
+        END IF;
+    EXCEPTION WHEN feature_not_supported THEN
+        RAISE NOTICE 'lz4 not available, keeping pglz for cortex_job_reports';
+    END
+    $$
+"""
+
+
+def _columns(table: str) -> set:
+    return {col['name'] for col in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # init_db's create_all may already have created the (empty) table
+    if not sa.inspect(op.get_bind()).has_table('cortex_job_reports'):
+        op.create_table(
+            'cortex_job_reports',
+            sa.Column('job_id', sa.Integer(),
+                      sa.ForeignKey('cortex_jobs.id', ondelete='CASCADE'), primary_key=True),
+            sa.Column('report', JSONB(), nullable=True),
+            sa.Column('artifacts', JSONB(), nullable=False),
+        )
+        op.execute(_LZ4_COMPRESSION)
+
+    if {'report', 'artifacts'} <= _columns('cortex_jobs'):
+        # Casts cover both the original JSON and the later JSONB columns
+        op.execute("""
+            INSERT INTO cortex_job_reports (job_id, report, artifacts)
+            SELECT id, report::jsonb, COALESCE(artifacts::jsonb, '[]'::jsonb)
+            FROM cortex_jobs
+            WHERE report IS NOT NULL OR artifacts::jsonb <> '[]'::jsonb
+            ON CONFLICT (job_id) DO NOTHING
+        """)
+        op.drop_column('cortex_jobs', 'report')
+        op.drop_column('cortex_jobs', 'artifacts')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('cortex_jobs', sa.Column('report', JSONB(), nullable=True))
+    op.add_column('cortex_jobs', sa.Column('artifacts', JSONB(), nullable=False,
+                                           server_default=sa.text("'[]'::jsonb")))
+    op.execute("""
+        UPDATE cortex_jobs j
+        SET report = r.report, artifacts = r.artifacts
+        FROM cortex_job_reports r
+        WHERE r.job_id = j.id
+    """)
+    op.alter_column('cortex_jobs', 'artifacts', server_default=None)
+    op.drop_table('cortex_job_reports')
@@ -0,0 +1,76 @@
+"""Denormalize organization_id onto observables
+
+Revision ID: 0002_observable_organization_id
+Revises: 0001_cortex_job_reports
+Create Date: 2026-10-16 21:01:13
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_observable_organization_id'
+down_revision: Union[str, Sequence[str], None] = '0001_cortex_job_reports'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    columns = {col['name'] for col in sa.inspect(op.get_bind()).get_columns('observables')}
+    if 'organization_id' not in columns:
+        # Nullable first so existing rows survive until they are backfilled
+        op.add_column('observables', sa.Column('organization_id', sa.Integer(), nullable=True))
+
+    op.execute("""
+        UPDATE observables o
+        SET organization_id = c.organization_id
+        FROM cases c
+        WHERE o.case_id = c.id AND o.organization_id IS NULL
+    """)
+    # Case-less observables: the creator's earliest organization membership
+    op.execute("""
+        UPDATE observables o
+        SET organization_id = (
+            SELECT uo.organization_id
+            FROM user_organizations uo
+            WHERE uo.user_id = o.created_by_id
+            ORDER BY uo.id
+            LIMIT 1
+        )
+        WHERE o.organization_id IS NULL
+    """)
+    orphans = op.get_bind().execute(
+        sa.text("SELECT count(*) FROM observables WHERE organization_id IS NULL")
+    ).scalar()
+    if orphans:
+        raise RuntimeError(
+            f"{orphans} observables have no case and a creator without an organization; "
+            "set observables.organization_id for them and rerun the upgrade"
+        )
+
+    op.alter_column('observables', 'organization_id', nullable=False)
+    op.execute("""
+        DO $$
+        BEGIN
+            ALTER TABLE observables ADD CONSTRAINT observables_organization_id_fkey
+                FOREIGN KEY (organization_id) REFERENCES organizations (id) ON DELETE CASCADE;
+        EXCEPTION WHEN duplicate_object THEN
+            NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_observable_org_created_id
+        ON observables (organization_id, created_at, id) INCLUDE (data_type, is_ioc)
+    """)
+    op.execute("DROP INDEX IF EXISTS idx_observable_created_id")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("CREATE INDEX IF NOT EXISTS idx_observable_created_id ON observables (created_at, id)")
+    op.execute("DROP INDEX IF EXISTS idx_observable_org_created_id")
+    op.drop_column('observables', 'organization_id')
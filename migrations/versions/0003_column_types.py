@@ -0,0 +1,108 @@
+"""Native uuid, smallint, JSONB and generated columns
+
+Revision ID: 0003_column_types
+Revises: 0002_observable_organization_id
+Create Date: 2026-10-16 21:17:34
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_column_types'
+down_revision: Union[str, Sequence[str], None] = '0002_observable_organization_id'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_SMALLINT_COLUMNS = {
+    'cortex_analyzers': ['max_tlp', 'max_pap'],
+    'cortex_responders': ['max_tlp', 'max_pap'],
+    'cortex_jobs': ['progress'],
+}
+_JSONB_COLUMNS = {
+    'alerts': ['tags', 'raw_data', 'observables'],
+    'cases': ['tags', 'custom_fields'],
+    'cortex_analyzers': ['configuration'],
+    'cortex_responders': ['configuration'],
+}
+# Containment (@>) lookups on alert documents
+_ALERT_GIN_INDEXES = {
+    'idx_alert_tags_gin': 'tags',
+    'idx_alert_observables_gin': 'observables',
+    'idx_alert_raw_data_gin': 'raw_data',
+}
+_GENERATED_COLUMNS = {
+    ('cortex_jobs', 'duration'): (sa.Float(), "EXTRACT(EPOCH FROM (ended_at - started_at))"),
+    ('alerts', 'observable_count'): (sa.Integer(), "jsonb_array_length(observables)"),
+}
+
+
+def _columns(table: str) -> dict:
+    return {col['name']: col for col in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    refresh_cols = _columns('refresh_tokens')
+    if not isinstance(refresh_cols['id']['type'], UUID):
+        op.alter_column('refresh_tokens', 'id', type_=UUID(as_uuid=True),
+                        postgresql_using='id::uuid', server_default=sa.text('gen_random_uuid()'))
+    if 'uuid' in refresh_cols:
+        # Its unique index and idx_refresh_token_uuid go with it
+        op.drop_column('refresh_tokens', 'uuid')
+
+    for table, names in _SMALLINT_COLUMNS.items():
+        cols = _columns(table)
+        for name in names:
+            if not isinstance(cols[name]['type'], sa.SmallInteger):
+                op.alter_column(table, name, type_=sa.SmallInteger())
+
+    for table, names in _JSONB_COLUMNS.items():
+        cols = _columns(table)
+        for name in names:
+            if not isinstance(cols[name]['type'], JSONB):
+                op.alter_column(table, name, type_=JSONB(), postgresql_using=f'{name}::jsonb')
+    for index, column in _ALERT_GIN_INDEXES.items():
+        op.execute(f"CREATE INDEX IF NOT EXISTS {index} ON alerts USING gin ({column} jsonb_path_ops)")
+
+    # Needs the JSONB conversion above for jsonb_array_length
+    for (table, name), (type_, expression) in _GENERATED_COLUMNS.items():
+        cols = _columns(table)
+        if name in cols and cols[name].get('computed'):
+            continue
+        if name in cols:
+            op.drop_column(table, name)
+        op.add_column(table, sa.Column(name, type_, sa.Computed(expression, persisted=True)))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, name in _GENERATED_COLUMNS:
+        op.drop_column(table, name)
+    # duration was a plain column the application filled in
+    op.add_column('cortex_jobs', sa.Column('duration', sa.Float(), nullable=True))
+    op.execute("""
+        UPDATE cortex_jobs SET duration = EXTRACT(EPOCH FROM (ended_at - started_at))
+        WHERE ended_at IS NOT NULL AND started_at IS NOT NULL
+    """)
+
+    for index in _ALERT_GIN_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+    for table, names in _JSONB_COLUMNS.items():
+        for name in names:
+            op.alter_column(table, name, type_=sa.JSON(), postgresql_using=f'{name}::json')
+
+    for table, names in _SMALLINT_COLUMNS.items():
+        for name in names:
+            op.alter_column(table, name, type_=sa.Integer())
+
+    op.add_column('refresh_tokens', sa.Column('uuid', UUID(as_uuid=True), nullable=False,
+                                              server_default=sa.text('gen_random_uuid()')))
+    op.create_index('ix_refresh_tokens_uuid', 'refresh_tokens', ['uuid'], unique=True)
+    op.create_index('idx_refresh_token_uuid', 'refresh_tokens', ['uuid'])
+    op.alter_column('refresh_tokens', 'uuid', server_default=None)
+    op.alter_column('refresh_tokens', 'id', type_=sa.String(36), server_default=None,
+                    postgresql_using='id::text')
@@ -0,0 +1,39 @@
+"""Make the unique users email index the covering login index
+
+Revision ID: 0004_users_email_covering
+Revises: 0003_column_types
+Create Date: 2026-10-16 21:16:30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_users_email_covering'
+down_revision: Union[str, Sequence[str], None] = '0003_column_types'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Build the covering unique index before dropping the old ones so email stays unique
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email_covering
+        ON users (email) INCLUDE (hashed_password, is_active, id)
+    """)
+    op.execute("DROP INDEX IF EXISTS idx_user_login_covering")
+    op.execute("DROP INDEX IF EXISTS ix_users_email")
+    op.execute("ALTER INDEX ix_users_email_covering RENAME TO ix_users_email")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER INDEX ix_users_email RENAME TO ix_users_email_covering")
+    op.execute("CREATE UNIQUE INDEX ix_users_email ON users (email)")
+    op.execute("""
+        CREATE INDEX idx_user_login_covering
+        ON users (email) INCLUDE (hashed_password, is_active, id)
+    """)
+    op.execute("DROP INDEX ix_users_email_covering")
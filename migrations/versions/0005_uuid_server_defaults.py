@@ -0,0 +1,52 @@
+"""Generate uuid columns server-side with gen_random_uuid()
+
+Revision ID: 0005_uuid_server_defaults
+Revises: 0004_users_email_covering
+Create Date: 2026-10-16 21:13:40
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0005_uuid_server_defaults'
+down_revision: Union[str, Sequence[str], None] = '0004_users_email_covering'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose uuid column used to be filled in by Python (uuid.uuid4) on INSERT
+_UUID_TABLES = [
+    'api_keys', 'blacklisted_tokens', 'organizations', 'users',
+    'cases', 'tasks', 'observables', 'alerts',
+    'case_templates', 'task_templates',
+    'cortex_instances', 'cortex_analyzers', 'cortex_responders', 'cortex_jobs',
+    'webhooks', 'webhook_deliveries', 'webhook_templates',
+]
+
+
+def _uuid_column(inspector, table: str):
+    if not inspector.has_table(table):
+        return None
+    return next((col for col in inspector.get_columns(table) if col['name'] == 'uuid'), None)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # gen_random_uuid() is built in from Postgres 13; pgcrypto provides it on older servers
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+
+    inspector = sa.inspect(op.get_bind())
+    for table in _UUID_TABLES:
+        column = _uuid_column(inspector, table)
+        if column is not None and not column.get('default'):
+            op.alter_column(table, 'uuid', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    for table in _UUID_TABLES:
+        if _uuid_column(inspector, table) is not None:
+            op.alter_column(table, 'uuid', server_default=None)
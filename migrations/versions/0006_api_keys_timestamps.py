@@ -0,0 +1,43 @@
+"""Give api_keys the shared timestamp columns
+
+Revision ID: 0006_api_keys_timestamps
+Revises: 0005_uuid_server_defaults
+Create Date: 2026-10-16 21:17:04
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0006_api_keys_timestamps'
+down_revision: Union[str, Sequence[str], None] = '0005_uuid_server_defaults'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('api_keys'):
+        return
+    columns = {col['name']: col for col in inspector.get_columns('api_keys')}
+
+    if columns['created_at']['nullable']:
+        op.execute("UPDATE api_keys SET created_at = now() WHERE created_at IS NULL")
+        op.alter_column('api_keys', 'created_at', nullable=False)
+
+    if 'updated_at' not in columns:
+        # The server default fills existing rows; they are then aligned with created_at
+        op.add_column('api_keys', sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False,
+                                            server_default=sa.text('now()')))
+        op.execute("UPDATE api_keys SET updated_at = created_at")
+        # New rows get updated_at from TimestampMixin, as on every other table
+        op.alter_column('api_keys', 'updated_at', server_default=None)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('api_keys', 'updated_at')
+    op.alter_column('api_keys', 'created_at', nullable=True)
@@ -0,0 +1,41 @@
+"""Make Cortex instance names unique
+
+Revision ID: 0007_cortex_instance_name_unique
+Revises: 0006_api_keys_timestamps
+Create Date: 2026-10-16 20:49:40
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0007_cortex_instance_name_unique'
+down_revision: Union[str, Sequence[str], None] = '0006_api_keys_timestamps'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Deleting a duplicate would cascade to its workers and jobs, so all but the
+    # oldest instance of each name are renamed instead
+    op.execute("""
+        UPDATE cortex_instances c
+        SET name = left(c.name, 240) || ' (' || c.id || ')'
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY name ORDER BY id) AS n
+            FROM cortex_instances
+        ) d
+        WHERE d.id = c.id AND d.n > 1
+    """)
+    # Unique index under a temporary name first, so the name is never unindexed
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_cortex_instances_name_unique ON cortex_instances (name)")
+    op.execute("DROP INDEX IF EXISTS ix_cortex_instances_name")
+    op.execute("ALTER INDEX ix_cortex_instances_name_unique RENAME TO ix_cortex_instances_name")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_cortex_instances_name")
+    op.execute("CREATE INDEX ix_cortex_instances_name ON cortex_instances (name)")
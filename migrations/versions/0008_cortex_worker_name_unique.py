@@ -0,0 +1,56 @@
+"""Make Cortex analyzer and responder names unique per instance
+
+Revision ID: 0008_cortex_worker_name_unique
+Revises: 0007_cortex_instance_name_unique
+Create Date: 2026-10-16 20:50:25
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0008_cortex_worker_name_unique'
+down_revision: Union[str, Sequence[str], None] = '0007_cortex_instance_name_unique'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# worker table -> (its unique index, the cortex_jobs column referencing it)
+_WORKER_TABLES = {
+    'cortex_analyzers': ('idx_analyzer_cortex_name', 'analyzer_id'),
+    'cortex_responders': ('idx_responder_cortex_name', 'responder_id'),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, (index, job_column) in _WORKER_TABLES.items():
+        # Keep the newest row per (instance, name), the one the last sync wrote,
+        # and move jobs off the duplicates before deleting them
+        op.execute(f"""
+            CREATE TEMPORARY TABLE worker_duplicates AS
+            SELECT id, keep_id FROM (
+                SELECT id, first_value(id) OVER (
+                    PARTITION BY cortex_instance_id, name ORDER BY id DESC
+                ) AS keep_id
+                FROM {table}
+            ) w
+            WHERE id <> keep_id
+        """)
+        op.execute(f"""
+            UPDATE cortex_jobs j SET {job_column} = d.keep_id
+            FROM worker_duplicates d
+            WHERE j.{job_column} = d.id
+        """)
+        op.execute(f"DELETE FROM {table} WHERE id IN (SELECT id FROM worker_duplicates)")
+        op.execute("DROP TABLE worker_duplicates")
+
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+        op.execute(f"CREATE UNIQUE INDEX {index} ON {table} (cortex_instance_id, name)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, (index, _) in _WORKER_TABLES.items():
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+        op.execute(f"CREATE INDEX {index} ON {table} (cortex_instance_id, name)")
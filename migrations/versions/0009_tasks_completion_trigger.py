@@ -0,0 +1,54 @@
+"""Add the tasks_completion trigger stamping completed_at
+
+Revision ID: 0009_tasks_completion_trigger
+Revises: 0008_cortex_worker_name_unique
+Create Date: 2026-10-16 20:52:11
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0009_tasks_completion_trigger'
+down_revision: Union[str, Sequence[str], None] = '0008_cortex_worker_name_unique'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table('tasks'):
+        return
+
+    # Same DDL init_db attaches to the tasks table in app/db/models/task.py
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_task_completed_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.completed_at := CASE
+                WHEN NEW.status = 'COMPLETED' THEN now()
+                WHEN OLD.status = 'COMPLETED' THEN NULL
+                ELSE NEW.completed_at
+            END;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    exists = bind.execute(sa.text(
+        "SELECT 1 FROM pg_trigger WHERE tgname = 'tasks_completion' AND tgrelid = 'tasks'::regclass"
+    )).scalar()
+    if not exists:
+        op.execute("""
+            CREATE TRIGGER tasks_completion
+            BEFORE UPDATE ON tasks
+            FOR EACH ROW WHEN (NEW.status IS DISTINCT FROM OLD.status)
+            EXECUTE FUNCTION set_task_completed_at()
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS tasks_completion ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS set_task_completed_at()")
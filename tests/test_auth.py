@@ -98,6 +98,20 @@ class TestUserLogin:
         assert response.status_code == 401
         assert "Incorrect username or password" in response.json()["detail"]
 
+    async def test_back_to_back_logins(self, client: AsyncClient, authenticated_user):
+        """Test two logins in the same second get distinct refresh tokens"""
+        login_data = {
+            "username": authenticated_user["user_data"]["email"],
+            "password": authenticated_user["user_data"]["password"]
+        }
+
+        first = await client.post("/api/v1/auth/login-json", json=login_data)
+        second = await client.post("/api/v1/auth/login-json", json=login_data)
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert first.json()["refresh_token"] != second.json()["refresh_token"]
+
 
 class TestTokenRefresh:
     """Test token refresh functionality"""
@@ -0,0 +1,51 @@
+"""
+DataLoader batching tests
+"""
+import asyncio
+
+import pytest
+
+from app.db.loaders import DataLoader
+
+
+class EchoLoader(DataLoader):
+    """Returns each key back, recording the batches it was called with"""
+
+    def __init__(self):
+        super().__init__(db=None)
+        self.batches = []
+
+    async def batch_load(self, keys):
+        self.batches.append(list(keys))
+        return keys
+
+
+class ShortLoader(DataLoader):
+    """Drops the last key from every batch"""
+
+    async def batch_load(self, keys):
+        return keys[:-1]
+
+
+class TestDataLoader:
+    """Test batching and failure handling"""
+
+    async def test_keys_in_one_tick_share_a_batch(self):
+        """Test concurrent loads are coalesced and memoized"""
+        loader = EchoLoader()
+        assert await loader.load_many([1, 2, 2, 3]) == [1, 2, 2, 3]
+        assert loader.batches == [[1, 2, 3]]
+
+    async def test_short_batch_fails_missing_keys(self):
+        """Test keys without a value raise instead of hanging"""
+        loader = ShortLoader(db=None)
+        first, second = loader.load("a"), loader.load("b")
+
+        assert await asyncio.wait_for(first, timeout=1) == "a"
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(second, timeout=1)
+
+    def test_batch_load_is_abstract(self):
+        """Test the base class cannot be used without batch_load"""
+        with pytest.raises(TypeError):
+            DataLoader(db=None)
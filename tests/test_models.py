@@ -0,0 +1,14 @@
+"""
+Model registry tests
+"""
+from sqlalchemy.orm import configure_mappers
+
+
+class TestModelRegistry:
+    """Every relationship target is registered by the models package"""
+
+    def test_mappers_configure_from_package(self):
+        """Test mappers configure with only app.db.models imported"""
+        import app.db.models  # noqa: F401
+
+        configure_mappers()
@@ -0,0 +1,175 @@
+"""
+Statement-count tests for the collapsed listing, stats, reorder and bulk-update paths
+"""
+from typing import List
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.crud.observable import (
+    bulk_mark_as_ioc, get_case_observables, get_global_observables, get_ioc_stats_by_case
+)
+from app.db.crud.task import (
+    bulk_update_task_status, get_case_tasks, get_task_stats_by_case, reorder_tasks
+)
+from app.db.models import Case, Observable, Organization, Task, User
+from app.db.models.enums import ObservableType, TaskStatus
+from tests.conftest import test_engine
+
+
+class QueryCounter:
+    """Records every statement the test engine sends to the database"""
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def reset(self) -> None:
+        self.statements.clear()
+
+
+@pytest.fixture
+def queries():
+    """Count statements executed while the test runs"""
+    counter = QueryCounter()
+    event.listen(test_engine.sync_engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(test_engine.sync_engine, "before_cursor_execute", counter)
+
+
+@pytest.fixture
+async def case(db_session: AsyncSession) -> Case:
+    """A case with five tasks and five observables"""
+    organization = Organization(name="Query Count Org")
+    user = User(email="querycount@example.com", hashed_password="x")
+    db_session.add_all([organization, user])
+    await db_session.flush()
+
+    case = Case(title="Query count case", case_number="QC-0001",
+                organization_id=organization.id, created_by_id=user.id)
+    db_session.add(case)
+    await db_session.flush()
+
+    db_session.add_all(
+        Task(title=f"Task {i}", order_index=i, case_id=case.id, created_by_id=user.id)
+        for i in range(5)
+    )
+    db_session.add_all(
+        Observable(data_type=ObservableType.IP, data=f"10.0.0.{i}", case_id=case.id,
+                   organization_id=organization.id, created_by_id=user.id)
+        for i in range(5)
+    )
+    await db_session.commit()
+    return case
+
+
+async def _tasks(db: AsyncSession, case_id: int) -> List[Task]:
+    result = await db.execute(
+        select(Task).filter(Task.case_id == case_id).order_by(Task.title)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalars().all()
+
+
+class TestTaskQueries:
+    """Task reorder, bulk status and stats run as single statements"""
+
+    async def test_reorder_is_one_update_from_values(self, db_session: AsyncSession, case: Case, queries):
+        """Test reordering N tasks issues one UPDATE ... FROM (VALUES ...)"""
+        tasks = await _tasks(db_session, case.id)
+        new_orders = [
+            {"task_uuid": task.uuid, "order_index": len(tasks) - i}
+            for i, task in enumerate(tasks)
+        ]
+
+        queries.reset()
+        assert await reorder_tasks(db_session, case.id, new_orders) is True
+
+        assert queries.count == 1
+        assert queries.statements[0].lstrip().upper().startswith("UPDATE")
+        assert "VALUES" in queries.statements[0].upper()
+
+        reordered = await _tasks(db_session, case.id)
+        assert [task.order_index for task in reordered] == [len(tasks) - i for i in range(len(tasks))]
+
+    async def test_bulk_status_is_one_update_and_trigger_sets_completed_at(
+            self, db_session: AsyncSession, case: Case, queries):
+        """Test bulk status is one UPDATE, with completed_at kept by the tasks_completion trigger"""
+        tasks = await _tasks(db_session, case.id)
+        uuids = [task.uuid for task in tasks]
+
+        queries.reset()
+        assert await bulk_update_task_status(db_session, uuids, TaskStatus.COMPLETED, case.id) == len(tasks)
+        assert queries.count == 1
+        assert all(task.completed_at is not None for task in await _tasks(db_session, case.id))
+
+        assert await bulk_update_task_status(db_session, uuids, TaskStatus.WAITING, case.id) == len(tasks)
+        assert all(task.completed_at is None for task in await _tasks(db_session, case.id))
+
+    async def test_stats_is_one_grouped_query(self, db_session: AsyncSession, case: Case, queries):
+        """Test task stats come from a single GROUP BY"""
+        queries.reset()
+        stats = await get_task_stats_by_case(db_session, case.id)
+
+        assert queries.count == 1
+        assert stats["total"] == 5
+        assert stats["pending"] == 5
+
+    async def test_listing_does_not_grow_with_rows(self, db_session: AsyncSession, case: Case, queries):
+        """Test a task page costs the same statements for one row as for many"""
+        queries.reset()
+        await get_case_tasks(db_session, case.id, limit=1)
+        single = queries.count
+
+        queries.reset()
+        assert len(await get_case_tasks(db_session, case.id, limit=50)) == 5
+        assert queries.count == single
+
+
+class TestObservableQueries:
+    """Observable listings run as one cached lambda statement"""
+
+    async def test_case_listing_is_one_statement(self, db_session: AsyncSession, case: Case, queries):
+        """Test the case listing issues one SELECT and reuses its SQL across values"""
+        queries.reset()
+        rows = await get_case_observables(db_session, case.id, limit=3)
+        assert queries.count == 1
+        assert len(rows) == 3
+
+        await get_case_observables(db_session, case.id, limit=10, skip=1)
+        assert queries.count == 2
+        # Closure values are bound parameters, not baked into the SQL
+        assert queries.statements[0] == queries.statements[1]
+
+    async def test_global_listing_is_one_statement(self, db_session: AsyncSession, case: Case, queries):
+        """Test the organization listing filters without joining cases"""
+        queries.reset()
+        rows = await get_global_observables(db_session, case.organization_id, is_ioc_filter=False)
+
+        assert queries.count == 1
+        assert "JOIN" not in queries.statements[0].upper()
+        assert len(rows) == 5
+
+    async def test_bulk_ioc_and_stats(self, db_session: AsyncSession, case: Case, queries):
+        """Test bulk IOC marking is one UPDATE and stats are one query, then cached"""
+        result = await db_session.execute(select(Observable.uuid).filter(Observable.case_id == case.id))
+        uuids = result.scalars().all()
+
+        queries.reset()
+        assert await bulk_mark_as_ioc(db_session, uuids[:2], case.id) == 2
+        assert queries.count == 1
+
+        queries.reset()
+        stats = await get_ioc_stats_by_case(db_session, case.id)
+        assert queries.count == 1
+        assert stats["ioc"] == 2
+
+        await get_ioc_stats_by_case(db_session, case.id)
+        assert queries.count == 1
@@ -0,0 +1,73 @@
+"""
+Cross-worker blacklist tests: cached answers must never outlive a logout
+"""
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import BloomFilter
+from app.db.crud import token as token_crud
+from app.db.models import BlacklistedToken
+
+
+async def _blacklist_elsewhere(db: AsyncSession, jti: str) -> None:
+    """Insert the row as another worker would, without touching this worker's caches"""
+    db.add(BlacklistedToken(jti=jti, expires_at=datetime.now(timezone.utc) + timedelta(hours=1)))
+    await db.commit()
+
+
+@pytest.fixture(autouse=True)
+def reset_blacklist_state(monkeypatch):
+    """Each test starts with empty caches and no listener"""
+    token_crud._jti_not_blacklisted.clear()
+    monkeypatch.setattr(token_crud, "_listener_connected_at", None)
+    yield
+    token_crud._jti_not_blacklisted.clear()
+
+
+class TestNegativeCache:
+    """Negative lookups are cached only while notifications are received"""
+
+    async def test_no_cache_without_listener(self, db_session: AsyncSession):
+        """Without a listener every check goes to the database"""
+        jti = str(uuid4())
+        assert await token_crud.is_jti_blacklisted(db_session, jti) is False
+
+        await _blacklist_elsewhere(db_session, jti)
+        assert await token_crud.is_jti_blacklisted(db_session, jti) is True
+
+    async def test_notification_evicts_cached_jti(self, db_session: AsyncSession, monkeypatch):
+        """A NOTIFY from another worker evicts the cached answer"""
+        monkeypatch.setattr(token_crud, "_listener_connected_at", time.monotonic())
+        jti = str(uuid4())
+        assert await token_crud.is_jti_blacklisted(db_session, jti) is False
+        assert token_crud._jti_not_blacklisted.get(jti)
+
+        await _blacklist_elsewhere(db_session, jti)
+        token_crud._on_jti_blacklisted(jti)
+        assert await token_crud.is_jti_blacklisted(db_session, jti) is True
+
+
+class TestBlacklistFilter:
+    """A bloom filter miss is trusted only if the filter cannot be stale"""
+
+    async def test_filter_miss_ignored_without_listener(self, db_session: AsyncSession, monkeypatch):
+        """A filter built before another worker's logout does not hide it"""
+        monkeypatch.setattr(token_crud, "_blacklist_filter", BloomFilter(capacity=1000))
+        monkeypatch.setattr(token_crud, "_blacklist_filter_built_at", time.monotonic())
+        jti = str(uuid4())
+
+        await _blacklist_elsewhere(db_session, jti)
+        assert jti not in token_crud._blacklist_filter
+        assert await token_crud.is_jti_blacklisted(db_session, jti) is True
+
+    async def test_notification_adds_to_filter(self, monkeypatch):
+        """Listening workers add notified jtis to their filter"""
+        monkeypatch.setattr(token_crud, "_blacklist_filter", BloomFilter(capacity=1000))
+        jti = str(uuid4())
+
+        token_crud._on_jti_blacklisted(jti)
+        assert jti in token_crud._blacklist_filter